@@ -0,0 +1,184 @@
+"""
+Requests per second of the read endpoints under the sync WSGI deployment
+(gunicorn) versus the async ASGI deployment (uvicorn).
+
+Both servers run against the same seeded SQLite file, so the numbers only
+reflect the serving model. Usage::
+
+    python -m benchmarks.asgi_vs_wsgi --requests 2000 --concurrency 64
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def bench_env(db_path: Path, async_views: bool) -> dict:
+    env = dict(os.environ)
+    env.setdefault("SECRET_KEY", "benchmark-secret-key")
+    env["DEBUG"] = "False"
+    env["DATABASE_URL"] = f"sqlite:///{db_path}"
+    env["DJANGO_SETTINGS_MODULE"] = "engine.settings"
+    env["ASYNC_VIEWS"] = str(async_views)
+    return env
+
+
+def seed(db_path: Path, trips: int, bookings: int) -> dict:
+    """Migrate and seed the benchmark database; return URLs and a token."""
+    os.environ.update(bench_env(db_path, async_views=False))
+    import django
+
+    django.setup()
+
+    from django.core.management import call_command
+
+    from .seed import seed_read_data
+
+    call_command("migrate", "--noinput", verbosity=0)
+    return seed_read_data(trips=trips, bookings=bookings)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(kind: str, port: int, workers: int, threads: int, db_path: Path):
+    if kind == "wsgi":
+        cmd = [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "engine.wsgi:application",
+            "--workers",
+            str(workers),
+            "--threads",
+            str(threads),
+            "--bind",
+            f"127.0.0.1:{port}",
+        ]
+        env = bench_env(db_path, async_views=False)
+    else:
+        cmd = [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "engine.asgi:application",
+            "--workers",
+            str(workers),
+            "--port",
+            str(port),
+            "--no-access-log",
+        ]
+        env = bench_env(db_path, async_views=True)
+
+    proc = subprocess.Popen(
+        cmd,
+        cwd=BASE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    wait_until_ready(port)
+    return proc
+
+
+def wait_until_ready(port: int, timeout: float = 30.0):
+    import requests
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            requests.get(f"http://127.0.0.1:{port}/", timeout=1)
+            return
+        except requests.RequestException:
+            time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def run_load(port: int, fixture: dict, total: int, concurrency: int) -> dict:
+    import threading
+
+    import requests
+
+    local = threading.local()
+    headers = {"Authorization": f"Bearer {fixture['token']}"}
+    urls = [f"http://127.0.0.1:{port}{url}" for url in fixture["urls"]]
+
+    def one(i: int):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        started = time.perf_counter()
+        resp = session.get(urls[i % len(urls)], headers=headers)
+        return time.perf_counter() - started, resp.status_code
+
+    # Warm up connections and caches before timing.
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(one, range(concurrency)))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(one, range(total)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(r[0] for r in results)
+    errors = sum(1 for r in results if r[1] != 200)
+    return {
+        "requests": total,
+        "errors": errors,
+        "rps": round(total / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=4, help="gunicorn threads")
+    parser.add_argument("--trips", type=int, default=500)
+    parser.add_argument("--bookings", type=int, default=50)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.sqlite3"
+        fixture = seed(db_path, trips=args.trips, bookings=args.bookings)
+
+        results = {}
+        for kind in ("wsgi", "asgi"):
+            port = free_port()
+            proc = start_server(kind, port, args.workers, args.threads, db_path)
+            try:
+                results[kind] = run_load(port, fixture, args.requests, args.concurrency)
+            finally:
+                proc.terminate()
+                proc.wait()
+
+    print(f"{'deployment':<12}{'rps':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for kind, res in results.items():
+        print(
+            f"{kind:<12}{res['rps']:>10}{res['p50_ms']:>10}"
+            f"{res['p99_ms']:>10}{res['errors']:>8}"
+        )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
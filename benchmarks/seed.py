@@ -0,0 +1,204 @@
+"""
+Seed data shared by the benchmarks.
+
+Call only after ``django.setup()``; the database must already be migrated.
+"""
+
+import datetime
+from decimal import Decimal
+
+STATES = ["Lagos", "Oyo", "Ogun", "Kano", "Enugu"]
+
+
+def quoted(booking):
+    """bulk_create() skips Booking.save(), which freezes the quote."""
+    booking.apply_quote()
+    return booking
+
+
+def hold_seats(taken: dict, trip, count: int):
+    """The seat map of the next ``count`` free seats of ``trip``, or None
+    when it is full. ``taken`` collects the seats held per trip; pass it to
+    ``record_seat_maps`` once the bookings are built."""
+    from modules.trips.services.seat_service import to_map
+
+    capacity = trip.vehicle.capacity
+    bits = taken.get(trip, 0)
+    if bits.bit_length() + count > capacity:
+        return None
+    held = ((1 << count) - 1) << bits.bit_length()
+    taken[trip] = bits | held
+    return to_map(held, capacity)
+
+
+def record_seat_maps(taken: dict):
+    """Trips are written before their bookings; record the seats held."""
+    from modules.trips.models import Trip
+    from modules.trips.services.seat_service import to_map
+
+    for trip, bits in taken.items():
+        trip.seat_map = to_map(bits, trip.vehicle.capacity)
+    Trip.objects.bulk_update(list(taken), ["seat_map"], batch_size=1000)
+
+
+def seed_read_data(trips: int, bookings: int) -> dict:
+    """Create one vendor with ``trips`` trips and one corper with ``bookings``
+    bookings; return an access token for the corper and the read URLs."""
+    from django.contrib.auth import get_user_model
+    from ninja_jwt.tokens import RefreshToken
+
+    from modules.bookings.models import Booking
+    from modules.corper.models import CorperProfile
+    from modules.trips.models import Trip, Vehicle, VehicleType
+
+    User = get_user_model()
+
+    vendor = User.objects.create_user(
+        email="bench-vendor@example.com",
+        password="Password1!",
+        role="vendor",
+        is_active=True,
+    )
+    corper = User.objects.create_user(
+        email="bench-corper@example.com",
+        password="Password1!",
+        role="corper",
+        is_active=True,
+    )
+    CorperProfile.objects.create(
+        user=corper,
+        phone="08000000000",
+        state_code="LA/24A/0001",
+        call_up_number="NYSC/BENCH/0001",
+        deployment_state="Lagos",
+        camp_location="Iyana-Ipaja",
+        deployment_date=datetime.date.today(),
+    )
+    vehicle = Vehicle.objects.create(
+        vendor=vendor,
+        registration_number="BEN-001",
+        vehicle_type=VehicleType.objects.create(name="Bus"),
+        make_model="Toyota Hiace",
+        capacity=bookings + 10,
+    )
+    today = datetime.date.today()
+    created = Trip.objects.bulk_create(
+        Trip(
+            vendor=vendor,
+            vehicle=vehicle,
+            departure_state=STATES[i % len(STATES)],
+            departure_city=f"City {i % 17}",
+            destination_camp=f"Camp {i % 7}",
+            departure_date=today + datetime.timedelta(days=i % 30),
+            departure_time=datetime.time(6 + i % 12, 0),
+            price_per_seat=Decimal("5000.00"),
+            available_seats=10,
+        )
+        for i in range(trips)
+    )
+    taken = {}
+    rows = []
+    for i in range(bookings):
+        trip = created[i % len(created)]
+        seat_map = hold_seats(taken, trip, 1)
+        rows.append(quoted(Booking(user=corper, trip=trip, seat_map=seat_map)))
+    Booking.objects.bulk_create(rows)
+    record_seat_maps(taken)
+
+    return {
+        "token": str(RefreshToken.for_user(corper).access_token),
+        "urls": [
+            "/api/vendor/trips/search?departure_state=Lagos",
+            "/api/bookings/",
+            "/api/corper/profile",
+        ],
+    }
+
+
+def seed_volume(vendors: int, trips: int, corpers: int, bookings: int) -> dict:
+    """Seed a realistic spread of vendors, vehicles, trips, corpers and bookings.
+
+    Users share one password hash so seeding doesn't spend minutes hashing.
+    Returns the password and the ids the benchmarks pick from.
+    """
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+
+    from modules.bookings.models import Booking
+    from modules.trips.models import Trip, Vehicle, VehicleType
+
+    User = get_user_model()
+    password = "Password1!"
+    hashed = make_password(password)
+
+    vendor_users = User.objects.bulk_create(
+        User(
+            email=f"vendor{i}@bench.example.com",
+            password=hashed,
+            role="vendor",
+            is_active=True,
+        )
+        for i in range(vendors)
+    )
+    corper_users = User.objects.bulk_create(
+        User(
+            email=f"corper{i}@bench.example.com",
+            password=hashed,
+            role="corper",
+            is_active=True,
+        )
+        for i in range(corpers)
+    )
+    bus = VehicleType.objects.create(name="Bus")
+    vehicles = Vehicle.objects.bulk_create(
+        Vehicle(
+            vendor=vendor,
+            registration_number=f"BEN-{i:05d}",
+            vehicle_type=bus,
+            make_model="Toyota Hiace",
+            capacity=60,
+        )
+        for i, vendor in enumerate(vendor_users)
+    )
+    today = datetime.date.today()
+    trip_rows = Trip.objects.bulk_create(
+        Trip(
+            vendor=vehicles[i % len(vehicles)].vendor,
+            vehicle=vehicles[i % len(vehicles)],
+            departure_state=STATES[i % len(STATES)],
+            departure_city=f"City {i % 17}",
+            destination_camp=f"Camp {i % 7}",
+            departure_date=today + datetime.timedelta(days=i % 60),
+            departure_time=datetime.time(6 + i % 12, 0),
+            price_per_seat=Decimal("5000.00") + i % 5 * 500,
+            available_seats=60,
+            group_discount_percentage=5 if i % 3 == 0 else 0,
+        )
+        for i in range(trips)
+    )
+    taken = {}
+    rows = []
+    # Trips that fill up get no more bookings, as in seed_load.
+    for i in range(bookings):
+        trip = trip_rows[(i * 7) % len(trip_rows)]
+        seats = 1 + i % 3
+        seat_map = hold_seats(taken, trip, seats)
+        if seat_map is None:
+            continue
+        booking = Booking(
+            user=corper_users[i % len(corper_users)],
+            trip=trip,
+            selected_seats=seats,
+            seat_map=seat_map,
+        )
+        rows.append(quoted(booking))
+    Booking.objects.bulk_create(rows, batch_size=1000)
+    record_seat_maps(taken)
+
+    return {
+        "password": password,
+        "vendor_ids": [str(u.pk) for u in vendor_users],
+        "corper_emails": [u.email for u in corper_users],
+        "corper_ids": [str(u.pk) for u in corper_users],
+        "trip_ids": [str(t.pk) for t in trip_rows],
+    }
@@ -0,0 +1,119 @@
+"""
+Serialization time and bytes on the wire for a trip search response.
+
+Seeds a temporary SQLite database, renders the unfiltered search result with
+the stdlib and orjson renderers, then fetches it through the full middleware
+stack with each ``Accept-Encoding``. Usage::
+
+    python -m benchmarks.serialization --trips 1000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+SEARCH_URL = "/api/vendor/trips/search"
+ENCODINGS = {"identity": "identity", "gzip": "gzip", "br": "br, gzip"}
+
+
+def setup(db_path: Path, trips: int):
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ["DEBUG"] = "False"
+    os.environ["ALLOWED_HOSTS"] = "testserver"
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["DJANGO_SETTINGS_MODULE"] = "engine.settings"
+    import django
+
+    django.setup()
+
+    from django.core.management import call_command
+
+    from .seed import seed_read_data
+
+    call_command("migrate", "--noinput", verbosity=0)
+    seed_read_data(trips=trips, bookings=1)
+
+
+def search_payload():
+    """The search result as Ninja hands it to the renderer."""
+    from pydantic import TypeAdapter
+
+    from modules.trips.schemas import TripOut
+    from modules.trips.services.trip_services import TripService
+
+    adapter = TypeAdapter(list[TripOut])
+    trips = adapter.validate_python(list(TripService().search_trips()))
+    return adapter.dump_python(trips, by_alias=True)
+
+
+def time_render(renderer, data, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = renderer.render(None, data, response_status=200)
+        timings.append(time.perf_counter() - started)
+    if isinstance(body, str):
+        body = body.encode()
+    return {
+        "mean_ms": round(statistics.fmean(timings) * 1000, 3),
+        "p50_ms": round(statistics.median(timings) * 1000, 3),
+        "bytes": len(body),
+    }
+
+
+def wire_sizes() -> dict:
+    from django.test import Client
+
+    client = Client()
+    sizes = {}
+    for name, header in ENCODINGS.items():
+        resp = client.get(SEARCH_URL, HTTP_ACCEPT_ENCODING=header)
+        sizes[name] = {
+            "content_encoding": resp.get("Content-Encoding", "identity"),
+            "bytes": len(resp.content),
+        }
+    return sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trips", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup(Path(tmp) / "bench.sqlite3", args.trips)
+
+        from ninja.renderers import JSONRenderer
+
+        from engine.renderers import ORJSONRenderer
+
+        data = search_payload()
+        results = {
+            "trips": len(data),
+            "render": {
+                "json": time_render(JSONRenderer(), data, args.repeat),
+                "orjson": time_render(ORJSONRenderer(), data, args.repeat),
+            },
+            "wire": wire_sizes(),
+        }
+
+    print(f"{len(data)} trips")
+    print(f"{'renderer':<10}{'mean ms':>10}{'p50 ms':>10}{'bytes':>10}")
+    for name, res in results["render"].items():
+        print(f"{name:<10}{res['mean_ms']:>10}{res['p50_ms']:>10}{res['bytes']:>10}")
+    print(f"{'encoding':<10}{'bytes':>10}")
+    for name, res in results["wire"].items():
+        print(f"{res['content_encoding']:<10}{res['bytes']:>10}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
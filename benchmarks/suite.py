@@ -0,0 +1,289 @@
+"""
+Throughput and latency percentiles of the hot service paths.
+
+Seeds a realistic data volume, then times each case in-process:
+
+- ``search_trips``: ``TripService.search_trips`` with rotating filters,
+  materialized and validated against ``TripOut`` as the view would
+- ``create_booking``: ``create_booking_service`` on random trips
+- ``login``: ``login_service`` (dominated by password hashing)
+- ``my_bookings``: ``get_my_bookings_service`` validated against ``BookingOut``
+- ``booking_balance``: the ``update_booking_balance`` payment signal
+- ``quote_batch``: ``quote_trips`` pricing 100 lines over random trips
+- ``cold_start``: a new interpreter that loads the WSGI application and
+  serves one search request, i.e. a worker's boot plus its first request
+
+Runs against a temporary SQLite file unless ``--database-url`` is given; a
+given database is flushed and reseeded, so use a throwaway one. Results are
+written as JSON (by default ``benchmarks/results/<commit>-<vendor>.json``)
+and ``--compare`` prints the change against an earlier run. Usage::
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --compare benchmarks/results/abc1234-sqlite.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# Login hashes a password on every call and cold_start starts a process, so
+# they get fewer iterations.
+DEFAULT_ITERATIONS = {
+    "search_trips": 300,
+    "create_booking": 300,
+    "login": 20,
+    "my_bookings": 300,
+    "booking_balance": 300,
+    "quote_batch": 300,
+    "cold_start": 10,
+}
+SEARCH_FILTERS = [
+    {},
+    {"departure_state": "Lagos"},
+    {"departure_state": "Oyo", "destination_camp": "Camp 3"},
+    {"departure_city": "City 4"},
+]
+COLD_START_SCRIPT = """\
+import io
+from engine.wsgi import application
+status = []
+application(
+    {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/api/vendor/trips/search",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "HTTP_HOST": "localhost",
+        "wsgi.url_scheme": "http",
+        "wsgi.input": io.BytesIO(),
+    },
+    lambda s, headers: status.append(s),
+)
+assert status[0].startswith("200"), status
+"""
+
+
+def setup(database_url: str, volume: dict) -> dict:
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ["DEBUG"] = "False"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["DJANGO_SETTINGS_MODULE"] = "engine.settings"
+    import django
+
+    django.setup()
+
+    from django.core.management import call_command
+
+    from .seed import seed_volume
+
+    call_command("migrate", "--noinput", verbosity=0)
+    call_command("flush", "--noinput", verbosity=0)
+    return seed_volume(**volume)
+
+
+def build_cases(fixture: dict, rng: random.Random) -> dict:
+    from decimal import Decimal
+
+    from django.contrib.auth import get_user_model
+    from pydantic import TypeAdapter
+
+    from modules.authenticator.services.auth_service import login_service
+    from modules.bookings.models import Booking
+    from modules.bookings.schemas import BookingIn, BookingOut
+    from modules.bookings.services.booking_service import (
+        create_booking_service,
+        get_my_bookings_service,
+    )
+    from modules.bookings.services.pricing_service import quote_trips
+    from modules.bookings.signals import update_booking_balance
+    from modules.payments.models import Payment
+    from modules.trips.schemas import TripOut
+    from modules.trips.services.trip_services import TripService
+
+    User = get_user_model()
+    corpers = list(User.objects.filter(pk__in=fixture["corper_ids"]))
+    trip_ids = fixture["trip_ids"]
+    trip_uuids = [uuid.UUID(trip_id) for trip_id in trip_ids]
+    bookings = list(Booking.objects.select_related("trip")[:500])
+    trips_out = TypeAdapter(list[TripOut])
+    bookings_out = TypeAdapter(list[BookingOut])
+    service = TripService()
+
+    def search_trips(i):
+        qs = service.search_trips(**SEARCH_FILTERS[i % len(SEARCH_FILTERS)])
+        trips_out.validate_python(list(qs[:50]))
+
+    def create_booking(i):
+        payload = BookingIn(trip_id=rng.choice(trip_ids), selected_seats=1)
+        create_booking_service(rng.choice(corpers), payload)
+
+    def login(i):
+        email = rng.choice(fixture["corper_emails"])
+        login_service(SimpleNamespace(email=email, password=fixture["password"]))
+
+    def my_bookings(i):
+        bookings_out.validate_python(list(get_my_bookings_service(corpers[i % 50])))
+
+    def booking_balance(i):
+        booking = bookings[i % len(bookings)]
+        payment = Payment(user_id=booking.user_id, booking=booking, amount=Decimal(1))
+        update_booking_balance(Payment, payment, created=True)
+
+    def quote_batch(i):
+        lines = [(rng.choice(trip_uuids), rng.randint(1, 4)) for _ in range(100)]
+        quote_trips(lines)
+
+    def cold_start(i):
+        # The environment set up by setup() is inherited.
+        subprocess.run(
+            [sys.executable, "-c", COLD_START_SCRIPT], cwd=BASE_DIR, check=True
+        )
+
+    return {
+        "search_trips": search_trips,
+        "create_booking": create_booking,
+        "login": login,
+        "my_bookings": my_bookings,
+        "booking_balance": booking_balance,
+        "quote_batch": quote_batch,
+        "cold_start": cold_start,
+    }
+
+
+def percentile(sorted_values, pct: float) -> float:
+    index = max(0, min(len(sorted_values) - 1, round(pct * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run_case(func, iterations: int, warmup: int = 5) -> dict:
+    for i in range(warmup):
+        func(i)
+    timings = []
+    started = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        func(i)
+        timings.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+    timings.sort()
+    return {
+        "iterations": iterations,
+        "ops_per_sec": round(iterations / elapsed, 1),
+        "mean_ms": round(statistics.fmean(timings) * 1000, 3),
+        "p50_ms": round(percentile(timings, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(timings, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(timings, 0.99) * 1000, 3),
+    }
+
+
+def git_commit() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: dict, baseline: dict):
+    print(f"\nvs {baseline['commit']} ({baseline['database']})")
+    print(f"{'case':<18}{'ops/s':>10}{'change':>10}{'p95 ms':>10}{'change':>10}")
+    for name, res in current["cases"].items():
+        old = baseline["cases"].get(name)
+        if not old:
+            continue
+        ops = (res["ops_per_sec"] / old["ops_per_sec"] - 1) * 100
+        p95 = (res["p95_ms"] / old["p95_ms"] - 1) * 100 if old["p95_ms"] else 0
+        print(
+            f"{name:<18}{res['ops_per_sec']:>10}{ops:>+9.1f}%"
+            f"{res['p95_ms']:>10}{p95:>+9.1f}%"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", help="default: a temporary SQLite file")
+    parser.add_argument("--vendors", type=int, default=50)
+    parser.add_argument("--trips", type=int, default=5000)
+    parser.add_argument("--corpers", type=int, default=1000)
+    parser.add_argument("--bookings", type=int, default=10000)
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=DEFAULT_ITERATIONS,
+        default=list(DEFAULT_ITERATIONS),
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiply every case's iterations"
+    )
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", help="JSON results file")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    volume = {
+        "vendors": args.vendors,
+        "trips": args.trips,
+        "corpers": args.corpers,
+        "bookings": args.bookings,
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.sqlite3'}"
+        fixture = setup(database_url, volume)
+
+        from django.db import connection
+
+        rng = random.Random(args.seed)
+        cases = build_cases(fixture, rng)
+        results = {
+            "commit": git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "volume": volume,
+            "cases": {},
+        }
+        for name in args.cases:
+            iterations = max(1, int(DEFAULT_ITERATIONS[name] * args.scale))
+            results["cases"][name] = run_case(cases[name], iterations)
+        connection.close()
+
+    print(f"{'case':<18}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, res in results["cases"].items():
+        print(
+            f"{name:<18}{res['ops_per_sec']:>10}{res['p50_ms']:>10}"
+            f"{res['p95_ms']:>10}{res['p99_ms']:>10}"
+        )
+
+    output = Path(
+        args.output or RESULTS_DIR / f"{results['commit']}-{results['database']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\nresults written to {output}")
+
+    if args.compare:
+        compare(results, json.loads(Path(args.compare).read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,13 @@ def apply_migrations(django_db_blocker):
         call_command("flush", "--noinput", allow_cascade=True)
 
 
+@pytest.fixture(autouse=True)
+def enforce_query_budgets(settings):
+    """Requests made through the test client fail when they exceed their
+    query budget or repeat a query shape (see engine/query_budget.py)."""
+    settings.QUERY_INSPECTION = "raise"
+
+
 @pytest.fixture(scope="session")
 def USER() -> Any:
     """Return the project user model cast to Any to avoid static type complaints.
@@ -1,13 +1,11 @@
-from ninja import NinjaAPI
+from .lazy_routers import LazyRouterAPI
+from .renderers import get_renderer
 
-from modules.authenticator.views import router as auth_router
-from modules.bookings.views import router as booking_router
-from modules.corper.views import router as corper_router
-from modules.vendor.views import router as vendor_router
+api = LazyRouterAPI(renderer=get_renderer())
 
-api = NinjaAPI()
-
-api.add_router("/auth/", auth_router)
-api.add_router("/corper/", corper_router)
-api.add_router("/vendor/", vendor_router)
-api.add_router("/bookings/", booking_router)
+# Imported on the first request under each prefix, see engine/lazy_routers.py.
+api.add_lazy_router("/auth/", "modules.authenticator.views.router")
+api.add_lazy_router("/corper/", "modules.corper.views.router")
+api.add_lazy_router("/vendor/", "modules.vendor.views.router")
+api.add_lazy_router("/bookings/", "modules.bookings.views.router")
+api.add_lazy_router("/reviews/", "modules.reviews.views.router")
@@ -1,7 +1,8 @@
 """
 ASGI config for engine project.
 
-It exposes the ASGI callable as a module-level variable named ``application``.
+It exposes the ASGI callable as a module-level variable named ``application``:
+the Django application, behind the live seat streams of engine/seat_events.py.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
@@ -12,5 +13,14 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "engine.settings")
+# Under ASGI the read endpoints are served by their async ORM variants.
+os.environ.setdefault("ASYNC_VIEWS", "True")
+# Each request may run in a different thread, and persistent connections are
+# per thread, so they would pile up instead of being reused.
+os.environ.setdefault("DB_CONN_MAX_AGE", "0")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from engine.seat_events import SeatEvents  # noqa: E402  (needs the app registry)
+
+application = SeatEvents(django_application)
@@ -0,0 +1,28 @@
+"""
+Deployment-aware selection between the sync and async variant of a view.
+
+Under ASGI (``ASYNC_VIEWS=True``, set by ``engine/asgi.py``) the read-heavy
+endpoints run on Django's async ORM so a slow query doesn't pin a worker
+thread. Under WSGI the sync view is kept, since every async view would
+otherwise need its own event loop per request.
+"""
+
+from django.conf import settings
+
+
+def async_variant(async_view):
+    """Register ``async_view`` in place of the decorated view when enabled.
+
+    Apply it directly below the router decorator so the operation keeps the
+    sync view's name (and therefore its OpenAPI operation id) either way.
+    """
+
+    def decorator(view):
+        if not settings.ASYNC_VIEWS:
+            return view
+        async_view.__name__ = view.__name__
+        async_view.__qualname__ = view.__qualname__
+        async_view.__doc__ = view.__doc__
+        return async_view
+
+    return decorator
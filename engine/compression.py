@@ -0,0 +1,96 @@
+"""
+Negotiated response compression.
+
+``CompressionMiddleware`` extends Django's ``GZipMiddleware`` with Brotli.
+Responses shorter than ``COMPRESSION_MIN_SIZE`` bytes are sent as is; larger
+ones are compressed with Brotli when the client prefers it (and the
+``brotli`` package is installed) and with gzip otherwise. Only JSON is
+Brotli-compressed: HTML pages such as the admin's carry CSRF tokens, and
+are left to ``GZipMiddleware``, whose random filename padding mitigates
+BREACH. Streaming responses are only gzipped, and event streams are never
+compressed because the compressor would hold events back.
+"""
+
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+def parse_accept_encoding(header: str) -> dict:
+    """Map each coding in an ``Accept-Encoding`` header to its q-value."""
+    codings = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        codings[coding] = q
+    return codings
+
+
+def is_json(response) -> bool:
+    content_type = response.get("Content-Type", "").partition(";")[0].strip()
+    return content_type == "application/json" or content_type.endswith("+json")
+
+
+def choose_encoding(header: str, gzip_only: bool = False):
+    """Return ``"br"``, ``"gzip"`` or None for an ``Accept-Encoding`` header."""
+    codings = parse_accept_encoding(header)
+    wildcard = codings.get("*", 0.0)
+    available = ["gzip"] if gzip_only or brotli is None else ["br", "gzip"]
+    best, best_q = None, 0.0
+    for coding in available:
+        q = codings.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware(GZipMiddleware):
+    def process_response(self, request, response):
+        if response.has_header("Content-Encoding"):
+            return response
+        if response.get("Content-Type", "").startswith("text/event-stream"):
+            return response
+        if (
+            not response.streaming
+            and len(response.content) < settings.COMPRESSION_MIN_SIZE
+        ):
+            return response
+
+        encoding = choose_encoding(
+            request.META.get("HTTP_ACCEPT_ENCODING", ""),
+            gzip_only=response.streaming or not is_json(response),
+        )
+        if encoding == "gzip":
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if encoding != "br":
+            return response
+
+        compressed = brotli.compress(
+            response.content, quality=settings.COMPRESSION_BROTLI_QUALITY
+        )
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+        return response
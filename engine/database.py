@@ -0,0 +1,75 @@
+"""
+Environment-driven database connection settings.
+
+``build_database`` turns a ``DATABASE_URL`` into a ``DATABASES`` entry with
+connection management applied:
+
+- ``DB_CONN_MAX_AGE`` / ``DB_CONN_HEALTH_CHECKS`` keep connections open across
+  requests and check them before reuse. ``engine/asgi.py`` defaults it to 0:
+  under ASGI requests move between threads, and each thread would keep its
+  own connection. Use ``DB_POOL`` there instead.
+- ``DB_POOL`` switches Postgres to psycopg3's native connection pool, sized by
+  ``DB_POOL_MIN_SIZE``, ``DB_POOL_MAX_SIZE`` and ``DB_POOL_TIMEOUT``. Django
+  doesn't allow persistent connections together with a pool, so
+  ``CONN_MAX_AGE`` is forced to 0 when it is on.
+- ``DB_PREPARED_STATEMENTS`` enables server-side parameter binding so psycopg
+  prepares a query on the server once it has run ``DB_PREPARE_THRESHOLD``
+  times on a connection. The search and booking queries repeat with the same
+  shape, so they are prepared after the first few requests. Keep this off
+  behind PgBouncer in transaction pooling mode.
+"""
+
+import dj_database_url
+from decouple import config
+
+POSTGRES_ENGINE = "django.db.backends.postgresql"
+
+
+def build_database(url: str) -> dict:
+    database = dj_database_url.parse(
+        url,
+        conn_max_age=config("DB_CONN_MAX_AGE", default=60, cast=int),
+        conn_health_checks=config("DB_CONN_HEALTH_CHECKS", default=True, cast=bool),
+    )
+
+    if database["ENGINE"] != POSTGRES_ENGINE:
+        return database
+
+    options = database.setdefault("OPTIONS", {})
+
+    if config("DB_POOL", default=False, cast=bool):
+        database["CONN_MAX_AGE"] = 0
+        options["pool"] = {
+            "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+            "max_size": config("DB_POOL_MAX_SIZE", default=10, cast=int),
+            "timeout": config("DB_POOL_TIMEOUT", default=10, cast=float),
+        }
+
+    if config("DB_PREPARED_STATEMENTS", default=False, cast=bool):
+        options["server_side_binding"] = True
+        options["prepare_threshold"] = config(
+            "DB_PREPARE_THRESHOLD", default=5, cast=int
+        )
+
+    return database
+
+
+def pool_stats() -> dict:
+    """Return psycopg pool statistics per database alias.
+
+    Aliases without a pool report ``{"pooled": False}``. The numbers are per
+    worker process.
+    """
+    from django.db import connections
+
+    stats = {}
+    for alias in connections:
+        wrapper = connections[alias]
+        pool = (
+            getattr(wrapper, "pool", None) if wrapper.vendor == "postgresql" else None
+        )
+        if pool is None:
+            stats[alias] = {"pooled": False}
+            continue
+        stats[alias] = {"pooled": True, **pool.get_stats()}
+    return stats
@@ -0,0 +1,162 @@
+"""
+Primary/replica database routing.
+
+Reads go to the ``replica`` alias only inside views marked with
+``@replica_reads`` (search, listings, manifests, exports); everything else,
+including every write, uses ``default``. Two rules keep read-your-writes
+flows on the primary:
+
+- once a request has written, the rest of that request reads from primary;
+- ``PrimaryPinMiddleware`` then pins the writing user to primary for
+  ``REPLICA_PIN_SECONDS``, so e.g. the booking list fetched right after
+  ``create_booking`` doesn't miss the new row because of replica lag.
+
+The pin is stored in the Django cache, so multi-worker deployments need a
+shared cache backend. Without a ``DATABASE_REPLICA_URL`` the router is a
+no-op.
+"""
+
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+
+REPLICA_ALIAS = "replica"
+PRIMARY_PIN_KEY = "db:primary-pin:{user_id}"
+
+
+class RoutingState:
+    __slots__ = ("use_replica", "wrote")
+
+    def __init__(self):
+        self.use_replica = False
+        self.wrote = False
+
+
+_state: ContextVar = ContextVar("db_routing_state", default=None)
+
+
+def replica_alias():
+    return REPLICA_ALIAS if REPLICA_ALIAS in settings.DATABASES else None
+
+
+def primary_pin_key(user_id) -> str:
+    return PRIMARY_PIN_KEY.format(user_id=user_id)
+
+
+def pin_user_to_primary(user_id):
+    cache.set(primary_pin_key(user_id), True, settings.REPLICA_PIN_SECONDS)
+
+
+def is_pinned_to_primary(user) -> bool:
+    if user is None or not getattr(user, "is_authenticated", False):
+        return False
+    return bool(cache.get(primary_pin_key(user.pk)))
+
+
+def _enter_replica_scope(request):
+    """Allow replica reads for the rest of the request.
+
+    The scope deliberately outlives the view: Ninja evaluates a returned
+    queryset while serializing the response. ``PrimaryPinMiddleware`` drops
+    the state when the request ends; outside a request a temporary state is
+    created and the returned token is used to discard it.
+    """
+    state = _state.get()
+    token = None
+    if state is None:
+        state = RoutingState()
+        token = _state.set(state)
+    if replica_alias() and not is_pinned_to_primary(getattr(request, "user", None)):
+        state.use_replica = True
+    return token
+
+
+def _exit_replica_scope(token):
+    if token is not None:
+        _state.reset(token)
+
+
+def replica_reads(view):
+    """Serve the decorated view's reads from the replica when it is safe."""
+    if iscoroutinefunction(view):
+
+        @wraps(view)
+        async def async_wrapper(request, *args, **kwargs):
+            token = _enter_replica_scope(request)
+            try:
+                return await view(request, *args, **kwargs)
+            finally:
+                _exit_replica_scope(token)
+
+        return async_wrapper
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        token = _enter_replica_scope(request)
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            _exit_replica_scope(token)
+
+    return wrapper
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.use_replica or state.wrote:
+            return None
+        return replica_alias()
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data.
+        return True
+
+
+class PrimaryPinMiddleware:
+    """Give each request fresh routing state and pin users who wrote."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        state = RoutingState()
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        self._pin_writer(request, state)
+        return response
+
+    async def __acall__(self, request):
+        state = RoutingState()
+        token = _state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _state.reset(token)
+        self._pin_writer(request, state)
+        return response
+
+    def _pin_writer(self, request, state):
+        user = getattr(request, "user", None)
+        if state.wrote and replica_alias() and getattr(user, "is_authenticated", False):
+            pin_user_to_primary(user.pk)
@@ -0,0 +1,141 @@
+"""
+Conditional GET for read endpoints.
+
+``conditional_get`` computes cheap validators for a view before it runs and
+answers ``If-None-Match`` / ``If-Modified-Since`` with a 304 without loading
+or serializing the payload. Otherwise the view runs as usual and the
+validators and ``Cache-Control`` are added to its response.
+
+Validators come from ``queryset_validators``: ``Max("updated_at")`` plus the
+row count of the queryset the view serves. A row entering the set has a fresh
+``updated_at`` and a row leaving it changes the count, so the ETag changes
+whenever the payload does. ``Last-Modified`` is only sent for single objects;
+a deletion doesn't move a collection's newest ``updated_at``, so collections
+are revalidated through the ETag only. Payloads that also depend on related
+rows pass their timestamps too, e.g. ``latest=("updated_at",
+"vendor__vendor_profile__updated_at")``.
+"""
+
+import inspect
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+class Validators:
+    __slots__ = ("etag", "last_modified")
+
+    def __init__(self, etag, last_modified=None):
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+def queryset_validators(qs, *, single=False, latest=("updated_at",)):
+    """Validators for the rows of ``qs``, or None when it is empty and single.
+
+    ``latest`` names the timestamps whose newest value dates the payload.
+    """
+    stats = qs.order_by().aggregate(
+        *[Max(field) for field in latest], total=Count("pk")
+    )
+    total = stats.pop("total")
+    latest = max(filter(None, stats.values()), default=None)
+    if single and not total:
+        # Let the view raise its own 404.
+        return None
+    stamp = int(latest.timestamp() * 1_000_000) if latest else 0
+    etag = quote_etag(f"{total:x}-{stamp:x}")
+    return Validators(
+        etag="W/" + etag,
+        last_modified=int(latest.timestamp()) if single and latest else None,
+    )
+
+
+def _apply_headers(response, validators, cache_control):
+    if validators.etag:
+        response.headers["ETag"] = validators.etag
+    if validators.last_modified is not None:
+        response.headers["Last-Modified"] = http_date(validators.last_modified)
+    if cache_control:
+        patch_cache_control(response, **cache_control)
+    return response
+
+
+def _not_modified(request, validators, cache_control):
+    if validators is None or not hasattr(request, "META"):
+        return None
+    response = get_conditional_response(
+        request, etag=validators.etag, last_modified=validators.last_modified
+    )
+    if response is None:
+        return None
+    return _apply_headers(response, validators, cache_control)
+
+
+def conditional_get(validators, cache_control=None):
+    """Serve 304s for unchanged payloads and add cache headers to the rest.
+
+    ``validators(request, *args, **kwargs)`` receives the view's arguments and
+    returns a ``Validators`` (or None to skip validation). ``cache_control``
+    is a callable returning ``patch_cache_control`` keyword arguments, read per
+    request so settings overrides apply.
+
+    Ninja hands the response it is about to fill to a parameter annotated
+    ``HttpResponse``; the wrapper declares one so it can set headers on 200s.
+    """
+
+    def decorator(view):
+        def directives():
+            return cache_control() if cache_control else {}
+
+        if iscoroutinefunction(view):
+
+            @wraps(view)
+            async def async_wrapper(request, *args, response=None, **kwargs):
+                found = await sync_to_async(validators)(request, *args, **kwargs)
+                cc = directives()
+                not_modified = _not_modified(request, found, cc)
+                if not_modified is not None:
+                    return not_modified
+                if response is not None and found is not None:
+                    _apply_headers(response, found, cc)
+                return await view(request, *args, **kwargs)
+
+            wrapper = async_wrapper
+        else:
+
+            @wraps(view)
+            def wrapper(request, *args, response=None, **kwargs):
+                found = validators(request, *args, **kwargs)
+                cc = directives()
+                not_modified = _not_modified(request, found, cc)
+                if not_modified is not None:
+                    return not_modified
+                if response is not None and found is not None:
+                    _apply_headers(response, found, cc)
+                return view(request, *args, **kwargs)
+
+        signature = inspect.signature(view)
+        wrapper.__signature__ = signature.replace(
+            parameters=[
+                *signature.parameters.values(),
+                inspect.Parameter(
+                    "response",
+                    inspect.Parameter.KEYWORD_ONLY,
+                    default=None,
+                    annotation=HttpResponse,
+                ),
+            ]
+        )
+        return wrapper
+
+    return decorator
+
+
+def private_revalidate():
+    """Cache-Control for per-user endpoints: browser cache only, always revalidated."""
+    return {"private": True, "no_cache": True}
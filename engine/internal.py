@@ -0,0 +1,29 @@
+"""Access control for internal operational endpoints (stats, metrics)."""
+
+from functools import wraps
+
+from django.conf import settings
+from django.http import JsonResponse
+from django.utils.crypto import constant_time_compare
+
+
+def is_internal_request(request) -> bool:
+    token = settings.INTERNAL_API_TOKEN
+    if token and constant_time_compare(
+        request.headers.get("X-Internal-Token", ""), token
+    ):
+        return True
+    user = getattr(request, "user", None)
+    return bool(user and user.is_authenticated and user.is_staff)
+
+
+def internal_view(view):
+    """Allow staff sessions or callers sending the ``X-Internal-Token`` header."""
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if not is_internal_request(request):
+            return JsonResponse({"detail": "Forbidden"}, status=403)
+        return view(request, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,89 @@
+"""
+Ninja routers imported on first use.
+
+``LazyRouterAPI.add_lazy_router(prefix, "dotted.path.router")`` mounts a
+router without importing it. The router module, with its services, schemas
+and the pydantic models Ninja builds for every operation, is imported the
+first time Django resolves a URL under ``prefix``. A worker that only serves
+bookings never imports the vendor views, ``/metrics`` imports none of them,
+and management commands that skip the URL checks don't pay for any.
+
+The OpenAPI schema, the docs page and ``reverse()`` of an API route need
+every operation, so they load all routers. Set ``API_LAZY_ROUTERS=False`` to
+import everything with the URLconf instead, e.g. under gunicorn's
+``--preload`` so the workers share the imported modules.
+"""
+
+import threading
+
+from django.conf import settings
+from django.urls import URLResolver
+from django.urls.resolvers import RoutePattern
+from ninja import NinjaAPI
+
+
+class _LazyURLConf:
+    # URLResolver reads ``urlpatterns`` the first time it matches a path,
+    # unlike include(), which reads it straight away.
+    def __init__(self, api, prefix):
+        self.api = api
+        self.prefix = prefix
+
+    @property
+    def urlpatterns(self):
+        return self.api.load_router(self.prefix)
+
+
+class LazyRouterAPI(NinjaAPI):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy_routers = {}
+        self._lazy_urls = {}
+        self._lazy_lock = threading.Lock()
+
+    def add_lazy_router(self, prefix: str, router: str):
+        """Mount the router at dotted path ``router`` under ``prefix``."""
+        self._lazy_routers[prefix.strip("/") + "/"] = router
+
+    def load_router(self, prefix: str) -> list:
+        """Import the router mounted at ``prefix``; return its URL patterns."""
+        with self._lazy_lock:
+            if prefix not in self._lazy_urls:
+                start = len(self._routers)
+                self.add_router(prefix, self._lazy_routers[prefix])
+                # Routes relative to the prefix, nested routers included.
+                self._lazy_urls[prefix] = [
+                    pattern
+                    for router_prefix, router in self._routers[start:]
+                    for pattern in router.urls_paths(router_prefix[len(prefix) :])
+                ]
+            return self._lazy_urls[prefix]
+
+    def load_all(self):
+        for prefix in self._lazy_routers:
+            self.load_router(prefix)
+
+    @property
+    def loaded_routers(self) -> list:
+        return [prefix for prefix in self._lazy_routers if prefix in self._lazy_urls]
+
+    def _get_urls(self):
+        if not settings.API_LAZY_ROUTERS:
+            self.load_all()
+            return super()._get_urls()
+
+        urls = super()._get_urls()
+        root = urls.pop()
+        for prefix in self._lazy_routers:
+            urls.append(
+                URLResolver(
+                    RoutePattern(prefix, is_endpoint=False),
+                    _LazyURLConf(self, prefix),
+                )
+            )
+        urls.append(root)
+        return urls
+
+    def get_openapi_schema(self, *args, **kwargs):
+        self.load_all()
+        return super().get_openapi_schema(*args, **kwargs)
@@ -0,0 +1,133 @@
+"""
+Logging building blocks used by ``engine/logger.py``.
+
+- ``QueuedFileHandler`` puts records on an in-process queue; a
+  ``QueueListener`` thread formats them and appends them to the log file,
+  so request threads never wait on disk I/O. Every worker process appends
+  to the same file, so none of them rotates it: logrotate (or similar)
+  moves it aside, and each process reopens the path once it has moved.
+- ``JsonFormatter`` writes one JSON object per line.
+- ``RateLimitFilter`` caps how many records below ``ERROR`` each logger may
+  emit, so bursts of expected client errors (404s, bad credentials) are
+  sampled instead of all written out. Errors always pass.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, WatchedFileHandler
+
+# Attributes every LogRecord has; anything else was passed through ``extra``.
+_RECORD_ATTRS = frozenset(
+    logging.makeLogRecord({}).__dict__.keys() | {"message", "asctime"}
+)
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket per logger: ``rate`` records per second, bursts of ``burst``.
+
+    Records at ``max_level`` or above are never dropped. The first record let
+    through after a drop carries ``sampled_out`` with the number dropped.
+    """
+
+    def __init__(self, rate=10.0, burst=50, max_level="ERROR"):
+        super().__init__()
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.max_level = logging._checkLevel(max_level)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= self.max_level or self.rate <= 0:
+            return True
+        # The same filter usually sits on several handlers; decide once.
+        decided = getattr(record, "_rate_limit_passed", None)
+        if decided is not None:
+            return decided
+        record._rate_limit_passed = self._take(record)
+        return record._rate_limit_passed
+
+    def _take(self, record):
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated, dropped = self._buckets.get(
+                record.name, (self.burst, now, 0)
+            )
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens < 1:
+                self._buckets[record.name] = (tokens, now, dropped + 1)
+                return False
+            self._buckets[record.name] = (tokens - 1, now, 0)
+        if dropped:
+            record.sampled_out = dropped
+        return True
+
+
+class QueuedFileHandler(QueueHandler):
+    """Hand records to a listener thread that appends them to a log file.
+
+    The formatter configured for this handler is applied on the listener
+    thread, so tracebacks are also formatted off the request thread.
+    """
+
+    def __init__(self, filename):
+        super().__init__(queue.SimpleQueue())
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self.target = WatchedFileHandler(filename, encoding="utf-8")
+        self.listener = QueueListener(self.queue, self.target)
+        self.listener.start()
+        atexit.register(self._stop_listener)
+        # A worker forked from a process that already logged (gunicorn
+        # --preload) inherits the queue but not the listener thread.
+        os.register_at_fork(after_in_child=self._restart_listener)
+
+    def _restart_listener(self):
+        self.queue = queue.SimpleQueue()
+        self.listener = QueueListener(self.queue, self.target)
+        self.listener.start()
+
+    def _stop_listener(self):
+        # QueueListener.stop() can't be called twice.
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+    def setFormatter(self, fmt):
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        # Same process, so there is no need to pickle: resolve the message
+        # here (its arguments may change later) and leave the rest,
+        # including exc_info, to the listener's formatter.
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def close(self):
+        self._stop_listener()
+        self.target.close()
+        super().close()
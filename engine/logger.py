@@ -1,14 +1,22 @@
 import os
 import sys
 
+from decouple import config
+
+# Created by the file handler when it is built. dictConfig builds every
+# configured handler, used or not, so "file" is only configured where the
+# root logger writes to it; tests log to the console and never touch it.
 LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "logs")
-os.makedirs(LOG_DIR, exist_ok=True)
 
 if "pytest" in sys.modules:
     root_handlers = ["console"]
 else:
     root_handlers = ["console", "file"]
 
+# The log file is written by a background thread as JSON lines. Every worker
+# appends to it, so it is rotated outside the app (logrotate) and reopened
+# once moved. Records below ERROR are rate limited per logger, see
+# engine/log_handlers.py.
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -21,16 +29,22 @@ LOGGING = {
             "format": "{levelname} {message}",
             "style": "{",
         },
+        "json": {
+            "()": "engine.log_handlers.JsonFormatter",
+        },
+    },
+    "filters": {
+        "rate_limit": {
+            "()": "engine.log_handlers.RateLimitFilter",
+            "rate": config("LOG_RATE_LIMIT", default=10.0, cast=float),
+            "burst": config("LOG_RATE_BURST", default=50, cast=int),
+        },
     },
     "handlers": {
         "console": {
             "class": "logging.StreamHandler",
             "formatter": "verbose",
-        },
-        "file": {
-            "class": "logging.FileHandler",
-            "filename": os.path.join(LOG_DIR, "django.log"),
-            "formatter": "verbose",
+            "filters": ["rate_limit"],
         },
     },
     "root": {
@@ -45,3 +59,11 @@ LOGGING = {
         },
     },
 }
+
+if "file" in root_handlers:
+    LOGGING["handlers"]["file"] = {
+        "()": "engine.log_handlers.QueuedFileHandler",
+        "filename": os.path.join(LOG_DIR, "django.log"),
+        "formatter": "json",
+        "filters": ["rate_limit"],
+    }
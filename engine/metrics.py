@@ -0,0 +1,168 @@
+"""
+Per-endpoint request metrics in Prometheus format.
+
+``MetricsMiddleware`` records, per method and URL route (e.g.
+``api/vendor/trips/<uuid:trip_id>``): latency, number and time of SQL
+queries, response size and a request counter by status code. Queries are
+counted by an ``execute_wrapper`` installed on every database connection;
+it reads the current request's counters from a context variable, so it
+also sees queries that async views run through ``sync_to_async``.
+
+``render_metrics`` backs the internal ``/metrics`` endpoint. Under gunicorn
+set ``PROMETHEUS_MULTIPROC_DIR`` to an empty directory (cleared on every
+deploy) so each worker writes its samples there and the endpoint reports
+the sum over all workers rather than the one that served the scrape.
+"""
+
+import os
+from contextvars import ContextVar
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import connections
+from django.db.backends.signals import connection_created
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUESTS = Counter(
+    "http_requests",
+    "Requests by route and status code",
+    ["method", "route", "status"],
+)
+LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time spent serving a request",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL queries run while serving a request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+DB_TIME = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in SQL queries while serving a request",
+    ["method", "route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Response body size as sent",
+    ["method", "route"],
+    buckets=(100, 1_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000),
+)
+OPEN_STREAMS = Gauge(
+    "event_streams_open",
+    "Event streams currently held open (see engine/seat_events.py)",
+    multiprocess_mode="livesum",
+)
+
+
+class RequestStats:
+    __slots__ = ("queries", "db_time")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+
+
+_current: ContextVar = ContextVar("request_stats", default=None)
+
+
+def _record_query(execute, sql, params, many, context):
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.db_time += perf_counter() - started
+
+
+def _install(connection):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    _install(connection)
+
+
+connection_created.connect(_on_connection_created)
+
+
+def route_of(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    return match.route if match is not None else UNMATCHED_ROUTE
+
+
+def observe(request, response, elapsed: float, stats: RequestStats):
+    method, route = request.method, route_of(request)
+    REQUESTS.labels(method, route, str(response.status_code)).inc()
+    LATENCY.labels(method, route).observe(elapsed)
+    DB_QUERIES.labels(method, route).observe(stats.queries)
+    DB_TIME.labels(method, route).observe(stats.db_time)
+    if not response.streaming:
+        RESPONSE_SIZE.labels(method, route).observe(len(response.content))
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        # Connections opened before this module was imported missed the
+        # connection_created signal.
+        for connection in connections.all(initialized_only=True):
+            _install(connection)
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        observe(request, response, perf_counter() - started, stats)
+        return response
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        observe(request, response, perf_counter() - started, stats)
+        return response
+
+
+def render_metrics() -> bytes:
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
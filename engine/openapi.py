@@ -0,0 +1,52 @@
+"""
+The OpenAPI document, built once and served with an ETag.
+
+Ninja walks every router and pydantic schema on each ``openapi.json``
+request. ``schema_document`` renders the document once per process, or
+reads the file ``manage.py build_openapi`` wrote during the deploy when
+``OPENAPI_SCHEMA_FILE`` points at it, and keeps the bytes in memory with a
+content hash for ``If-None-Match``.
+
+``build_openapi`` writes to ``STATIC_ROOT/openapi.json`` by default, so run
+after ``collectstatic`` it is also served by WhiteNoise as
+``/static/openapi.json``.
+"""
+
+import hashlib
+import logging
+import threading
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_documents = {}
+_lock = threading.Lock()
+
+
+def render_schema(api) -> bytes:
+    schema = api.get_openapi_schema(path_prefix=api.get_root_path({}))
+    return api.renderer.render(None, schema, response_status=200)
+
+
+def _read_or_render(api) -> bytes:
+    if settings.OPENAPI_SCHEMA_FILE:
+        path = Path(settings.OPENAPI_SCHEMA_FILE)
+        if path.is_file():
+            return path.read_bytes()
+        logger.warning("OPENAPI_SCHEMA_FILE %s does not exist", path)
+    return render_schema(api)
+
+
+def schema_document(api) -> tuple:
+    """Return the OpenAPI document of ``api`` as ``(content, etag)``."""
+    document = _documents.get(api.urls_namespace)
+    if document is None:
+        with _lock:
+            document = _documents.get(api.urls_namespace)
+            if document is None:
+                content = _read_or_render(api)
+                etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+                document = _documents[api.urls_namespace] = (content, etag)
+    return document
@@ -0,0 +1,134 @@
+"""
+Publish/subscribe for events pushed to open streams (see engine/seat_events.py).
+
+Each ASGI process keeps one ``Hub``: per topic, the queues of the streams
+subscribed to it. A subscriber that is waiting costs a parked coroutine and
+a set entry; nothing polls. Queues hold ``QUEUE_SIZE`` messages and drop the
+oldest when a client reads too slowly, since every message carries the full
+current state.
+
+``publish`` can be called from any thread (sync views run in a thread pool)
+and sends the message once the current transaction commits, so a rolled
+back change is never announced. ``PUBSUB_BROKER`` carries it to the hubs:
+
+- ``LocalBroker`` hands it straight to this process's hub. Enough for a
+  single ASGI process, where the sync views publishing run in the same
+  process;
+- ``PostgresBroker`` sends it with ``pg_notify`` on the default database.
+  Every process LISTENs on one channel from the first subscription on and
+  delivers to its own subscribers, so publishers in other processes (WSGI
+  workers, management commands) reach every node.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+import orjson
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+QUEUE_SIZE = 8
+# Seconds before a lost LISTEN connection is opened again
+RECONNECT_DELAY = 5
+
+
+def _offer(queue, message):
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message)
+
+
+class Hub:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+        self._listener = None
+
+    @contextmanager
+    def subscription(self, topic):
+        """A queue receiving the messages published to ``topic``; call it
+        on the event loop that reads the queue."""
+        loop = asyncio.get_running_loop()
+        listener = self._listener
+        if listener is None or listener.done() or listener.get_loop() is not loop:
+            self._listener = loop.create_task(get_broker().listen(self))
+        entry = (loop, asyncio.Queue(QUEUE_SIZE))
+        with self._lock:
+            self._subscribers[topic].add(entry)
+        try:
+            yield entry[1]
+        finally:
+            with self._lock:
+                self._subscribers[topic].discard(entry)
+                if not self._subscribers[topic]:
+                    del self._subscribers[topic]
+
+    def deliver(self, topic, message) -> int:
+        """Queue ``message`` for the subscribers of ``topic`` in this
+        process; safe from any thread. Returns how many there were."""
+        with self._lock:
+            entries = list(self._subscribers.get(topic, ()))
+        for loop, queue in entries:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, message)
+            except RuntimeError:  # the stream's loop has shut down
+                pass
+        return len(entries)
+
+
+hub = Hub()
+
+
+class LocalBroker:
+    def publish(self, topic, message):
+        hub.deliver(topic, message)
+
+    async def listen(self, hub):
+        return None
+
+
+class PostgresBroker:
+    channel = "pubsub"
+
+    def publish(self, topic, message):
+        payload = orjson.dumps({"topic": topic, "message": message}).decode()
+        with connections["default"].cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [self.channel, payload])
+
+    def _connection_params(self):
+        params = connections["default"].get_connection_params()
+        for key in ("cursor_factory", "context", "prepare_threshold"):
+            params.pop(key, None)
+        return params
+
+    async def listen(self, hub):
+        import psycopg
+
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    autocommit=True, **self._connection_params()
+                ) as connection:
+                    await connection.execute(f"LISTEN {self.channel}")
+                    async for notify in connection.notifies():
+                        event = orjson.loads(notify.payload)
+                        hub.deliver(event["topic"], event["message"])
+            except Exception as exc:
+                logger.warning("Event listener lost its connection: %s", exc)
+            await asyncio.sleep(RECONNECT_DELAY)
+
+
+def get_broker():
+    return import_string(settings.PUBSUB_BROKER)()
+
+
+def publish(topic, message) -> None:
+    """Send ``message`` to the subscribers of ``topic`` on every node once
+    the current transaction (if any) commits."""
+    transaction.on_commit(lambda: get_broker().publish(topic, message))
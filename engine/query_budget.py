@@ -0,0 +1,214 @@
+"""
+Query budgets and N+1 detection.
+
+Views declare how many SQL queries a whole request may run with
+``@query_budget(n)``; the count covers everything in the request, including
+authentication and the queries Ninja triggers while serializing the
+response. ``QueryInspectionMiddleware`` fingerprints every query (literal
+values and ``IN (...)`` lists collapsed) and, at the end of the request,
+reports requests that went over budget or ran the same query shape
+``QUERY_REPEAT_THRESHOLD`` times or more, the usual sign of an N+1.
+
+``QUERY_INSPECTION`` selects what happens:
+
+- ``off`` (default): the middleware removes itself, no overhead;
+- ``log``: a sample (``QUERY_INSPECTION_SAMPLE_RATE``) of requests is
+  inspected and problems are logged as warnings;
+- ``raise``: every request is inspected and problems raise
+  ``QueryBudgetExceeded`` (the test suite runs in this mode).
+
+``assert_max_queries`` applies the same checks to a block of test code.
+
+Savepoint statements are not counted: the same ``transaction.atomic`` block
+opens a transaction without any statement of its own at the top level but
+issues ``SAVEPOINT``/``RELEASE`` inside the test suite's transaction.
+"""
+
+import logging
+import random
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN \((?:%s|\?)(?:, (?:%s|\?))*\)", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+_SAVEPOINT = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def fingerprint(sql: str) -> str:
+    """Reduce ``sql`` to its shape: the same query with other values matches."""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+class QueryLog:
+    __slots__ = ("shapes", "total", "budget", "parent")
+
+    def __init__(self, parent=None):
+        self.shapes = Counter()
+        self.total = 0
+        self.budget = None
+        # An enclosing log, e.g. assert_max_queries around a test client call.
+        self.parent = parent
+
+    def add(self, sql):
+        self.shapes[fingerprint(sql)] += 1
+        self.total += 1
+        if self.parent is not None:
+            self.parent.add(sql)
+
+    def problems(self, budget=None, repeat_threshold=None) -> list:
+        budget = self.budget if budget is None else budget
+        if repeat_threshold is None:
+            repeat_threshold = settings.QUERY_REPEAT_THRESHOLD
+        found = []
+        if budget is not None and self.total > budget:
+            found.append(f"{self.total} queries, budget is {budget}")
+        for shape, count in self.shapes.most_common():
+            if count < repeat_threshold:
+                break
+            found.append(f"{count}x {shape}")
+        return found
+
+
+_current: ContextVar = ContextVar("query_log", default=None)
+
+
+def _record(execute, sql, params, many, context):
+    log = _current.get()
+    if log is not None and not sql.startswith(_SAVEPOINT):
+        log.add(sql)
+    return execute(sql, params, many, context)
+
+
+def _install(connection):
+    if _record not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record)
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    _install(connection)
+
+
+def query_budget(limit: int):
+    """Declare the most queries a request to the decorated view may run."""
+
+    def decorator(view):
+        def set_budget():
+            log = _current.get()
+            if log is not None:
+                log.budget = limit
+
+        if iscoroutinefunction(view):
+
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                set_budget()
+                return await view(request, *args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            set_budget()
+            return view(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class QueryInspectionMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.mode = settings.QUERY_INSPECTION
+        if self.mode not in ("log", "raise"):
+            raise MiddlewareNotUsed
+        self.sample_rate = (
+            1.0 if self.mode == "raise" else settings.QUERY_INSPECTION_SAMPLE_RATE
+        )
+        connection_created.connect(_on_connection_created)
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        for connection in connections.all(initialized_only=True):
+            _install(connection)
+        log = QueryLog(parent=_current.get())
+        token = _current.set(log)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.report(request, log)
+        return response
+
+    async def __acall__(self, request):
+        if random.random() >= self.sample_rate:
+            return await self.get_response(request)
+
+        log = QueryLog(parent=_current.get())
+        token = _current.set(log)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.report(request, log)
+        return response
+
+    def report(self, request, log):
+        problems = log.problems()
+        if not problems:
+            return
+        message = f"{request.method} {request.path}: " + "; ".join(problems)
+        if self.mode == "raise":
+            raise QueryBudgetExceeded(message)
+        logger.warning(
+            message,
+            extra={"queries": log.total, "query_budget": log.budget},
+        )
+
+
+@contextmanager
+def assert_max_queries(limit=None, repeat_threshold=None):
+    """Fail if the block runs more than ``limit`` queries or repeats a shape.
+
+    ``repeat_threshold`` defaults to ``QUERY_REPEAT_THRESHOLD``.
+    """
+    for connection in connections.all():
+        _install(connection)
+    log = QueryLog(parent=_current.get())
+    token = _current.set(log)
+    try:
+        yield log
+    finally:
+        _current.reset(token)
+    problems = log.problems(limit, repeat_threshold)
+    if problems:
+        raise QueryBudgetExceeded("; ".join(problems))
@@ -0,0 +1,38 @@
+"""
+JSON renderers for the Ninja API.
+
+``API_RENDERER`` picks the renderer class (``engine.renderers.ORJSONRenderer``
+by default). orjson serializes ``UUID``, ``date``, ``time`` and ``datetime``
+natively; ``Decimal`` is rendered as a string, matching Ninja's stdlib
+encoder, and anything else falls back to that encoder. Set ``API_RENDERER``
+to ``ninja.renderers.JSONRenderer`` to go back to the stdlib ``json`` module.
+"""
+
+from decimal import Decimal
+
+import orjson
+from django.conf import settings
+from django.utils.module_loading import import_string
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+_fallback = NinjaJSONEncoder()
+
+
+def _default(obj):
+    if isinstance(obj, Decimal):
+        return str(obj)
+    return _fallback.default(obj)
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = "application/json"
+
+    def render(self, request, data, *, response_status):
+        return orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+
+
+def get_renderer() -> BaseRenderer:
+    return import_string(settings.API_RENDERER)()
@@ -0,0 +1,148 @@
+"""
+Live seat availability over server-sent events.
+
+``GET /events/trips/<trip_id>/seats`` answers with a ``text/event-stream``
+that stays open: first a ``seats`` event with the trip's seat map (the
+payload of ``GET /api/trips/<trip_id>/seats``), then another one each time
+a booking claims or releases seats, and a final ``closed`` event if the
+vendor cancels the trip. A comment line every ``HEARTBEAT_INTERVAL``
+seconds keeps proxies from timing the connection out.
+
+``SeatEvents`` wraps the Django ASGI application in ``engine/asgi.py`` and
+serves these paths itself, so an open stream never holds a Django request,
+a thread or a database connection: the seat map is read once, then the
+stream waits on its ``engine.pubsub`` subscription. The stream subscribes
+before that read, so no change made in between is missed. Browsers
+reconnect on their own (``EventSource``) and get a fresh seat map.
+
+Under WSGI there is no such route; the stream needs an ASGI server.
+"""
+
+import asyncio
+import re
+from uuid import UUID
+
+import orjson
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from ninja.errors import HttpError
+
+from modules.trips.services.seat_service import (
+    availability,
+    seat_availability,
+    seat_topic,
+)
+
+from .metrics import OPEN_STREAMS
+from .pubsub import hub
+
+ROUTE = re.compile(
+    r"^/events/trips/(?P<trip_id>[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-"
+    r"[0-9a-f]{4}-[0-9a-f]{12})/seats/?$"
+)
+HEARTBEAT_INTERVAL = 20
+HEADERS = [
+    (b"content-type", b"text/event-stream"),
+    (b"cache-control", b"no-cache"),
+    # Tells nginx not to buffer the stream
+    (b"x-accel-buffering", b"no"),
+]
+
+
+def event(name, data) -> bytes:
+    return b"event: %s\ndata: %s\n\n" % (name.encode(), orjson.dumps(data))
+
+
+def _read_seats(trip_id):
+    # Outside Django's request cycle, so connections are checked here as
+    # request_started and request_finished would.
+    close_old_connections()
+    try:
+        return seat_availability(trip_id)
+    except HttpError:
+        return None
+    finally:
+        close_old_connections()
+
+
+async def _disconnect(receive):
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def _respond(send, status, detail):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": orjson.dumps({"detail": detail})})
+
+
+class SeatEvents:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        match = ROUTE.match(scope["path"]) if scope["type"] == "http" else None
+        if match is None:
+            return await self.app(scope, receive, send)
+        if scope["method"] != "GET":
+            return await _respond(send, 405, "Method not allowed")
+        await self.stream(UUID(match["trip_id"]), receive, send)
+
+    async def stream(self, trip_id, receive, send):
+        with hub.subscription(seat_topic(trip_id)) as queue:
+            seats = await sync_to_async(_read_seats)(trip_id)
+            if seats is None:
+                return await _respond(send, 404, "Trip does not exist")
+
+            await send(
+                {"type": "http.response.start", "status": 200, "headers": HEADERS}
+            )
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": event("seats", seats),
+                    "more_body": True,
+                }
+            )
+            disconnected = asyncio.ensure_future(_disconnect(receive))
+            OPEN_STREAMS.inc()
+            try:
+                while not disconnected.done():
+                    message = asyncio.ensure_future(queue.get())
+                    await asyncio.wait(
+                        {message, disconnected},
+                        timeout=HEARTBEAT_INTERVAL,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if not message.done():
+                        message.cancel()
+                        if not disconnected.done():
+                            await send(
+                                {
+                                    "type": "http.response.body",
+                                    "body": b": heartbeat\n\n",
+                                    "more_body": True,
+                                }
+                            )
+                        continue
+                    message = message.result()
+                    if "status" in message:
+                        body = event("closed", {"trip_id": trip_id, **message})
+                        await send({"type": "http.response.body", "body": body})
+                        return
+                    seats = availability(trip_id, seats["capacity"], message["taken"])
+                    await send(
+                        {
+                            "type": "http.response.body",
+                            "body": event("seats", seats),
+                            "more_body": True,
+                        }
+                    )
+            finally:
+                OPEN_STREAMS.dec()
+                disconnected.cancel()
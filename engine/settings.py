@@ -14,9 +14,9 @@ import sys
 from datetime import timedelta
 from pathlib import Path
 
-import dj_database_url
 from decouple import Csv, config
 
+from .database import build_database
 from .logger import LOGGING
 
 _ = LOGGING
@@ -37,6 +37,9 @@ ALLOWED_HOSTS = config(
     cast=Csv(),
 )
 
+# Shared secret for internal endpoints such as /internal/db-pool/
+INTERNAL_API_TOKEN = config("INTERNAL_API_TOKEN", default="")
+
 AUTH_USER_MODEL = "authenticator.User"
 FRONTEND_URL = config("FRONTEND_URL", default="http://localhost:3000")
 
@@ -57,6 +60,10 @@ INSTALLED_APPS = [
     "modules.bookings",
     "modules.trips",
     "modules.payments",
+    "modules.notifications",
+    "modules.reviews",
+    "modules.media",
+    "modules.core",
     "ninja_jwt.token_blacklist",
 ]
 
@@ -70,12 +77,17 @@ SIMPLE_JWT = {
 }
 
 MIDDLEWARE = [
+    # Outermost, so latency covers the whole stack and sizes are as sent.
+    "engine.metrics.MetricsMiddleware",
+    "engine.query_budget.QueryInspectionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "engine.compression.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "engine.db_router.PrimaryPinMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -100,13 +112,107 @@ TEMPLATES = [
 WSGI_APPLICATION = "engine.wsgi.application"
 ASGI_APPLICATION = "engine.asgi.application"
 
+# Serve read-heavy endpoints with their async views (see engine/async_views.py).
+# engine/asgi.py turns this on by default; WSGI deployments keep the sync views.
+ASYNC_VIEWS = config("ASYNC_VIEWS", default=False, cast=bool)
+
+
+# API responses (see engine/renderers.py and engine/compression.py)
+
+API_RENDERER = config("API_RENDERER", default="engine.renderers.ORJSONRenderer")
+
+# Import each API router on the first request under its prefix rather than with
+# the URLconf (see engine/lazy_routers.py); turn off under gunicorn --preload
+API_LAZY_ROUTERS = config("API_LAZY_ROUTERS", default=True, cast=bool)
+
+# OpenAPI document written by `manage.py build_openapi`; when unset or missing
+# it is built on the first request (see engine/openapi.py)
+OPENAPI_SCHEMA_FILE = config("OPENAPI_SCHEMA_FILE", default="")
+
+# Responses smaller than this many bytes are not worth compressing
+COMPRESSION_MIN_SIZE = config("COMPRESSION_MIN_SIZE", default=500, cast=int)
+# 0-11; mid-range qualities compress about as fast as gzip but smaller
+COMPRESSION_BROTLI_QUALITY = config("COMPRESSION_BROTLI_QUALITY", default=5, cast=int)
+
+
+# Query budgets and N+1 detection (see engine/query_budget.py): "off", "log"
+# (inspect a sample of requests and log problems) or "raise" (tests).
+QUERY_INSPECTION = config("QUERY_INSPECTION", default="off")
+QUERY_INSPECTION_SAMPLE_RATE = config(
+    "QUERY_INSPECTION_SAMPLE_RATE", default=0.05, cast=float
+)
+# The same query shape this many times in one request is reported as an N+1
+QUERY_REPEAT_THRESHOLD = config("QUERY_REPEAT_THRESHOLD", default=5, cast=int)
+
 
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
 DATABASE_URL = str(config("DATABASE_URL", default="sqlite:///db.sqlite3"))
 
-DATABASES = {"default": dj_database_url.config(default=DATABASE_URL)}
+# Connection persistence, pooling and prepared statements are configured
+# through DB_* environment variables, see engine/database.py.
+DATABASES = {"default": build_database(DATABASE_URL)}
+
+# Optional read replica for search and listing traffic, see engine/db_router.py.
+# Locally this can be a second SQLite file or Postgres database
+# (`python manage.py migrate --database replica`).
+DATABASE_REPLICA_URL = config("DATABASE_REPLICA_URL", default="")
+if DATABASE_REPLICA_URL:
+    DATABASES["replica"] = build_database(DATABASE_REPLICA_URL)
+    DATABASES["replica"]["TEST"] = {"MIRROR": "default"}
+
+DATABASE_ROUTERS = ["engine.db_router.PrimaryReplicaRouter"]
+
+# Seconds a user who just wrote keeps reading from the primary
+REPLICA_PIN_SECONDS = config("REPLICA_PIN_SECONDS", default=5, cast=int)
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# Local memory is per process; use a shared backend (e.g. Redis or database)
+# when running several gunicorn workers so invalidations reach every worker.
+
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": config("CACHE_LOCATION", default=""),
+    }
+}
+
+# Seconds a cached /auth/user/me snapshot may live before being rebuilt
+USER_SNAPSHOT_TTL = config("USER_SNAPSHOT_TTL", default=300, cast=int)
+
+# Cache-Control on the public trip search (see engine/http_cache.py):
+# browsers may reuse a result for SEARCH_CACHE_MAX_AGE seconds, shared caches
+# and CDNs for SEARCH_CACHE_S_MAXAGE seconds.
+SEARCH_CACHE_MAX_AGE = config("SEARCH_CACHE_MAX_AGE", default=30, cast=int)
+SEARCH_CACHE_S_MAXAGE = config("SEARCH_CACHE_S_MAXAGE", default=60, cast=int)
+
+
+# Notification channels (see modules/notifications/channels.py). SMS_CHANNEL
+# names the provider's channel class; the default only logs the texts.
+NOTIFICATION_CHANNELS = {
+    "email": "modules.notifications.channels.EmailChannel",
+    "sms": config(
+        "SMS_CHANNEL", default="modules.notifications.channels.LocalSmsChannel"
+    ),
+}
+
+
+# Admin changelists (see engine/admin.py): on Postgres, tables the planner
+# estimates at this many rows or more are paginated on the estimate instead
+# of an exact COUNT(*).
+ADMIN_EXACT_COUNT_LIMIT = config("ADMIN_EXACT_COUNT_LIMIT", default=10000, cast=int)
+
+
+# Carries the events pushed on the seat streams (see engine/pubsub.py).
+# LocalBroker only reaches streams in the publishing process; with several
+# ASGI processes, or bookings served under WSGI, use
+# engine.pubsub.PostgresBroker.
+PUBSUB_BROKER = config("PUBSUB_BROKER", default="engine.pubsub.LocalBroker")
 
 
 # Password validation
@@ -146,6 +252,34 @@ USE_TZ = True
 STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+
+# Uploaded media (see modules/media/services.py). Files go through the
+# default storage: local disk under MEDIA_ROOT, or e.g. an S3 backend from
+# django-storages named in MEDIA_STORAGE_BACKEND.
+
+MEDIA_URL = config("MEDIA_URL", default="/media/")
+MEDIA_ROOT = config("MEDIA_ROOT", default=str(BASE_DIR / "media"))
+STORAGES = {
+    "default": {
+        "BACKEND": config(
+            "MEDIA_STORAGE_BACKEND",
+            default="django.core.files.storage.FileSystemStorage",
+        ),
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+# Uploads are hashed as they stream in and stopped past this many bytes
+MEDIA_MAX_UPLOAD_SIZE = config(
+    "MEDIA_MAX_UPLOAD_SIZE", default=10 * 1024 * 1024, cast=int
+)
+FILE_UPLOAD_HANDLERS = [
+    "modules.media.uploads.HashingUploadHandler",
+    "django.core.files.uploadhandler.MemoryFileUploadHandler",
+    "django.core.files.uploadhandler.TemporaryFileUploadHandler",
+]
+
 # timezone aware
 USE_TZ = True
 TIME_ZONE = "UTC"
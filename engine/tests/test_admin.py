@@ -0,0 +1,116 @@
+from datetime import date, time, timedelta
+
+import pytest
+from django.test import Client
+
+from engine import admin as large_admin
+from engine.admin import EstimatedCountPaginator, estimated_count
+from modules.bookings.models import Booking
+from modules.corper.models import CorperProfile
+from modules.payments.models import Payment
+from modules.trips.models import Trip, Vehicle, VehicleType
+from modules.vendor.models import Vendor
+
+ROWS = 6
+
+
+@pytest.fixture
+def staff(USER):
+    admin = USER.objects.create_superuser(email="ops@example.com", password="x")
+    client = Client()
+    client.force_login(admin)
+    return client
+
+
+@pytest.fixture
+def rows(USER):
+    bus = VehicleType.objects.create(name="Bus")
+    for n in range(ROWS):
+        vendor = USER.objects.create_user(
+            email=f"vendor{n}@example.com", role="vendor", full_name=f"Vendor {n}"
+        )
+        Vendor.objects.create(
+            user=vendor,
+            phone="08012345678",
+            business_name=f"Vendor {n}",
+            business_registration_number=f"RC-{n}",
+            years_in_operation=2,
+        )
+        corper = USER.objects.create_user(
+            email=f"corper{n}@example.com", role="corper", full_name=f"Corper {n}"
+        )
+        CorperProfile.objects.create(
+            user=corper,
+            phone="08012345678",
+            state_code=f"LA/24A/{n}",
+            call_up_number=f"NYSC/{n}",
+            deployment_state="Lagos",
+            camp_location="Iyana-Ipaja",
+            deployment_date=date.today(),
+        )
+        vehicle = Vehicle.objects.create(
+            vendor=vendor,
+            registration_number=f"ABC-{n}",
+            vehicle_type=bus,
+            make_model="Toyota Hiace",
+            capacity=14,
+        )
+        trip = Trip.objects.create(
+            vendor=vendor,
+            vehicle=vehicle,
+            departure_state="Lagos",
+            departure_city="Ikeja",
+            destination_camp="Iyana-Ipaja",
+            departure_date=date.today() + timedelta(days=n + 1),
+            departure_time=time(8),
+            price_per_seat=5000,
+            available_seats=14,
+        )
+        booking = Booking.objects.create(user=corper, trip=trip)
+        Payment.objects.create(user=corper, booking=booking, amount=5000)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "changelist",
+    [
+        "authenticator/user",
+        "bookings/booking",
+        "corper/corperprofile",
+        "payments/payment",
+        "trips/trip",
+        "trips/vehicle",
+        "vendor/vendor",
+    ],
+)
+def test_changelists_load_related_rows_in_the_page_query(staff, rows, changelist):
+    # The test client runs with QUERY_INSPECTION="raise", so a query per
+    # row fails the request.
+    response = staff.get(f"/admin/{changelist}/", {"q": ""})
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_search_uses_prefix_matches(staff, rows):
+    response = staff.get("/admin/bookings/booking/", {"q": "corper3@"})
+
+    assert response.status_code == 200
+    assert list(response.context["cl"].result_list) == list(
+        Booking.objects.filter(user__email="corper3@example.com")
+    )
+
+
+@pytest.mark.django_db
+def test_estimates_are_postgres_only(rows):
+    assert estimated_count(Booking.objects.all()) is None
+
+
+@pytest.mark.django_db
+def test_paginator_trusts_large_estimates(rows, monkeypatch, settings):
+    settings.ADMIN_EXACT_COUNT_LIMIT = 1000
+    monkeypatch.setattr(large_admin, "estimated_count", lambda queryset: 2_000_000)
+    assert EstimatedCountPaginator(Booking.objects.all(), 100).count == 2_000_000
+
+    monkeypatch.setattr(large_admin, "estimated_count", lambda queryset: 40)
+    assert EstimatedCountPaginator(Booking.objects.all(), 100).count == ROWS
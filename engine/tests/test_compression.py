@@ -0,0 +1,82 @@
+import gzip
+
+import brotli
+import pytest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, override_settings
+
+from engine.compression import CompressionMiddleware, choose_encoding
+
+BODY = b'{"departure_state": "Lagos"}' * 100
+
+
+def json_response(body=BODY):
+    return HttpResponse(body, content_type="application/json")
+
+
+def respond(accept_encoding, response):
+    request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+    return CompressionMiddleware(lambda request: response)(request)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("*", "br"),
+        ("", None),
+    ],
+)
+def test_choose_encoding(header, expected):
+    assert choose_encoding(header) == expected
+
+
+def test_gzip_only():
+    assert choose_encoding("br, gzip", gzip_only=True) == "gzip"
+
+
+def test_brotli_response():
+    resp = respond("gzip, br", json_response())
+    assert resp["Content-Encoding"] == "br"
+    assert resp["Vary"] == "Accept-Encoding"
+    assert brotli.decompress(resp.content) == BODY
+
+
+def test_gzip_response():
+    resp = respond("gzip", json_response())
+    assert resp["Content-Encoding"] == "gzip"
+    assert gzip.decompress(resp.content) == BODY
+
+
+def test_html_is_only_gzipped():
+    # GZipMiddleware pads gzipped pages against BREACH; Brotli wouldn't.
+    page = b"<input name='csrfmiddlewaretoken' value='secret'>" * 20
+    resp = respond("br, gzip", HttpResponse(page))
+    assert resp["Content-Encoding"] == "gzip"
+    assert gzip.decompress(resp.content) == page
+    assert respond("br", HttpResponse(page)).content == page
+
+
+def test_streaming_is_never_brotli():
+    resp = respond(
+        "br, gzip",
+        StreamingHttpResponse(iter([BODY]), content_type="application/json"),
+    )
+    assert resp["Content-Encoding"] == "gzip"
+
+
+@override_settings(COMPRESSION_MIN_SIZE=len(BODY) + 1)
+def test_small_responses_are_not_compressed():
+    resp = respond("br, gzip", json_response())
+    assert not resp.has_header("Content-Encoding")
+
+
+def test_event_streams_are_not_compressed():
+    resp = respond(
+        "gzip",
+        StreamingHttpResponse(iter([BODY]), content_type="text/event-stream"),
+    )
+    assert not resp.has_header("Content-Encoding")
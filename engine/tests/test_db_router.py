@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from engine import db_router
+from engine.db_router import (
+    PrimaryPinMiddleware,
+    PrimaryReplicaRouter,
+    pin_user_to_primary,
+    primary_pin_key,
+    replica_reads,
+)
+
+router = PrimaryReplicaRouter()
+
+
+def make_user(pk="u-1"):
+    return SimpleNamespace(pk=pk, is_authenticated=True)
+
+
+@pytest.fixture
+def with_replica(monkeypatch):
+    monkeypatch.setattr(db_router, "replica_alias", lambda: "replica")
+
+
+def test_reads_use_primary_without_replica():
+    @replica_reads
+    def view(request):
+        return router.db_for_read(None)
+
+    assert view(SimpleNamespace(user=make_user())) is None
+
+
+def test_reads_use_primary_outside_replica_views(with_replica):
+    assert router.db_for_read(None) is None
+
+
+def test_replica_reads_until_the_request_writes(with_replica):
+    @replica_reads
+    def view(request):
+        before = router.db_for_read(None)
+        assert router.db_for_write(None) == "default"
+        return before, router.db_for_read(None)
+
+    assert view(SimpleNamespace(user=make_user("u-2"))) == ("replica", None)
+
+
+def test_async_replica_reads(with_replica):
+    @replica_reads
+    async def view(request):
+        return router.db_for_read(None)
+
+    assert async_to_sync(view)(SimpleNamespace(user=make_user("u-3"))) == "replica"
+
+
+def test_pinned_user_reads_from_primary(with_replica):
+    user = make_user("u-4")
+    pin_user_to_primary(user.pk)
+
+    @replica_reads
+    def view(request):
+        return router.db_for_read(None)
+
+    assert view(SimpleNamespace(user=user)) is None
+
+
+def test_middleware_pins_users_who_wrote(with_replica):
+    user = make_user("u-5")
+
+    def get_response(request):
+        request.user = user
+        router.db_for_write(None)
+        return HttpResponse()
+
+    PrimaryPinMiddleware(get_response)(RequestFactory().post("/"))
+
+    assert cache.get(primary_pin_key(user.pk)) is True
+
+
+def test_middleware_keeps_replica_scope_for_lazy_responses(with_replica):
+    # Ninja evaluates returned querysets after the view returns.
+    user = make_user("u-6")
+    seen = []
+
+    def get_response(request):
+        request.user = user
+        replica_reads(lambda request: None)(request)
+        seen.append(router.db_for_read(None))
+        return HttpResponse()
+
+    PrimaryPinMiddleware(get_response)(RequestFactory().get("/"))
+
+    assert seen == ["replica"]
+    assert router.db_for_read(None) is None
+    assert cache.get(primary_pin_key(user.pk)) is None
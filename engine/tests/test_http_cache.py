@@ -0,0 +1,134 @@
+from datetime import date, time, timedelta
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import Client, RequestFactory, override_settings
+from ninja_jwt.tokens import AccessToken
+
+from modules.trips.models import Trip, Vehicle, VehicleType
+from modules.trips.views.trips_views import asearch_trips
+
+
+@pytest.fixture
+def vendor(USER):
+    return USER.objects.create_user(
+        email="vendor@example.com",
+        password="Password1!",
+        is_active=True,
+        role="vendor",
+        full_name="Test Vendor",
+    )
+
+
+@pytest.fixture
+def trip(vendor):
+    vehicle = Vehicle.objects.create(
+        vendor=vendor,
+        registration_number="ABC123",
+        vehicle_type=VehicleType.objects.create(name="bus"),
+        make_model="Toyota Hiace",
+        capacity=14,
+    )
+    return Trip.objects.create(
+        vendor=vendor,
+        vehicle=vehicle,
+        departure_city="Ajah",
+        departure_state="Lagos",
+        destination_camp="Abuja",
+        departure_date=date.today() + timedelta(days=1),
+        departure_time=time(8, 0),
+        price_per_seat=5000,
+        available_seats=10,
+    )
+
+
+@pytest.fixture
+def auth(vendor):
+    return {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(vendor)}"}
+
+
+@pytest.mark.django_db
+@override_settings(SEARCH_CACHE_MAX_AGE=11, SEARCH_CACHE_S_MAXAGE=22)
+def test_search_sends_public_cache_headers_and_304s(trip):
+    client = Client()
+    resp = client.get("/api/vendor/trips/search?departure_state=Lagos")
+    assert resp.status_code == 200
+    assert len(resp.json()) == 1
+    etag = resp.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert "Last-Modified" not in resp.headers
+    cache_control = resp.headers["Cache-Control"]
+    assert "public" in cache_control
+    assert "max-age=11" in cache_control
+    assert "s-maxage=22" in cache_control
+
+    resp = client.get(
+        "/api/vendor/trips/search?departure_state=Lagos", HTTP_IF_NONE_MATCH=etag
+    )
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test_search_etag_changes_when_a_trip_leaves_the_results(trip):
+    client = Client()
+    etag = client.get("/api/vendor/trips/search").headers["ETag"]
+
+    Trip.objects.filter(pk=trip.pk).update(status="cancelled")
+
+    resp = client.get("/api/vendor/trips/search", HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 200
+    assert resp.json() == []
+    assert resp.headers["ETag"] != etag
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_search_short_circuits(trip):
+    etag = Client().get("/api/vendor/trips/search").headers["ETag"]
+    request = RequestFactory().get("/api/vendor/trips/search", HTTP_IF_NONE_MATCH=etag)
+    assert async_to_sync(asearch_trips)(request).status_code == 304
+
+
+@pytest.mark.django_db
+def test_trip_detail_revalidates_with_last_modified(trip, auth):
+    client = Client()
+    url = f"/api/vendor/trips/{trip.id}"
+    resp = client.get(url, **auth)
+    assert resp.status_code == 200
+    assert "private" in resp.headers["Cache-Control"]
+    last_modified = resp.headers["Last-Modified"]
+
+    resp = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified, **auth)
+    assert resp.status_code == 304
+
+    # Last-Modified has one-second resolution.
+    Trip.objects.filter(pk=trip.pk).update(
+        departure_time=time(9, 0), updated_at=trip.updated_at + timedelta(seconds=2)
+    )
+    resp = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified, **auth)
+    assert resp.status_code == 200
+    assert resp.json()["departure_time"] == "09:00:00"
+
+
+@pytest.mark.django_db
+def test_missing_trip_is_still_404(vendor, auth):
+    resp = Client().get(
+        "/api/vendor/trips/00000000-0000-0000-0000-000000000000",
+        HTTP_IF_NONE_MATCH="*",
+        **auth,
+    )
+    assert resp.status_code == 404
+
+
+@pytest.mark.django_db
+def test_vehicle_listing_etag(trip, auth):
+    client = Client()
+    resp = client.get("/api/vendor/vehicles/", **auth)
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+
+    assert (
+        client.get("/api/vendor/vehicles/", HTTP_IF_NONE_MATCH=etag, **auth).status_code
+        == 304
+    )
@@ -0,0 +1,57 @@
+import sys
+
+from django.test import override_settings
+from django.urls import URLResolver, path
+from django.urls.resolvers import RegexPattern
+from ninja import Router
+
+from engine.lazy_routers import LazyRouterAPI
+
+things = Router()
+parts = Router()
+things.add_router("/parts/", parts)
+eager_things = Router()
+
+
+@things.get("/{int:pk}")
+def get_thing(request, pk: int):
+    return {"pk": pk}
+
+
+@parts.get("/")
+def list_parts(request):
+    return []
+
+
+@eager_things.get("/")
+def list_eager_things(request):
+    return []
+
+
+class URLConf:
+    def __init__(self, api):
+        self.urlpatterns = [path("api/", api.urls)]
+
+
+def test_router_is_loaded_by_the_first_matching_request():
+    api = LazyRouterAPI(urls_namespace="lazy-routers-test")
+    api.add_lazy_router("/things/", f"{__name__}.things")
+    api.add_lazy_router("/missing/", "modules.does_not_exist.views.router")
+    resolver = URLResolver(RegexPattern(r"^/"), URLConf(api))
+    assert api.loaded_routers == []
+
+    match = resolver.resolve("/api/things/7")
+    assert match.kwargs == {"pk": 7}
+    assert match.route == "api/things/<int:pk>"
+    assert resolver.resolve("/api/things/parts/").route == "api/things/parts/"
+    assert api.loaded_routers == ["things/"]
+    assert "modules.does_not_exist" not in sys.modules
+
+
+@override_settings(API_LAZY_ROUTERS=False)
+def test_routers_load_with_the_urlconf_when_disabled():
+    api = LazyRouterAPI(urls_namespace="eager-routers-test")
+    api.add_lazy_router("/things/", f"{__name__}.eager_things")
+    URLConf(api)
+    assert api.loaded_routers == ["things/"]
+    assert "/api/things/" in api.get_openapi_schema(path_prefix="/api/")["paths"]
@@ -0,0 +1,91 @@
+import json
+import logging
+import sys
+
+from engine.log_handlers import JsonFormatter, QueuedFileHandler, RateLimitFilter
+
+
+def make_record(name="app", level=logging.INFO, msg="hello %s", args=("world",)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def test_rate_limit_drops_past_the_burst_and_reports_it(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("engine.log_handlers.time.monotonic", lambda: clock[0])
+    limit = RateLimitFilter(rate=1, burst=2)
+
+    assert [limit.filter(make_record()) for _ in range(4)] == [
+        True,
+        True,
+        False,
+        False,
+    ]
+    # Other loggers have their own bucket, errors always pass.
+    assert limit.filter(make_record(name="other"))
+    assert limit.filter(make_record(level=logging.ERROR))
+
+    clock[0] += 1
+    record = make_record()
+    assert limit.filter(record)
+    assert record.sampled_out == 2
+
+
+def test_rate_limit_decides_once_per_record():
+    limit = RateLimitFilter(rate=1, burst=1)
+    record = make_record()
+    assert limit.filter(record)
+    # A second handler with the same filter sees the same decision.
+    assert limit.filter(record)
+    assert not limit.filter(make_record())
+
+
+def test_json_formatter_includes_extra_fields():
+    record = make_record()
+    record.request_id = "abc"
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["message"] == "hello world"
+    assert entry["level"] == "INFO"
+    assert entry["request_id"] == "abc"
+
+
+def test_queued_file_handler_writes_json_lines(tmp_path):
+    path = tmp_path / "app.log"
+    handler = QueuedFileHandler(str(path))
+    handler.setFormatter(JsonFormatter())
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = make_record(level=logging.ERROR)
+        record.exc_info = sys.exc_info()
+        handler.handle(record)
+    handler.close()
+
+    (line,) = path.read_text().splitlines()
+    entry = json.loads(line)
+    assert entry["message"] == "hello world"
+    assert "ValueError: boom" in entry["exc_info"]
+
+
+def test_queued_file_handler_reopens_a_rotated_file(tmp_path):
+    path = tmp_path / "app.log"
+    handler = QueuedFileHandler(str(path))
+    handler.setFormatter(JsonFormatter())
+    handler.handle(make_record(args=("before",)))
+    handler.listener.stop()
+    # What logrotate does; the handler must not write to the moved file.
+    path.rename(tmp_path / "app.log.1")
+    handler._restart_listener()
+    handler.handle(make_record(args=("after",)))
+    handler.close()
+
+    assert "hello before" in (tmp_path / "app.log.1").read_text()
+    (line,) = path.read_text().splitlines()
+    assert json.loads(line)["message"] == "hello after"
+
+
+def test_processes_logging_to_the_console_build_no_file_handler(settings):
+    # dictConfig builds every configured handler; the suite must not open
+    # logs/django.log or start a listener thread.
+    assert "file" not in settings.LOGGING["handlers"]
+    handlers = logging.getLogger().handlers + logging.getLogger("django").handlers
+    assert not any(isinstance(handler, QueuedFileHandler) for handler in handlers)
@@ -0,0 +1,53 @@
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, override_settings
+from prometheus_client import REGISTRY
+
+from engine.metrics import MetricsMiddleware
+
+SEARCH_ROUTE = "api/vendor/trips/search"
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.django_db
+def test_requests_are_recorded_per_route():
+    labels = {"method": "GET", "route": SEARCH_ROUTE}
+    before_requests = sample("http_requests_total", status="200", **labels)
+    before_queries = sample("http_request_db_queries_sum", **labels)
+
+    assert Client().get("/api/vendor/trips/search").status_code == 200
+
+    assert sample("http_requests_total", status="200", **labels) == before_requests + 1
+    assert sample("http_request_db_queries_sum", **labels) > before_queries
+    assert sample("http_response_size_bytes_count", **labels) >= 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_requests_count_queries_run_in_threads():
+    async def view(request):
+        await sync_to_async(get_user_model().objects.count)()
+        return HttpResponse("ok")
+
+    labels = {"method": "GET", "route": "<unmatched>"}
+    before = sample("http_request_db_queries_sum", **labels)
+
+    async_to_sync(MetricsMiddleware(view))(RequestFactory().get("/"))
+
+    assert sample("http_request_db_queries_sum", **labels) == before + 1
+
+
+@pytest.mark.django_db
+@override_settings(INTERNAL_API_TOKEN="metrics-token")
+def test_metrics_endpoint_is_internal():
+    client = Client()
+    assert client.get("/metrics").status_code == 403
+
+    resp = client.get("/metrics", HTTP_X_INTERNAL_TOKEN="metrics-token")
+    assert resp.status_code == 200
+    assert resp["Content-Type"].startswith("text/plain")
+    assert b"http_request_duration_seconds_bucket" in resp.content
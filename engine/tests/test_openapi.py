@@ -0,0 +1,50 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.test import Client, override_settings
+
+from engine import openapi
+from engine.api import api
+
+
+@pytest.fixture(autouse=True)
+def schema_cache(monkeypatch):
+    monkeypatch.setattr(openapi, "_documents", {})
+
+
+@pytest.mark.django_db
+def test_schema_is_built_once_and_revalidated(monkeypatch):
+    calls = []
+    get_openapi_schema = api.get_openapi_schema
+
+    def counting(*args, **kwargs):
+        calls.append(kwargs)
+        return get_openapi_schema(*args, **kwargs)
+
+    monkeypatch.setattr(api, "get_openapi_schema", counting)
+    client = Client()
+    resp = client.get("/api/openapi.json")
+    assert resp.status_code == 200
+    assert "/api/vendor/trips/search" in resp.json()["paths"]
+    etag = resp.headers["ETag"]
+    assert "no-cache" in resp.headers["Cache-Control"]
+
+    resp = client.get("/api/openapi.json", HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 304
+    assert resp.headers["ETag"] == etag
+    assert client.get("/api/openapi.json").headers["ETag"] == etag
+    assert calls == [{"path_prefix": "/api/"}]
+
+
+@pytest.mark.django_db
+def test_pregenerated_file_is_served(tmp_path):
+    output = tmp_path / "openapi.json"
+    call_command("build_openapi", output=output)
+    schema = json.loads(output.read_bytes())
+    assert "/api/bookings/" in schema["paths"]
+
+    output.write_bytes(b'{"openapi": "3.1.0", "paths": {}}')
+    with override_settings(OPENAPI_SCHEMA_FILE=str(output)):
+        resp = Client().get("/api/openapi.json")
+    assert resp.content == b'{"openapi": "3.1.0", "paths": {}}'
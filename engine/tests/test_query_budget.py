@@ -0,0 +1,126 @@
+import logging
+from datetime import date, time, timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, override_settings
+from ninja_jwt.tokens import AccessToken
+
+from engine.query_budget import (
+    QueryBudgetExceeded,
+    QueryInspectionMiddleware,
+    assert_max_queries,
+    fingerprint,
+    query_budget,
+)
+from modules.bookings.models import Booking
+from modules.trips.models import Trip, Vehicle, VehicleType
+
+
+def count_users(n):
+    User = get_user_model()
+    for i in range(n):
+        User.objects.filter(email=f"user{i}@example.com").exists()
+
+
+def test_fingerprint_collapses_literals():
+    a = fingerprint("SELECT * FROM t WHERE id = 1 AND name = 'a''b'")
+    b = fingerprint("SELECT  *  FROM t WHERE id = 22 AND name = 'c'")
+    assert a == b == "SELECT * FROM t WHERE id = ? AND name = ?"
+    assert fingerprint("SELECT * FROM t WHERE id IN (%s, %s)") == fingerprint(
+        "SELECT * FROM t WHERE id IN (%s, %s, %s)"
+    )
+
+
+@pytest.mark.django_db
+def test_assert_max_queries_flags_repeated_shapes():
+    with assert_max_queries(repeat_threshold=3):
+        count_users(2)
+
+    with pytest.raises(QueryBudgetExceeded, match="3x SELECT"):
+        with assert_max_queries(repeat_threshold=3):
+            count_users(3)
+
+
+@pytest.mark.django_db
+def test_assert_max_queries_enforces_limit():
+    with pytest.raises(QueryBudgetExceeded, match="2 queries, budget is 1"):
+        with assert_max_queries(1, repeat_threshold=10):
+            count_users(2)
+
+
+@pytest.mark.django_db
+def test_savepoints_are_not_counted():
+    with assert_max_queries(1):
+        with transaction.atomic():
+            count_users(1)
+
+
+@pytest.mark.django_db
+@override_settings(QUERY_INSPECTION="raise")
+def test_middleware_raises_over_view_budget():
+    @query_budget(1)
+    def view(request):
+        count_users(2)
+        return HttpResponse("ok")
+
+    middleware = QueryInspectionMiddleware(view)
+    with pytest.raises(QueryBudgetExceeded, match="GET /: 2 queries, budget is 1"):
+        middleware(RequestFactory().get("/"))
+
+
+@pytest.mark.django_db
+@override_settings(QUERY_INSPECTION="log", QUERY_INSPECTION_SAMPLE_RATE=1.0)
+def test_middleware_logs_in_log_mode(caplog):
+    @query_budget(1)
+    def view(request):
+        count_users(2)
+        return HttpResponse("ok")
+
+    with caplog.at_level(logging.WARNING, logger="engine.query_budget"):
+        resp = QueryInspectionMiddleware(view)(RequestFactory().get("/"))
+
+    assert resp.status_code == 200
+    (record,) = caplog.records
+    assert record.queries == 2
+    assert record.query_budget == 1
+
+
+@pytest.mark.django_db
+def test_my_bookings_loads_trips_in_one_query(USER):
+    vendor = USER.objects.create_user(
+        email="vendor@example.com", password="Password1!", role="vendor"
+    )
+    corper = USER.objects.create_user(
+        email="corper@example.com", password="Password1!", role="corper"
+    )
+    vehicle = Vehicle.objects.create(
+        vendor=vendor,
+        registration_number="ABC123",
+        vehicle_type=VehicleType.objects.create(name="bus"),
+        make_model="Toyota Hiace",
+        capacity=14,
+    )
+    for _ in range(8):
+        trip = Trip.objects.create(
+            vendor=vendor,
+            vehicle=vehicle,
+            departure_city="Ajah",
+            departure_state="Lagos",
+            destination_camp="Abuja",
+            departure_date=date.today() + timedelta(days=1),
+            departure_time=time(8, 0),
+            price_per_seat=5000,
+            available_seats=10,
+        )
+        Booking.objects.create(user=corper, trip=trip)
+
+    # The middleware runs in raise mode under the test suite.
+    resp = Client().get(
+        "/api/bookings/",
+        HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(corper)}",
+    )
+    assert resp.status_code == 200
+    assert len(resp.json()) == 8
@@ -0,0 +1,34 @@
+import json
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from ninja.renderers import JSONRenderer
+
+from engine.renderers import ORJSONRenderer
+
+
+def render(renderer, data):
+    return json.loads(renderer.render(None, data, response_status=200))
+
+
+def test_orjson_renders_trip_field_types():
+    data = {
+        "id": UUID("12345678-1234-5678-1234-567812345678"),
+        "price_per_seat": Decimal("5000.50"),
+        "departure_date": date(2026, 1, 2),
+        "departure_time": time(8, 30),
+        "created_at": datetime(2026, 1, 2, 8, 30, tzinfo=timezone.utc),
+    }
+    assert render(ORJSONRenderer(), data) == {
+        "id": "12345678-1234-5678-1234-567812345678",
+        "price_per_seat": "5000.50",
+        "departure_date": "2026-01-02",
+        "departure_time": "08:30:00",
+        "created_at": "2026-01-02T08:30:00Z",
+    }
+
+
+def test_orjson_matches_stdlib_renderer():
+    data = [{"price": Decimal("1.10"), "seats": 3, "tags": ["a"], "note": None}]
+    assert render(ORJSONRenderer(), data) == render(JSONRenderer(), data)
@@ -0,0 +1,180 @@
+import asyncio
+import datetime
+import threading
+import uuid
+
+import orjson
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+
+from engine.pubsub import hub
+from engine.seat_events import SeatEvents
+from modules.bookings.schemas import BookingIn
+from modules.bookings.services.booking_service import (
+    cancel_booking_service,
+    create_booking_service,
+)
+from modules.trips.models import Trip, Vehicle, VehicleType
+from modules.trips.schemas import TripIn
+from modules.trips.services.trip_services import TripService
+
+
+async def django_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 204, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+app = SeatEvents(django_app)
+
+
+class Stream:
+    """Drives ``app`` for one request and hands out what it sends."""
+
+    def __init__(self, path, method="GET"):
+        scope = {"type": "http", "method": method, "path": path, "headers": []}
+        self.sent = asyncio.Queue()
+        self.disconnected = asyncio.Event()
+        self.task = asyncio.ensure_future(app(scope, self.receive, self.sent.put))
+
+    async def receive(self):
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def next(self):
+        return await asyncio.wait_for(self.sent.get(), 5)
+
+    async def event(self):
+        body = (await self.next())["body"].decode()
+        name, data = body.strip().split("\n")
+        return name.removeprefix("event: "), orjson.loads(data.removeprefix("data: "))
+
+
+@pytest.fixture
+def vendor(USER):
+    return USER.objects.create_user(
+        email="vendor@example.com", password="Password1!", role="vendor"
+    )
+
+
+@pytest.fixture
+def trip(vendor):
+    vehicle = Vehicle.objects.create(
+        vendor=vendor,
+        registration_number="SEAT-001",
+        vehicle_type=VehicleType.objects.create(name="Bus"),
+        make_model="Toyota Hiace 2020",
+        capacity=14,
+    )
+    return Trip.objects.create(
+        vendor=vendor,
+        vehicle=vehicle,
+        departure_state="Lagos",
+        departure_city="Ikeja",
+        destination_camp="NYSC Camp Iseyin",
+        departure_date=datetime.date.today() + datetime.timedelta(days=3),
+        departure_time=datetime.time(8, 0),
+        price_per_seat=5000,
+        available_seats=14,
+    )
+
+
+def cancel_trip(vendor, trip):
+    data = TripIn(
+        vehicle_id=trip.vehicle_id,
+        departure_city=trip.departure_city,
+        departure_state=trip.departure_state,
+        destination_camp=trip.destination_camp,
+        departure_date=trip.departure_date,
+        departure_time=trip.departure_time,
+        price_per_seat=trip.price_per_seat,
+        available_seats=trip.available_seats,
+        status="cancelled",
+    )
+    TripService().update_trip(vendor, trip.pk, data)
+
+
+def test_hub_delivers_from_other_threads():
+    async def scenario():
+        with hub.subscription("topic") as queue:
+            thread = threading.Thread(target=hub.deliver, args=("topic", {"n": 1}))
+            thread.start()
+            thread.join()
+            assert await asyncio.wait_for(queue.get(), 5) == {"n": 1}
+        assert hub.deliver("topic", {"n": 2}) == 0
+
+    async_to_sync(scenario)()
+
+
+def test_slow_subscribers_keep_the_latest_messages(monkeypatch):
+    monkeypatch.setattr("engine.pubsub.QUEUE_SIZE", 2)
+
+    async def scenario():
+        with hub.subscription("topic") as queue:
+            for n in range(5):
+                hub.deliver("topic", n)
+            await asyncio.sleep(0)
+            return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    assert async_to_sync(scenario)() == [3, 4]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stream_follows_bookings_until_the_trip_is_cancelled(USER, vendor, trip):
+    corper = USER.objects.create_user(
+        email="corper@example.com", password="Password1!", role="corper"
+    )
+
+    async def scenario():
+        stream = Stream(f"/events/trips/{trip.pk}/seats")
+        start = await stream.next()
+        assert start["status"] == 200
+        assert (b"content-type", b"text/event-stream") in start["headers"]
+        assert await stream.event() == (
+            "seats",
+            {"trip_id": str(trip.pk), "capacity": 14, "available": 14, "taken": []},
+        )
+
+        booking = await sync_to_async(create_booking_service)(
+            corper, BookingIn(trip_id=trip.pk, seat_numbers=[3, 4])
+        )
+        name, seats = await stream.event()
+        assert (name, seats["available"], seats["taken"]) == ("seats", 12, [3, 4])
+
+        await sync_to_async(cancel_booking_service)(corper, booking.pk)
+        name, seats = await stream.event()
+        assert (name, seats["available"], seats["taken"]) == ("seats", 14, [])
+
+        await sync_to_async(cancel_trip)(vendor, trip)
+        assert await stream.event() == (
+            "closed",
+            {"trip_id": str(trip.pk), "status": "cancelled"},
+        )
+        await asyncio.wait_for(stream.task, 5)
+
+    async_to_sync(scenario)()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stream_ends_when_the_client_leaves(trip):
+    async def scenario():
+        stream = Stream(f"/events/trips/{trip.pk}/seats")
+        await stream.next()
+        await stream.next()
+        stream.disconnected.set()
+        await asyncio.wait_for(stream.task, 5)
+        assert hub.deliver(f"trip-seats:{trip.pk}", {"taken": []}) == 0
+
+    async_to_sync(scenario)()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_unknown_trips_and_other_paths():
+    async def scenario():
+        missing = Stream(f"/events/trips/{uuid.uuid4()}/seats")
+        assert (await missing.next())["status"] == 404
+        other = Stream("/api/trips/")
+        assert (await other.next())["status"] == 204
+        post = Stream(f"/events/trips/{uuid.uuid4()}/seats", method="POST")
+        assert (await post.next())["status"] == 405
+
+    async_to_sync(scenario)()
@@ -15,11 +15,14 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.http import JsonResponse
 from django.urls import path
 
 from .api import api
+from .views import db_pool_stats, metrics, openapi_json
 
 
 def testnet(request):
@@ -29,5 +32,15 @@ def testnet(request):
 urlpatterns = [
     path("", testnet),
     path("admin/", admin.site.urls),
+    # Ahead of api.urls, so it replaces Ninja's view, which rebuilds the
+    # schema on every request.
+    path("api/openapi.json", openapi_json),
     path("api/", api.urls),
+    path("internal/db-pool/", db_pool_stats),
+    path("metrics", metrics),
 ]
+
+# Uploads on local disk, in development only (empty unless DEBUG); serve
+# MEDIA_ROOT from the proxy or use a storage backend with its own URLs in
+# production.
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,30 @@
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from .api import api
+from .database import pool_stats
+from .internal import internal_view
+from .metrics import render_metrics
+from .openapi import schema_document
+
+
+@internal_view
+def db_pool_stats(request):
+    return JsonResponse(pool_stats())
+
+
+@internal_view
+def metrics(request):
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE_LATEST)
+
+
+def openapi_json(request):
+    content, etag = schema_document(api)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(content, content_type=api.renderer.media_type)
+    response["ETag"] = etag
+    # The document only changes with a deploy, but clients must revalidate.
+    patch_cache_control(response, public=True, no_cache=True)
+    return response
@@ -1,5 +1,14 @@
 from django.contrib import admin
 
+from engine.admin import LargeTableAdmin
+
 from .models import User
 
-admin.site.register(User)
+
+@admin.register(User)
+class UserAdmin(LargeTableAdmin):
+    list_display = ("email", "full_name", "role", "is_active", "is_staff")
+    list_filter = ("role", "is_active", "is_staff")
+    # Prefix matches on unique columns, which Postgres serves from their
+    # index; a plain search would scan the table for LIKE '%term%'.
+    search_fields = ("email__startswith", "phone__startswith")
@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class AuthenticatorConfig(AppConfig):
     name = "modules.authenticator"
+
+    def ready(self):
+        from . import signals
+
+        _ = signals
@@ -1,5 +1,6 @@
 # permissions.py
 from functools import wraps
+from inspect import iscoroutinefunction
 
 from django.contrib.auth import get_user_model
 from ninja.errors import HttpError
@@ -7,29 +8,45 @@ from ninja.errors import HttpError
 User = get_user_model()
 
 
-def corper_required(func):
-    @wraps(func)
-    def wrapper(request, *args, **kwargs):
-        if not hasattr(request, "user") or not request.user.is_authenticated:
-            raise HttpError(401, "Authentication required")
+def _check_corper(request):
+    if not hasattr(request, "user") or not request.user.is_authenticated:
+        raise HttpError(401, "Authentication required")
 
-        if request.user.role != "corper":
-            raise HttpError(403, "Only corpers are allowed here")
+    if request.user.role != "corper":
+        raise HttpError(403, "Only corpers are allowed here")
 
-        return func(request, *args, **kwargs)
 
-    return wrapper
+def _check_vendor(request):
+    if not request.user.is_authenticated:
+        raise HttpError(401, "Authentication required")
 
+    if request.user.role != "vendor":
+        raise HttpError(403, "Only vendors are allowed here")
 
-def vendor_required(func):
-    @wraps(func)
-    def wrapper(request, *args, **kwargs):
-        if not request.user.is_authenticated:
-            raise HttpError(401, "Authentication required")
 
-        if request.user.role != "vendor":
-            raise HttpError(403, "Only vendors are allowed here")
+def _role_required(check, func):
+    # Ninja inspects the view to decide between a sync and async operation,
+    # so async views need an async wrapper.
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(request, *args, **kwargs):
+            check(request)
+            return await func(request, *args, **kwargs)
 
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(request, *args, **kwargs):
+        check(request)
         return func(request, *args, **kwargs)
 
     return wrapper
+
+
+def corper_required(func):
+    return _role_required(_check_corper, func)
+
+
+def vendor_required(func):
+    return _role_required(_check_vendor, func)
@@ -1,14 +1,17 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from ninja.errors import HttpError
 
 from modules.authenticator.schema import UserOutSchema
+from modules.authenticator.utils.snapshot import user_snapshot_key
 from modules.corper.schemas import CorperProfileOut
 from modules.vendor.schemas import VendorProfileOut
 
+User = get_user_model()
 
-def get_current_user_service(user):
-    if not user:
-        raise HttpError(401, "Authentication required")
 
+def build_user_snapshot(user) -> UserOutSchema:
     corper_profile = None
     vendor_profile = None
 
@@ -36,6 +39,7 @@ def get_current_user_service(user):
                 verification_status=vendor.verification_status,
                 rejection_reason=vendor.rejection_reason,
                 rating_average=vendor.rating_average,
+                rating_count=vendor.rating_count,
             )
 
     return UserOutSchema(
@@ -49,3 +53,33 @@ def get_current_user_service(user):
         corper_profile=corper_profile,
         vendor_profile=vendor_profile,
     )
+
+
+def get_current_user_service(user) -> str:
+    """
+    Return the serialized profile snapshot for the authenticated user.
+
+    The JSON document is cached per user after the first build and dropped
+    by the authenticator signals whenever the user or one of its profiles is
+    saved, so repeat calls skip both the ORM and pydantic validation.
+    `user` may be a model instance or a stateless token user; only its id is
+    used on a cache hit.
+    """
+    if not user:
+        raise HttpError(401, "Authentication required")
+
+    key = user_snapshot_key(user.id)
+    snapshot = cache.get(key)
+    if snapshot is not None:
+        return snapshot
+
+    try:
+        db_user = User.objects.select_related("corper_profile", "vendor_profile").get(
+            pk=user.id, is_active=True
+        )
+    except User.DoesNotExist:
+        raise HttpError(401, "Authentication required")
+
+    snapshot = build_user_snapshot(db_user).model_dump_json()
+    cache.set(key, snapshot, settings.USER_SNAPSHOT_TTL)
+    return snapshot
@@ -0,0 +1,23 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from modules.authenticator.utils.snapshot import invalidate_user_snapshot
+from modules.corper.models import CorperProfile
+from modules.vendor.models import Vendor
+
+User = get_user_model()
+
+
+@receiver(signal=post_save, sender=User)
+@receiver(signal=post_delete, sender=User)
+def invalidate_user_snapshot_on_user_change(sender, instance, **kwargs):
+    invalidate_user_snapshot(instance.pk)
+
+
+@receiver(signal=post_save, sender=CorperProfile)
+@receiver(signal=post_delete, sender=CorperProfile)
+@receiver(signal=post_save, sender=Vendor)
+@receiver(signal=post_delete, sender=Vendor)
+def invalidate_user_snapshot_on_profile_change(sender, instance, **kwargs):
+    invalidate_user_snapshot(instance.user_id)
@@ -1,4 +1,5 @@
 import pytest
+from asgiref.sync import async_to_sync
 from django.contrib.auth.models import AnonymousUser
 from ninja.errors import HttpError
 
@@ -107,3 +108,26 @@ def test_vendor_required_allows_vendor(USER):
     )
     request = Request(user=user)
     assert view(request) == "ok"
+
+
+@pytest.mark.django_db
+def test_role_required_wraps_async_views(USER):
+    from inspect import iscoroutinefunction
+
+    @corper_required
+    async def view(request):
+        return "ok"
+
+    assert iscoroutinefunction(view)
+
+    corper = USER.objects.create_user(
+        email="corper3@example.com", password="pass", role="corper"
+    )
+    vendor = USER.objects.create_user(
+        email="vendor3@example.com", password="pass", role="vendor"
+    )
+    assert async_to_sync(view)(Request(user=corper)) == "ok"
+
+    with pytest.raises(HttpError) as exc:
+        async_to_sync(view)(Request(user=vendor))
+    assert exc.value.status_code == 403
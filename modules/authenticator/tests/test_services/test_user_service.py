@@ -0,0 +1,116 @@
+import json
+from datetime import date
+
+import pytest
+from django.core.cache import cache
+from ninja.errors import HttpError
+
+from modules.authenticator.services.user_service import (
+    get_current_user_service,
+    user_snapshot_key,
+)
+from modules.corper.models import CorperProfile
+from modules.vendor.models import Vendor
+
+
+@pytest.fixture
+def corper(USER):
+    user = USER.objects.create_user(
+        email="corper@example.com",
+        password="Password1!",
+        is_active=True,
+        role="corper",
+        full_name="Test Corper",
+    )
+    CorperProfile.objects.create(
+        user=user,
+        phone="08012345678",
+        state_code="LA/24A/1234",
+        call_up_number="NYSC/LAG/2024/123456",
+        deployment_state="Lagos",
+        camp_location="Iyana-Ipaja",
+        deployment_date=date(2024, 5, 1),
+    )
+    return user
+
+
+@pytest.mark.django_db
+def test_current_user_snapshot_is_cached(corper, django_assert_num_queries):
+    first = get_current_user_service(corper)
+    data = json.loads(first)
+    assert data["email"] == "corper@example.com"
+    assert data["corper_profile"]["camp_location"] == "Iyana-Ipaja"
+    assert data["vendor_profile"] is None
+
+    with django_assert_num_queries(0):
+        assert get_current_user_service(corper) == first
+
+
+@pytest.mark.django_db
+def test_current_user_snapshot_invalidated_on_user_save(corper):
+    get_current_user_service(corper)
+
+    corper.full_name = "Renamed Corper"
+    corper.save(update_fields=["full_name"])
+
+    assert cache.get(user_snapshot_key(corper.id)) is None
+    assert json.loads(get_current_user_service(corper))["full_name"] == (
+        "Renamed Corper"
+    )
+
+
+@pytest.mark.django_db
+def test_current_user_snapshot_invalidated_on_corper_profile_save(corper):
+    get_current_user_service(corper)
+
+    profile = CorperProfile.objects.get(user=corper)
+    profile.camp_location = "Kubwa"
+    profile.save()
+
+    data = json.loads(get_current_user_service(corper))
+    assert data["corper_profile"]["camp_location"] == "Kubwa"
+
+
+@pytest.mark.django_db
+def test_current_user_snapshot_invalidated_on_vendor_save(USER):
+    user = USER.objects.create_user(
+        email="vendor@example.com",
+        password="Password1!",
+        is_active=True,
+        role="vendor",
+        full_name="Test Vendor",
+    )
+    vendor = Vendor.objects.create(
+        user=user,
+        phone="08012345678",
+        business_name="Acme Ltd",
+        business_registration_number="BRN12345",
+        years_in_operation=5,
+    )
+    get_current_user_service(user)
+
+    vendor.business_name = "Acme Transport"
+    vendor.save()
+
+    data = json.loads(get_current_user_service(user))
+    assert data["vendor_profile"]["business_name"] == "Acme Transport"
+
+
+@pytest.mark.django_db
+def test_current_user_snapshot_rejects_inactive_user(USER):
+    user = USER.objects.create_user(
+        email="inactive@example.com",
+        password="Password1!",
+        is_active=False,
+        role="corper",
+    )
+
+    with pytest.raises(HttpError) as exc_info:
+        get_current_user_service(user)
+    assert exc_info.value.status_code == 401
+
+
+def test_current_user_requires_user():
+    with pytest.raises(HttpError) as exc_info:
+        get_current_user_service(None)
+    assert exc_info.value.status_code == 401
@@ -0,0 +1,11 @@
+from django.core.cache import cache
+
+USER_SNAPSHOT_KEY = "auth:user-snapshot:{user_id}"
+
+
+def user_snapshot_key(user_id) -> str:
+    return USER_SNAPSHOT_KEY.format(user_id=user_id)
+
+
+def invalidate_user_snapshot(user_id):
+    cache.delete(user_snapshot_key(user_id))
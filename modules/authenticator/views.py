@@ -1,7 +1,9 @@
 from django.contrib.auth import get_user_model
+from django.http import HttpResponse
 from ninja import Router
-from ninja_jwt.authentication import JWTAuth
+from ninja_jwt.authentication import JWTAuth, JWTTokenUserAuth
 
+from engine.query_budget import query_budget
 from modules.authenticator.services.auth_service import (
     forgot_password_service,
     login_service,
@@ -30,6 +32,7 @@ router = Router(tags=["Auth"])
 
 User = get_user_model()
 jwt_auth = JWTAuth()
+token_user_auth = JWTTokenUserAuth()
 
 
 @router.post("/corper/register", auth=None)
@@ -62,9 +65,14 @@ def resend_otp_endpoint(request, data: ResendOTPSchema):
     return resend_otp_service(data)
 
 
-@router.get("/user/me", response=UserOutSchema, auth=jwt_auth)
+@router.get("/user/me", response=UserOutSchema, auth=token_user_auth)
+@query_budget(1)
 def get_current_user(request):
-    return get_current_user_service(request.auth)
+    # The snapshot is already serialized; returning it as-is skips response
+    # validation. Stateless auth avoids the per-request user lookup.
+    return HttpResponse(
+        get_current_user_service(request.auth), content_type="application/json"
+    )
 
 
 @router.post("/forgot-password", auth=None)
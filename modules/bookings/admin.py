@@ -1 +1,23 @@
-# Register your models here.
+from django.contrib import admin
+
+from engine.admin import LargeTableAdmin
+
+from .models import Booking
+
+
+@admin.register(Booking)
+class BookingAdmin(LargeTableAdmin):
+    list_display = (
+        "__str__",
+        "booking_status",
+        "payment_status",
+        "selected_seats",
+        "total_price",
+        "booked_at",
+    )
+    list_filter = ("booking_status", "payment_status")
+    # Booking.__str__ shows the user and the trip.
+    list_select_related = ("user", "trip")
+    date_hierarchy = "booked_at"
+    search_fields = ("user__email__startswith",)
+    raw_id_fields = ("user", "trip", "group")
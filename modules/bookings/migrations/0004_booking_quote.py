@@ -0,0 +1,40 @@
+# Generated by Django 5.2 on 2026-10-19 07:10
+
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bookings", "0003_remove_booking_payment_reference"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="booking",
+            name="early_bird_discount",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="booking",
+            name="group_discount",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+        migrations.AddField(
+            model_name="booking",
+            name="quoted_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="booking",
+            name="total_price",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=10
+            ),
+        ),
+    ]
@@ -0,0 +1,52 @@
+from decimal import Decimal
+
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+
+def _quote(booking):
+    """The pricing of modules/bookings/services/pricing_service.py as of the
+    booking date, copied so the migration doesn't change with it."""
+    trip = booking.trip
+    seats = booking.selected_seats
+    base = int(trip.price_per_seat * 100) * seats
+    early_bird = trip.early_bird_discount_percentage
+    deadline = trip.early_bird_deadline
+    if deadline is not None and deadline < booking.booked_at.date():
+        early_bird = 0
+    group = trip.group_discount_percentage if seats > 1 else 0
+    total = (base * (100 - min(early_bird + group, 100)) + 50) // 100
+    early_bird_off = min((base * early_bird + 50) // 100, base - total)
+    group_off = base - total - early_bird_off
+    return [Decimal(kobo).scaleb(-2) for kobo in (total, early_bird_off, group_off)]
+
+
+def backfill_quotes(apps, schema_editor):
+    Booking = apps.get_model("bookings", "Booking")
+    pending = Booking.objects.filter(quoted_at__isnull=True).select_related("trip")
+    while True:
+        batch = list(pending.order_by("pk")[:BATCH_SIZE])
+        if not batch:
+            return
+        for booking in batch:
+            (
+                booking.total_price,
+                booking.early_bird_discount,
+                booking.group_discount,
+            ) = _quote(booking)
+            booking.quoted_at = booking.booked_at
+        Booking.objects.bulk_update(
+            batch,
+            ["total_price", "early_bird_discount", "group_discount", "quoted_at"],
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bookings", "0004_booking_quote"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_quotes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-19 07:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bookings", "0005_backfill_booking_quotes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="booking",
+            name="seat_map",
+            field=models.BinaryField(
+                blank=True,
+                default=bytes,
+                help_text="The seats held, in the layout of Trip.seat_map",
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+
+def _map(bits, capacity):
+    return bits.to_bytes((capacity + 7) // 8, "little")
+
+
+def backfill_seat_maps(apps, schema_editor):
+    """Size every trip's seat map from its vehicle and give the pending and
+    confirmed bookings on it the lowest seats, in booking order. Seats past
+    the vehicle's capacity (overbooked trips) are not assigned."""
+    Trip = apps.get_model("trips", "Trip")
+    Booking = apps.get_model("bookings", "Booking")
+    trips = Trip.objects.select_related("vehicle").order_by("pk")
+    last = None
+    while True:
+        batch = list((trips.filter(pk__gt=last) if last else trips)[:BATCH_SIZE])
+        if not batch:
+            return
+        last = batch[-1].pk
+        bookings = defaultdict(list)
+        for booking in Booking.objects.filter(
+            trip__in=batch, booking_status__in=["pending", "confirmed"]
+        ).order_by("booked_at"):
+            bookings[booking.trip_id].append(booking)
+
+        updated = []
+        for trip in batch:
+            capacity = trip.vehicle.capacity
+            next_seat = 0
+            for booking in bookings[trip.pk]:
+                seats = range(
+                    next_seat, min(next_seat + booking.selected_seats, capacity)
+                )
+                next_seat += booking.selected_seats
+                booking.seat_map = _map(sum(1 << n for n in seats), capacity)
+                updated.append(booking)
+            trip.seat_map = _map((1 << min(next_seat, capacity)) - 1, capacity)
+        Trip.objects.bulk_update(batch, ["seat_map"])
+        Booking.objects.bulk_update(updated, ["seat_map"], batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bookings", "0006_seat_map"),
+        ("trips", "0004_seat_map"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_seat_maps, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.2 on 2026-10-19 07:21
+
+import uuid
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bookings", "0007_backfill_seat_maps"),
+        ("trips", "0004_seat_map"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="booking",
+            name="passenger_email",
+            field=models.EmailField(blank=True, max_length=254),
+        ),
+        migrations.AddField(
+            model_name="booking",
+            name="passenger_name",
+            field=models.CharField(blank=True, max_length=150),
+        ),
+        migrations.CreateModel(
+            name="GroupBooking",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("total_price", models.DecimalField(decimal_places=2, max_digits=10)),
+                (
+                    "early_bird_discount",
+                    models.DecimalField(decimal_places=2, max_digits=10),
+                ),
+                (
+                    "group_discount",
+                    models.DecimalField(decimal_places=2, max_digits=10),
+                ),
+                ("quoted_at", models.DateTimeField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "organizer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="group_bookings",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "trip",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="group_bookings",
+                        to="trips.trip",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "group_bookings",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.AddField(
+            model_name="booking",
+            name="group",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="members",
+                to="bookings.groupbooking",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-19 07:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bookings", "0008_group_booking"),
+        ("trips", "0004_seat_map"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["booked_at"], name="bookings_booked__048930_idx"
+            ),
+        ),
+    ]
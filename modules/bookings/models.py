@@ -3,8 +3,46 @@ from decimal import Decimal
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 from modules.trips.models import Trip
+from modules.trips.services import seat_service
+
+from .services.pricing_service import quote
+
+
+class GroupBooking(models.Model):
+    """Seats for several passengers on one trip, booked together.
+
+    Every passenger gets a member ``Booking`` holding one seat and an even
+    share of the group's quote, so each share is paid separately.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    organizer = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="group_bookings",
+    )
+
+    trip = models.ForeignKey(
+        Trip, on_delete=models.PROTECT, related_name="group_bookings"
+    )
+
+    total_price = models.DecimalField(max_digits=10, decimal_places=2)
+    early_bird_discount = models.DecimalField(max_digits=10, decimal_places=2)
+    group_discount = models.DecimalField(max_digits=10, decimal_places=2)
+    quoted_at = models.DateTimeField()
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "group_bookings"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Group of {self.organizer} → {self.trip}"
 
 
 class Booking(models.Model):
@@ -33,9 +71,26 @@ class Booking(models.Model):
 
     trip = models.ForeignKey(Trip, on_delete=models.PROTECT, related_name="bookings")
 
+    group = models.ForeignKey(
+        GroupBooking,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="members",
+    )
+    # The traveller when it isn't ``user``: a guest in a group booking, for
+    # whom the organizer books and pays.
+    passenger_name = models.CharField(max_length=150, blank=True)
+    passenger_email = models.EmailField(blank=True)
+
     selected_seats = models.PositiveSmallIntegerField(
         default=1, help_text="Number of seats selected"
     )
+    seat_map = models.BinaryField(
+        default=bytes,
+        blank=True,
+        help_text="The seats held, in the layout of Trip.seat_map",
+    )
 
     booking_status = models.CharField(
         max_length=20, choices=STATUS_CHOICES, default="pending"
@@ -59,6 +114,19 @@ class Booking(models.Model):
 
     notes = models.TextField(blank=True)
 
+    # The quote the booking was made at, frozen so that a later price change
+    # on the trip doesn't move it, see apply_quote().
+    total_price = models.DecimalField(
+        max_digits=10, decimal_places=2, default=Decimal("0.00")
+    )
+    early_bird_discount = models.DecimalField(
+        max_digits=10, decimal_places=2, default=Decimal("0.00")
+    )
+    group_discount = models.DecimalField(
+        max_digits=10, decimal_places=2, default=Decimal("0.00")
+    )
+    quoted_at = models.DateTimeField(null=True, blank=True)
+
     class Meta:
         db_table = "bookings"
         ordering = ["-booked_at"]
@@ -66,39 +134,33 @@ class Booking(models.Model):
             models.Index(fields=["user", "trip"]),
             models.Index(fields=["booking_status", "payment_status"]),
             models.Index(fields=["trip", "booking_status"]),
+            # The admin's default ordering and date hierarchy.
+            models.Index(fields=["booked_at"]),
         ]
 
     def __str__(self):
         return f"{self.user.full_name} → {self.trip} ({self.booking_status})"
 
     @property
-    def total_price(self) -> Decimal:
-        """
-        Calculate the total price after applying early bird and group discounts.
-
-        Discounts are applied additively on the base amount:
-        - Early bird discount: applied if the deadline has not expired and percentage > 0.
-        - Group discount: applied if more than 1 seat is selected and percentage > 0.
+    def seat_numbers(self) -> list:
+        return seat_service.seat_numbers(self.seat_map)
 
-        Returns:
-            Decimal: The final discounted price, minimum of 0.00.
+    def apply_quote(self, price=None, quoted_at=None):
         """
-        if not self.trip:
-            return Decimal(0)
+        Freeze a quote onto the booking; the trip's current one by default.
 
-        base_amount = self.selected_seats * self.trip.price_per_seat
-        discount = Decimal(0)
-
-        if (
-            self.trip.early_bird_discount_percentage > 0
-            and not self.trip.early_bird_deadline_expired
-        ):
-            discount += base_amount * self.trip.early_bird_discount_rate
-
-        if self.selected_seats > 1 and self.trip.group_discount_percentage > 0:
-            discount += base_amount * self.trip.group_discount_rate
-
-        return max(base_amount - discount, Decimal(0))
+        Args:
+            price: A ``Quote`` from modules/bookings/services/pricing_service.py.
+            quoted_at: When the price was quoted, defaults to now.
+        """
+        price = price or quote(self.trip, self.selected_seats)
+        self.total_price = price.total_price
+        self.early_bird_discount = price.early_bird_discount
+        self.group_discount = price.group_discount
+        self.quoted_at = quoted_at or timezone.now()
 
     def save(self, *args, **kwargs):
+        # bulk_create() skips this; callers freeze the quote themselves.
+        if self._state.adding and self.quoted_at is None:
+            self.apply_quote()
         super().save(*args, **kwargs)
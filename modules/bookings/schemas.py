@@ -1,20 +1,106 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
+from typing import Optional
 
 from ninja import Schema
+from pydantic import EmailStr, Field, model_validator
+
+# Lines per quote request; trips are loaded with one IN query.
+MAX_QUOTE_LINES = 200
+MAX_GROUP_SIZE = 30
 
 
 class BookingIn(Schema):
     trip_id: uuid.UUID
-    selected_seats: int = 1
+    selected_seats: int = Field(1, ge=1)
+    # Specific seats; the lowest free ones are assigned when omitted.
+    seat_numbers: Optional[list[int]] = Field(None, min_length=1)
+
+    @model_validator(mode="after")
+    def seats_match(self):
+        if self.seat_numbers is None:
+            return self
+        if len(set(self.seat_numbers)) != len(self.seat_numbers):
+            raise ValueError("Seat numbers must be unique")
+        if "selected_seats" not in self.model_fields_set:
+            self.selected_seats = len(self.seat_numbers)
+        elif self.selected_seats != len(self.seat_numbers):
+            raise ValueError("selected_seats must match the number of seat_numbers")
+        return self
 
 
 class BookingOut(Schema):
     id: uuid.UUID
     trip_id: uuid.UUID
     selected_seats: int
+    seat_numbers: list[int] = []
     total_price: Decimal
     booking_status: str
     payment_status: str
     booked_at: datetime
+
+
+class QuoteLineIn(Schema):
+    trip_id: uuid.UUID
+    seats: int = Field(1, ge=1)
+    as_of: Optional[date] = None
+
+
+class QuoteIn(Schema):
+    lines: list[QuoteLineIn] = Field(min_length=1, max_length=MAX_QUOTE_LINES)
+
+
+class QuoteOut(Schema):
+    trip_id: uuid.UUID
+    seats: int
+    as_of: date
+    base_price: Decimal
+    early_bird_discount: Decimal
+    group_discount: Decimal
+    total_price: Decimal
+
+
+class PassengerIn(Schema):
+    full_name: str = Field(min_length=1, max_length=150)
+    # Passengers with an account are matched by email; the rest are guests.
+    email: Optional[EmailStr] = None
+    seat_number: Optional[int] = None
+
+
+class GroupBookingIn(Schema):
+    trip_id: uuid.UUID
+    passengers: list[PassengerIn] = Field(min_length=2, max_length=MAX_GROUP_SIZE)
+
+    @model_validator(mode="after")
+    def passengers_are_distinct(self):
+        emails = [p.email.lower() for p in self.passengers if p.email]
+        if len(set(emails)) != len(emails):
+            raise ValueError("Passenger emails must be unique")
+        seats = [p.seat_number for p in self.passengers if p.seat_number is not None]
+        if seats and len(seats) != len(self.passengers):
+            raise ValueError("Choose a seat for every passenger or for none")
+        if len(set(seats)) != len(seats):
+            raise ValueError("Seat numbers must be unique")
+        return self
+
+
+class GroupMemberOut(Schema):
+    id: uuid.UUID
+    user_id: uuid.UUID
+    passenger_name: str
+    passenger_email: str
+    seat_numbers: list[int]
+    total_price: Decimal
+    booking_status: str
+    payment_status: str
+
+
+class GroupBookingOut(Schema):
+    id: uuid.UUID
+    trip_id: uuid.UUID
+    total_price: Decimal
+    early_bird_discount: Decimal
+    group_discount: Decimal
+    quoted_at: datetime
+    members: list[GroupMemberOut] = Field(validation_alias="member_bookings")
@@ -1,36 +1,64 @@
-from django.shortcuts import get_object_or_404
+from django.db import transaction
+from django.shortcuts import aget_object_or_404, get_object_or_404
 from django.utils.timezone import now
 from ninja.errors import HttpError
 
 from modules.trips.models import Trip
+from modules.trips.services.seat_service import claim_seats, release_seats
 
 from ..models import Booking
+from .pricing_service import quote_trips
 
 
+@transaction.atomic
 def create_booking_service(user, payload):
-    trip = get_object_or_404(Trip, pk=payload.trip_id, status="scheduled")
+    trip = get_object_or_404(
+        Trip.objects.select_related("vehicle"),
+        pk=payload.trip_id,
+        status="scheduled",
+        compliance_hold=False,
+    )
 
-    if trip.available_seats_remaining < payload.selected_seats:
-        raise HttpError(400, f"Only {trip.available_seats_remaining} seats left")
+    # The seat map is the trip's inventory; claiming fails when the seats
+    # are taken or too few are left.
+    seat_map = claim_seats(trip, payload.seat_numbers, payload.selected_seats)
 
     booking = Booking.objects.create(
         trip=trip,
         user=user,
         selected_seats=payload.selected_seats,
+        seat_map=seat_map,
         booking_status="pending",
     )
 
     return booking
 
 
+def quote_service(lines):
+    trips = Trip.objects.filter(status="scheduled", compliance_hold=False)
+    return quote_trips(
+        [(line.trip_id, line.seats, line.as_of) for line in lines], queryset=trips
+    )
+
+
 def get_my_bookings_service(user):
+    # BookingOut reads only booking columns; the price is frozen on the row.
     return Booking.objects.filter(user=user).order_by("-booked_at")
 
 
+async def aget_my_bookings_service(user):
+    qs = get_my_bookings_service(user)
+    return [booking async for booking in qs]
+
+
 def get_booking_service(user, booking_id):
     return get_object_or_404(Booking, pk=booking_id, user=user)
 
 
+async def aget_booking_service(user, booking_id):
+    return await aget_object_or_404(Booking, pk=booking_id, user=user)
+
+
 def cancel_booking_service(user, booking_id):
     booking = get_object_or_404(Booking, pk=booking_id, user=user)
 
@@ -44,6 +72,8 @@ def cancel_booking_service(user, booking_id):
 
     booking.booking_status = "cancelled"
     booking.cancelled_at = now()
-    booking.save(update_fields=["booking_status", "cancelled_at"])
+    with transaction.atomic():
+        booking.save(update_fields=["booking_status", "cancelled_at"])
+        release_seats(booking.trip_id, booking.seat_map)
 
     return booking
@@ -0,0 +1,95 @@
+"""
+Group bookings: seats for several named passengers in one transaction.
+
+Creating a group checks and takes every seat with a single claim on the
+trip's seat map, prices the whole party with one quote (so the group
+discount applies once, to all its seats) and inserts the member bookings
+with one ``bulk_create``. Each member booking holds one seat and an even
+share of the quote, and is paid like any other booking. Passengers whose
+email belongs to an account get the booking in their own list; guests'
+bookings belong to the organizer.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.functions import Lower
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+
+from modules.trips.models import Trip
+from modules.trips.services.seat_service import (
+    claim_seats,
+    seat_bits,
+    seat_numbers,
+    to_map,
+)
+
+from ..models import Booking, GroupBooking
+from .pricing_service import quote, split_evenly
+
+
+@transaction.atomic
+def create_group_booking_service(organizer, payload):
+    trip = get_object_or_404(
+        Trip.objects.select_related("vehicle"),
+        pk=payload.trip_id,
+        status="scheduled",
+        compliance_hold=False,
+    )
+    passengers = payload.passengers
+    # Only the domain of account emails is normalized, so match ignoring case.
+    emails = {p.email.lower() for p in passengers if p.email}
+    users = {
+        user.email.lower(): user
+        for user in get_user_model()
+        .objects.alias(email_lower=Lower("email"))
+        .filter(email_lower__in=emails)
+    }
+
+    # One claim for the whole party: the chosen seats or the lowest free ones.
+    chosen = [p.seat_number for p in passengers if p.seat_number is not None]
+    seat_map = claim_seats(trip, chosen or None, count=len(passengers))
+    seats = chosen or seat_numbers(seat_map)
+
+    price = quote(trip, len(passengers))
+    quoted_at = timezone.now()
+    group = GroupBooking.objects.create(
+        organizer=organizer,
+        trip=trip,
+        total_price=price.total_price,
+        early_bird_discount=price.early_bird_discount,
+        group_discount=price.group_discount,
+        quoted_at=quoted_at,
+    )
+    shares = zip(
+        split_evenly(price.total_price, len(passengers)),
+        split_evenly(price.early_bird_discount, len(passengers)),
+        split_evenly(price.group_discount, len(passengers)),
+    )
+    capacity = trip.vehicle.capacity
+    group.member_bookings = Booking.objects.bulk_create(
+        Booking(
+            user=users.get((passenger.email or "").lower(), organizer),
+            trip=trip,
+            group=group,
+            passenger_name=passenger.full_name,
+            passenger_email=passenger.email or "",
+            selected_seats=1,
+            seat_map=to_map(seat_bits([seat]), capacity),
+            booking_status="pending",
+            total_price=total,
+            early_bird_discount=early_bird,
+            group_discount=group_off,
+            quoted_at=quoted_at,
+        )
+        for passenger, seat, (total, early_bird, group_off) in zip(
+            passengers, seats, shares
+        )
+    )
+    return group
+
+
+def get_group_booking_service(organizer, group_id):
+    group = get_object_or_404(GroupBooking, pk=group_id, organizer=organizer)
+    group.member_bookings = list(group.members.order_by("passenger_name"))
+    return group
@@ -0,0 +1,123 @@
+"""
+Seat pricing: early bird and group discounts.
+
+A quote prices ``seats`` on a trip as of a date:
+
+- the early bird discount applies while ``as_of`` is on or before the
+  trip's ``early_bird_deadline`` (or always when it has none);
+- the group discount applies to more than one seat;
+- both are percentages of the base amount, added up, and the total never
+  goes below zero.
+
+``quote_trips`` prices many ``(trip_id, seats, as_of)`` lines with one
+query for the trips. Each trip is reduced to integer kobo and percentages
+once, and every line is priced with integer arithmetic in a single pass;
+Decimals are only built for the results. ``quote`` prices one line on a
+trip that is already loaded; ``Booking.apply_quote`` freezes its result onto
+a new booking. Amounts are rounded half up to the kobo.
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from django.utils import timezone
+from ninja.errors import HttpError
+
+from modules.trips.models import Trip
+
+PRICING_FIELDS = (
+    "id",
+    "price_per_seat",
+    "early_bird_discount_percentage",
+    "early_bird_deadline",
+    "group_discount_percentage",
+)
+
+
+class QuoteLine(NamedTuple):
+    trip_id: UUID
+    seats: int = 1
+    as_of: Optional[date] = None
+
+
+class Quote(NamedTuple):
+    trip_id: UUID
+    seats: int
+    as_of: date
+    base_price: Decimal
+    early_bird_discount: Decimal
+    group_discount: Decimal
+    total_price: Decimal
+
+
+def _rates(trip) -> tuple:
+    return (
+        int(trip.price_per_seat * 100),
+        trip.early_bird_discount_percentage,
+        trip.early_bird_deadline,
+        trip.group_discount_percentage,
+    )
+
+
+def _kobo(amount: int) -> Decimal:
+    return Decimal(amount).scaleb(-2)
+
+
+def _price(lines, rates: dict, today: date) -> list:
+    quotes = []
+    for trip_id, seats, as_of in lines:
+        as_of = as_of or today
+        price, early_bird, deadline, group = rates[trip_id]
+        base = price * seats
+        if deadline is not None and deadline < as_of:
+            early_bird = 0
+        if seats < 2:
+            group = 0
+        percent = min(early_bird + group, 100)
+        total = (base * (100 - percent) + 50) // 100
+        early_bird_off = min((base * early_bird + 50) // 100, base - total)
+        quotes.append(
+            Quote(
+                trip_id,
+                seats,
+                as_of,
+                _kobo(base),
+                _kobo(early_bird_off),
+                _kobo(base - total - early_bird_off),
+                _kobo(total),
+            )
+        )
+    return quotes
+
+
+def quote(trip, seats: int, as_of: Optional[date] = None) -> Quote:
+    """Price ``seats`` on a loaded ``trip``."""
+    line = QuoteLine(trip.pk, seats, as_of)
+    return _price([line], {trip.pk: _rates(trip)}, timezone.localdate())[0]
+
+
+def quote_trips(lines, queryset=None) -> list:
+    """Price every ``(trip_id, seats, as_of)`` line; trips come from ``queryset``.
+
+    Raises 404 naming the trips ``queryset`` does not contain.
+    """
+    lines = [QuoteLine(*line) for line in lines]
+    queryset = queryset if queryset is not None else Trip.objects.all()
+    trip_ids = {line.trip_id for line in lines}
+    rates = {
+        trip.pk: _rates(trip)
+        for trip in queryset.filter(pk__in=trip_ids).only(*PRICING_FIELDS)
+    }
+    missing = trip_ids - rates.keys()
+    if missing:
+        raise HttpError(404, f"Trips not found: {', '.join(sorted(map(str, missing)))}")
+    return _price(lines, rates, timezone.localdate())
+
+
+def split_evenly(amount: Decimal, parts: int) -> list:
+    """Split ``amount`` into ``parts`` shares that differ by at most a kobo
+    and add up to it exactly; the first shares take the remainder."""
+    share, rest = divmod(int(amount * 100), parts)
+    return [_kobo(share + (i < rest)) for i in range(parts)]
@@ -32,6 +32,12 @@ def test_booking_in_invalid_seats():
         BookingIn(trip_id=uuid.uuid4(), selected_seats="many")
 
 
+@pytest.mark.parametrize("seats", [0, -1])
+def test_booking_in_needs_a_seat(seats):
+    with pytest.raises(ValidationError):
+        BookingIn(trip_id=uuid.uuid4(), selected_seats=seats)
+
+
 # ============================================================================
 # BookingOut SCHEMA TESTS
 # ============================================================================
@@ -2,12 +2,15 @@ import uuid
 from decimal import Decimal
 
 import pytest
+from asgiref.sync import async_to_sync
 from django.http import Http404
 from django.test import override_settings
 from ninja.errors import HttpError
 
 from modules.bookings.schemas import BookingIn
 from modules.bookings.services.booking_service import (
+    aget_booking_service,
+    aget_my_bookings_service,
     cancel_booking_service,
     create_booking_service,
     get_booking_service,
@@ -141,6 +144,18 @@ def test_get_my_bookings_empty(corper):
     assert len(bookings) == 0
 
 
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+def test_aget_my_bookings_reads_one_table(corper, trip, django_assert_num_queries):
+    payload = BookingIn(trip_id=trip.id, selected_seats=2)
+    booking = create_booking_service(corper, payload)
+
+    with django_assert_num_queries(1):
+        bookings = async_to_sync(aget_my_bookings_service)(corper)
+        assert [b.id for b in bookings] == [booking.id]
+        assert bookings[0].total_price == booking.total_price
+
+
 # ============================================================================
 # GET SINGLE BOOKING
 # ============================================================================
@@ -180,6 +195,26 @@ def test_get_booking_wrong_user(corper, trip, USER):
         get_booking_service(other_user, booking.id)
 
 
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+def test_aget_booking(corper, trip, USER):
+    payload = BookingIn(trip_id=trip.id, selected_seats=1)
+    booking = create_booking_service(corper, payload)
+
+    fetched = async_to_sync(aget_booking_service)(corper, booking.id)
+    assert fetched.id == booking.id
+    assert fetched.trip == trip
+
+    other_user = USER.objects.create_user(
+        email="other2@example.com",
+        password="Password1!",
+        is_active=True,
+        role="corper",
+    )
+    with pytest.raises(Http404):
+        async_to_sync(aget_booking_service)(other_user, booking.id)
+
+
 # ============================================================================
 # CANCEL BOOKING
 # ============================================================================
@@ -0,0 +1,183 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.test import Client
+from ninja.errors import HttpError
+from ninja_jwt.tokens import AccessToken
+from pydantic import ValidationError
+
+from modules.bookings.models import Booking, GroupBooking
+from modules.bookings.schemas import GroupBookingIn
+from modules.bookings.services.booking_service import get_my_bookings_service
+from modules.bookings.services.group_booking_service import (
+    create_group_booking_service,
+)
+from modules.bookings.services.pricing_service import split_evenly
+from modules.payments.models import Payment
+from modules.trips.models import Trip, Vehicle, VehicleType
+from modules.trips.services.seat_service import seat_numbers
+
+
+@pytest.fixture
+def vendor(USER):
+    return USER.objects.create_user(
+        email="vendor@example.com", password="Password1!", role="vendor"
+    )
+
+
+@pytest.fixture
+def organizer(USER):
+    return USER.objects.create_user(
+        email="organizer@example.com", password="Password1!", role="corper"
+    )
+
+
+@pytest.fixture
+def friend(USER):
+    return USER.objects.create_user(
+        email="friend@example.com", password="Password1!", role="corper"
+    )
+
+
+@pytest.fixture
+def trip(vendor):
+    vehicle = Vehicle.objects.create(
+        vendor=vendor,
+        registration_number="GRP-001",
+        vehicle_type=VehicleType.objects.create(name="Bus"),
+        make_model="Toyota Hiace 2020",
+        capacity=14,
+    )
+    return Trip.objects.create(
+        vendor=vendor,
+        vehicle=vehicle,
+        departure_state="Lagos",
+        departure_city="Ikeja",
+        destination_camp="NYSC Camp Iseyin",
+        departure_date=datetime.date.today() + datetime.timedelta(days=3),
+        departure_time=datetime.time(8, 0),
+        price_per_seat=Decimal("5000.00"),
+        available_seats=14,
+        group_discount_percentage=10,
+    )
+
+
+def group_in(trip, *passengers):
+    return GroupBookingIn(
+        trip_id=trip.id,
+        passengers=[
+            {"full_name": name, "email": email, "seat_number": seat}
+            for name, email, seat in passengers
+        ],
+    )
+
+
+def test_split_evenly_adds_up():
+    assert split_evenly(Decimal("100.00"), 3) == [
+        Decimal("33.34"),
+        Decimal("33.33"),
+        Decimal("33.33"),
+    ]
+
+
+def test_group_booking_in_rejects_ambiguous_passengers():
+    trip = Trip()
+    with pytest.raises(ValidationError, match="emails must be unique"):
+        group_in(trip, ("A", "a@example.com", None), ("B", "A@example.com", None))
+    with pytest.raises(ValidationError, match="every passenger or for none"):
+        group_in(trip, ("A", None, 1), ("B", None, None))
+    with pytest.raises(ValidationError):
+        group_in(trip, ("A", None, None))
+
+
+@pytest.mark.django_db
+def test_group_books_every_passenger_with_one_quote(organizer, friend, trip):
+    group = create_group_booking_service(
+        organizer,
+        group_in(
+            trip,
+            ("Organizer", "organizer@example.com", None),
+            ("Friend", "friend@example.com", None),
+            ("Guest", None, None),
+        ),
+    )
+
+    # 3 x 5000 with the group discount applied once to the whole party.
+    assert group.total_price == Decimal("13500.00")
+    assert group.group_discount == Decimal("1500.00")
+    members = {m.passenger_name: m for m in group.member_bookings}
+    assert [members[n].seat_numbers for n in ("Organizer", "Friend", "Guest")] == [
+        [1],
+        [2],
+        [3],
+    ]
+    assert members["Friend"].user == friend
+    assert members["Guest"].user == organizer
+    assert sum(m.total_price for m in group.member_bookings) == group.total_price
+    trip.refresh_from_db()
+    assert seat_numbers(trip.seat_map) == [1, 2, 3]
+    assert [b.passenger_name for b in get_my_bookings_service(friend)] == ["Friend"]
+
+    # Each member pays their own share.
+    Payment.objects.create(
+        user=friend, booking=members["Friend"], amount=Decimal("4500.00")
+    )
+    statuses = dict(Booking.objects.values_list("passenger_name", "payment_status"))
+    assert statuses == {"Organizer": "pending", "Friend": "paid", "Guest": "pending"}
+
+
+@pytest.mark.django_db
+def test_passenger_emails_match_accounts_ignoring_case(organizer, friend, trip):
+    group = create_group_booking_service(
+        organizer,
+        group_in(trip, ("Friend", "Friend@Example.com", None), ("Guest", None, None)),
+    )
+
+    assert group.member_bookings[0].user == friend
+
+
+@pytest.mark.django_db
+def test_group_is_all_or_nothing(organizer, trip):
+    create_group_booking_service(
+        organizer, group_in(trip, ("A", None, 4), ("B", None, 5))
+    )
+
+    with pytest.raises(HttpError) as exc_info:
+        create_group_booking_service(
+            organizer, group_in(trip, ("C", None, 3), ("D", None, 4))
+        )
+
+    assert exc_info.value.status_code == 409
+    assert GroupBooking.objects.count() == 1
+    assert Booking.objects.count() == 2
+    trip.refresh_from_db()
+    assert seat_numbers(trip.seat_map) == [4, 5]
+
+
+@pytest.mark.django_db
+def test_group_booking_endpoints(organizer, friend, trip):
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(organizer)}")
+
+    resp = client.post(
+        "/api/bookings/groups",
+        {
+            "trip_id": str(trip.id),
+            "passengers": [
+                {"full_name": "Friend", "email": "friend@example.com"},
+                {"full_name": "Guest"},
+            ],
+        },
+        content_type="application/json",
+    )
+    assert resp.status_code == 200
+    created = resp.json()
+    assert Decimal(created["total_price"]) == Decimal("9000.00")
+    assert [m["seat_numbers"] for m in created["members"]] == [[1], [2]]
+
+    resp = client.get(f"/api/bookings/groups/{created['id']}")
+    assert resp.status_code == 200
+    assert [m["passenger_name"] for m in resp.json()["members"]] == ["Friend", "Guest"]
+
+    other = Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(friend)}")
+    assert other.get(f"/api/bookings/groups/{created['id']}").status_code == 404
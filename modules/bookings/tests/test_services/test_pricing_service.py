@@ -0,0 +1,218 @@
+import datetime
+import uuid
+from decimal import Decimal
+from importlib import import_module
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+from ninja.errors import HttpError
+from ninja_jwt.tokens import AccessToken
+
+from modules.bookings.models import Booking
+from modules.bookings.services.pricing_service import quote, quote_trips
+from modules.payments.models import Payment
+from modules.trips.models import Trip, Vehicle, VehicleType
+
+TODAY = datetime.date.today()
+
+
+@pytest.fixture
+def vendor(USER):
+    return USER.objects.create_user(
+        email="vendor@example.com", password="Password1!", role="vendor"
+    )
+
+
+@pytest.fixture
+def make_trip(vendor):
+    vehicle = Vehicle.objects.create(
+        vendor=vendor,
+        registration_number="PRICE-01",
+        vehicle_type=VehicleType.objects.create(name="Bus"),
+        make_model="Toyota Hiace 2020",
+        capacity=14,
+    )
+
+    def make(price, early_bird=0, deadline=None, group=0, **extra):
+        return Trip.objects.create(
+            vendor=vendor,
+            vehicle=vehicle,
+            departure_state="Lagos",
+            departure_city="Ikeja",
+            destination_camp="NYSC Camp Iseyin",
+            departure_date=TODAY + datetime.timedelta(days=10),
+            departure_time=datetime.time(8, 0),
+            price_per_seat=Decimal(price),
+            available_seats=14,
+            early_bird_discount_percentage=early_bird,
+            early_bird_deadline=deadline,
+            group_discount_percentage=group,
+            **extra,
+        )
+
+    return make
+
+
+@pytest.mark.parametrize(
+    "price, early_bird, deadline_days, group, seats, total",
+    [
+        ("5000.00", 0, None, 0, 3, "15000.00"),
+        ("5000.00", 10, None, 0, 1, "4500.00"),
+        ("5000.00", 10, 5, 5, 3, "12750.00"),
+        ("5000.00", 10, -1, 5, 3, "14250.00"),
+        ("5000.00", 10, 0, 5, 1, "4500.00"),
+        ("3333.33", 7, None, 3, 2, "5999.99"),
+        ("1000.00", 80, None, 40, 2, "0.00"),
+    ],
+)
+def test_quote_applies_discounts(price, early_bird, deadline_days, group, seats, total):
+    deadline = None
+    if deadline_days is not None:
+        deadline = TODAY + datetime.timedelta(days=deadline_days)
+    trip = Trip(
+        id=uuid.uuid4(),
+        price_per_seat=Decimal(price),
+        early_bird_discount_percentage=early_bird,
+        early_bird_deadline=deadline,
+        group_discount_percentage=group,
+    )
+
+    result = quote(trip, seats)
+
+    assert result.total_price == Decimal(total)
+    assert result.base_price == Decimal(price) * seats
+    assert (
+        result.base_price - result.early_bird_discount - result.group_discount
+        == result.total_price
+    )
+
+
+@pytest.mark.django_db
+def test_quote_trips_prices_many_lines_with_one_query(
+    make_trip, django_assert_num_queries
+):
+    deadline = TODAY + datetime.timedelta(days=3)
+    early = make_trip("5000.00", early_bird=10, deadline=deadline)
+    group = make_trip("4000.00", group=5)
+    later = deadline + datetime.timedelta(days=1)
+
+    with django_assert_num_queries(1):
+        quotes = quote_trips(
+            [
+                (early.id, 1),
+                (early.id, 2, later),
+                (group.id, 1),
+                (group.id, 4),
+            ]
+        )
+
+    assert [q.total_price for q in quotes] == [
+        Decimal("4500.00"),
+        Decimal("10000.00"),
+        Decimal("4000.00"),
+        Decimal("15200.00"),
+    ]
+    assert [q.as_of for q in quotes] == [TODAY, later, TODAY, TODAY]
+
+
+@pytest.mark.django_db
+def test_quote_trips_reports_missing_trips(make_trip):
+    trip = make_trip("5000.00")
+    missing = uuid.uuid4()
+
+    with pytest.raises(HttpError) as exc_info:
+        quote_trips([(trip.id, 1), (missing, 2)])
+
+    assert exc_info.value.status_code == 404
+    assert str(missing) in str(exc_info.value)
+
+
+@pytest.mark.django_db
+def test_booking_freezes_its_quote(USER, make_trip):
+    trip = make_trip("5000.00", early_bird=10, group=5)
+    corper = USER.objects.create_user(email="corper@example.com", password="pass")
+    booking = Booking.objects.create(user=corper, trip=trip, selected_seats=3)
+
+    trip.price_per_seat = Decimal("9000.00")
+    trip.save()
+    booking.refresh_from_db()
+
+    assert booking.total_price == Decimal("12750.00")
+    assert booking.early_bird_discount == Decimal("1500.00")
+    assert booking.group_discount == Decimal("750.00")
+    assert booking.quoted_at is not None
+
+
+@pytest.mark.django_db
+def test_payment_reads_the_frozen_price(USER, make_trip, django_assert_num_queries):
+    trip = make_trip("5000.00")
+    corper = USER.objects.create_user(email="corper@example.com", password="pass")
+    booking = Booking.objects.create(user=corper, trip=trip, selected_seats=2)
+    booking = Booking.objects.get(pk=booking.pk)
+
+    # The payment insert and the booking update; the trip is not loaded.
+    with django_assert_num_queries(2):
+        Payment.objects.create(user=corper, booking=booking, amount=Decimal("10000"))
+    booking.refresh_from_db()
+    assert booking.payment_status == "paid"
+
+
+@pytest.mark.django_db
+def test_backfill_prices_bookings_as_of_their_booking_date(USER, make_trip):
+    from django.apps import apps
+
+    backfill = import_module(
+        "modules.bookings.migrations.0005_backfill_booking_quotes"
+    ).backfill_quotes
+    deadline = TODAY - datetime.timedelta(days=5)
+    trip = make_trip("5000.00", early_bird=10, deadline=deadline, group=5)
+    corper = USER.objects.create_user(email="corper@example.com", password="pass")
+    early = Booking.objects.create(user=corper, trip=trip, selected_seats=2)
+    late = Booking.objects.create(user=corper, trip=trip, selected_seats=2)
+    Booking.objects.filter(pk=early.pk).update(
+        booked_at=timezone.now() - datetime.timedelta(days=10)
+    )
+    Booking.objects.update(total_price=0, quoted_at=None)
+
+    backfill(apps, None)
+
+    early.refresh_from_db()
+    late.refresh_from_db()
+    assert (early.total_price, early.quoted_at) == (
+        Decimal("8500.00"),
+        early.booked_at,
+    )
+    assert late.total_price == Decimal("9500.00")
+
+
+@pytest.mark.django_db
+def test_quote_endpoint_only_prices_bookable_trips(USER, make_trip):
+    bookable = make_trip("5000.00", group=10)
+    cancelled = make_trip("5000.00", status="cancelled")
+    corper = USER.objects.create_user(email="corper@example.com", password="pass")
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(corper)}")
+
+    resp = client.post(
+        "/api/bookings/quotes",
+        {"lines": [{"trip_id": str(bookable.id), "seats": 2}]},
+        content_type="application/json",
+    )
+    assert resp.status_code == 200
+    (line,) = resp.json()
+    assert Decimal(line["total_price"]) == Decimal("9000.00")
+    assert Decimal(line["group_discount"]) == Decimal("1000.00")
+
+    resp = client.post(
+        "/api/bookings/quotes",
+        {"lines": [{"trip_id": str(cancelled.id)}]},
+        content_type="application/json",
+    )
+    assert resp.status_code == 404
+
+    resp = client.post(
+        "/api/bookings/quotes",
+        {"lines": [{"trip_id": str(bookable.id), "seats": 0}]},
+        content_type="application/json",
+    )
+    assert resp.status_code == 422
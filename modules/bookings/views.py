@@ -4,32 +4,89 @@ from typing import List
 from ninja import Router
 from ninja_jwt.authentication import JWTAuth
 
-from .schemas import BookingIn, BookingOut
+from engine.async_views import async_variant
+from engine.db_router import replica_reads
+from engine.query_budget import query_budget
+
+from .schemas import (
+    BookingIn,
+    BookingOut,
+    GroupBookingIn,
+    GroupBookingOut,
+    QuoteIn,
+    QuoteOut,
+)
 from .services.booking_service import (
+    aget_booking_service,
+    aget_my_bookings_service,
     cancel_booking_service,
     create_booking_service,
     get_booking_service,
     get_my_bookings_service,
+    quote_service,
+)
+from .services.group_booking_service import (
+    create_group_booking_service,
+    get_group_booking_service,
 )
 
 router = Router(tags=["Bookings"], auth=JWTAuth())
 
 
 @router.post("/", response=BookingOut)
+@query_budget(5)
 def create_booking(request, payload: BookingIn):
     return create_booking_service(request.user, payload)
 
 
+@router.post("/groups", response=GroupBookingOut)
+@query_budget(6)
+def create_group_booking(request, payload: GroupBookingIn):
+    """Book a seat for every passenger of a group in one transaction."""
+    return create_group_booking_service(request.user, payload)
+
+
+@router.get("/groups/{group_id}", response=GroupBookingOut)
+@query_budget(3)
+def get_group_booking(request, group_id: uuid.UUID):
+    return get_group_booking_service(request.user, group_id)
+
+
+@router.post("/quotes", response=List[QuoteOut])
+@query_budget(2)
+@replica_reads
+def quote_prices(request, payload: QuoteIn):
+    """Price seat counts on bookable trips without booking them."""
+    return quote_service(payload.lines)
+
+
+@query_budget(2)
+@replica_reads
+async def amy_bookings(request):
+    return await aget_my_bookings_service(request.user)
+
+
 @router.get("/", response=List[BookingOut])
+@async_variant(amy_bookings)
+@query_budget(2)
+@replica_reads
 def my_bookings(request):
     return get_my_bookings_service(request.user)
 
 
+@query_budget(3)
+async def aget_booking(request, booking_id: uuid.UUID):
+    return await aget_booking_service(request.user, booking_id)
+
+
 @router.get("/{booking_id}", response=BookingOut)
+@async_variant(aget_booking)
+@query_budget(3)
 def get_booking(request, booking_id: uuid.UUID):
     return get_booking_service(request.user, booking_id)
 
 
 @router.patch("/{booking_id}/cancel", response=BookingOut)
+@query_budget(5)
 def cancel_booking(request, booking_id: uuid.UUID):
     return cancel_booking_service(request.user, booking_id)
@@ -0,0 +1,60 @@
+"""
+Move trips and bookings along their lifecycle as time passes.
+
+Schedule it every few minutes (cron, a systemd timer) or keep it running
+with ``--interval``. See ``modules/trips/services/lifecycle_service.py``
+for the transitions. Each run logs the rows it moved; the
+``lifecycle_transitions_total`` counter reaches ``/metrics`` when the job
+shares the web workers' ``PROMETHEUS_MULTIPROC_DIR``. Usage::
+
+    python manage.py advance_trips
+    python manage.py advance_trips --interval 300
+"""
+
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from modules.trips.services.lifecycle_service import BATCH_SIZE, advance_trips
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Mark departed trips ongoing, arrived trips completed, and settle bookings."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="seconds between runs; 0 runs once",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            self.run_once(options["batch_size"])
+            if not options["interval"]:
+                return
+            time.sleep(options["interval"])
+            close_old_connections()
+
+    def run_once(self, batch_size):
+        started = time.perf_counter()
+        counts = advance_trips(batch_size=batch_size)
+        elapsed = time.perf_counter() - started
+        moved = {
+            f"{model}:{source}->{target}": rows
+            for (model, source, target), rows in counts.items()
+        }
+        logger.info(
+            "Lifecycle run moved %s rows in %.2fs",
+            sum(moved.values()),
+            elapsed,
+            extra={"transitions": moved},
+        )
+        for name, rows in moved.items():
+            self.stdout.write(f"{name:<28}{rows:>8}")
@@ -0,0 +1,36 @@
+"""
+Write the API's OpenAPI document to a file.
+
+Run during the deploy, after ``collectstatic``, and point
+``OPENAPI_SCHEMA_FILE`` at the output so workers serve the file instead of
+building the schema. The default output, ``STATIC_ROOT/openapi.json``, is
+also served by WhiteNoise as ``/static/openapi.json``.
+"""
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from engine.api import api
+from engine.openapi import render_schema
+
+
+class Command(BaseCommand):
+    help = "Pre-generate the OpenAPI document."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help="default: OPENAPI_SCHEMA_FILE, or STATIC_ROOT/openapi.json",
+        )
+
+    def handle(self, *args, **options):
+        output = options["output"] or Path(
+            settings.OPENAPI_SCHEMA_FILE or settings.STATIC_ROOT / "openapi.json"
+        )
+        content = render_schema(api)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_bytes(content)
+        self.stdout.write(f"OpenAPI schema written to {output} ({len(content)} bytes)")
@@ -0,0 +1,48 @@
+"""
+Resize uploaded images.
+
+Makes the thumbnail and medium copies of pending vehicle images a batch at
+a time until none are left. Keep it running with ``--interval`` next to the
+web workers, or run it from cron every minute. Usage::
+
+    python manage.py process_media
+    python manage.py process_media --interval 10
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from modules.media.processing import BATCH_SIZE, process_pending
+
+
+class Command(BaseCommand):
+    help = "Make resized copies of pending uploaded images."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="seconds between runs; 0 runs once",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            self.run_once(options["batch_size"])
+            if not options["interval"]:
+                return
+            time.sleep(options["interval"])
+            close_old_connections()
+
+    def run_once(self, batch_size):
+        ready = failed = 0
+        while True:
+            result = process_pending(batch_size)
+            ready += result["ready"]
+            failed += result["failed"]
+            if result["ready"] + result["failed"] < batch_size:
+                break
+        self.stdout.write(f"{ready} ready, {failed} failed")
@@ -0,0 +1,124 @@
+"""
+Report where worker startup time goes, module by module.
+
+Starts a fresh interpreter with ``python -X importtime`` that runs one
+startup stage and reports the slowest imports and the import time per
+package:
+
+- ``setup``: ``django.setup()``, what every worker and management command pays;
+- ``urls``: plus the URLconf, loaded on a worker's first request;
+- ``api``: plus every API router, which ``API_LAZY_ROUTERS`` defers until a
+  request under its prefix arrives.
+
+``self`` is the time spent in a module's own body, ``cumulative`` includes
+the modules it imported first. Usage::
+
+    python manage.py profile_startup --stage urls --limit 30
+"""
+
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+STAGES = {
+    "setup": "",
+    "urls": "import {urlconf}",
+    "api": "import {urlconf}; from engine.api import api; api.load_all()",
+}
+SCRIPT = """\
+import time
+started = time.perf_counter()
+import django
+django.setup()
+{stage}
+{imports}
+print(time.perf_counter() - started)
+"""
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def parse_importtime(output: str) -> list:
+    """Return ``(module, self_us, cumulative_us)`` per imported module."""
+    rows = []
+    for line in output.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            rows.append((match[4], int(match[1]), int(match[2])))
+    return rows
+
+
+def package_of(module: str, depth: int) -> str:
+    return ".".join(module.split(".")[:depth])
+
+
+class Command(BaseCommand):
+    help = "Profile import time per module for a worker startup stage."
+    # Checks would import the URLconf into this process for nothing.
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--stage", choices=STAGES, default="urls")
+        parser.add_argument(
+            "--import",
+            dest="imports",
+            nargs="+",
+            default=[],
+            metavar="MODULE",
+            help="extra modules to import after the stage",
+        )
+        parser.add_argument("--limit", type=int, default=20)
+        parser.add_argument("--sort", choices=["self", "cumulative"], default="self")
+        parser.add_argument(
+            "--depth",
+            type=int,
+            default=2,
+            help="dotted components that make up a package in the summary",
+        )
+
+    def handle(self, *args, **options):
+        script = SCRIPT.format(
+            stage=STAGES[options["stage"]].format(urlconf=settings.ROOT_URLCONF),
+            imports="\n".join(f"import {name}" for name in options["imports"]),
+        )
+        env = dict(os.environ)
+        env.setdefault("DJANGO_SETTINGS_MODULE", "engine.settings")
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode:
+            raise CommandError(result.stderr.strip().splitlines()[-1])
+
+        rows = parse_importtime(result.stderr)
+        elapsed = float(result.stdout.strip().splitlines()[-1])
+        total_self = sum(row[1] for row in rows)
+        self.stdout.write(
+            f"stage {options['stage']}: {elapsed * 1000:.0f} ms, "
+            f"{len(rows)} modules, {total_self / 1000:.0f} ms importing\n"
+        )
+
+        key = 1 if options["sort"] == "self" else 2
+        self.stdout.write(f"{'self ms':>9}{'cumul ms':>10}  module")
+        for module, own, cumulative in sorted(rows, key=lambda r: -r[key])[
+            : options["limit"]
+        ]:
+            self.stdout.write(f"{own / 1000:>9.1f}{cumulative / 1000:>10.1f}  {module}")
+
+        packages = defaultdict(lambda: [0, 0])
+        for module, own, _ in rows:
+            totals = packages[package_of(module, options["depth"])]
+            totals[0] += own
+            totals[1] += 1
+        self.stdout.write(f"\n{'self ms':>9}{'modules':>10}  package")
+        for package, (own, count) in sorted(packages.items(), key=lambda p: -p[1][0])[
+            : options["limit"]
+        ]:
+            self.stdout.write(f"{own / 1000:>9.1f}{count:>10}  {package}")
@@ -0,0 +1,26 @@
+"""
+Rebuild vendor rating aggregates from the reviews table.
+
+Reviews update ``Vendor.rating_*`` incrementally as they are written; run
+this nightly to correct any drift, e.g. after reviews were deleted in the
+admin. See ``modules/reviews/services.py``. Usage::
+
+    python manage.py recompute_vendor_ratings
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from modules.reviews.services import recompute_vendor_ratings
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Recompute vendor ratings from reviews and fix the ones that drifted."
+
+    def handle(self, *args, **options):
+        fixed = recompute_vendor_ratings()
+        logger.info("Vendor rating recompute corrected %s vendors", fixed)
+        self.stdout.write(f"{fixed} vendor rating(s) corrected")
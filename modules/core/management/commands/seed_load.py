@@ -0,0 +1,509 @@
+"""
+Generate production-scale synthetic data.
+
+Rows are built in memory and written with ``bulk_create`` in batches,
+skipping ``save()``/``full_clean()`` and per-user password hashing (every
+user shares one precomputed hash). Ids and values come from a seeded RNG,
+so the same arguments produce the same data. Distributions:
+
+- vendor fleet sizes are Zipf-distributed, so a few large operators own
+  most of the vehicles;
+- departure states and destination camps are weighted towards the busiest;
+- most trips leave in the days just before each camp opening (``--peaks``),
+  and bookings favour those trips;
+- a vehicle runs at most one trip per departure window (``SLOTS``) a day,
+  so none of its trips overlap;
+- booking seats, statuses and payments follow fixed mixes, and
+  ``amount_paid``/``balance_due`` agree with the generated payments;
+- each booking holds the next seats of its trip, and the trips' seat maps
+  are filled in with the seats of their pending and confirmed bookings.
+
+Use a fresh database, or a different ``--prefix`` per run, since emails,
+plate numbers and call-up numbers must stay unique.
+"""
+
+import bisect
+import itertools
+import math
+import random
+import time
+import uuid
+from array import array
+from datetime import date, timedelta
+from datetime import time as dtime
+from decimal import Decimal
+from itertools import accumulate
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from modules.bookings.models import Booking
+from modules.corper.models import CorperProfile
+from modules.payments.models import Payment
+from modules.trips.models import Trip, Vehicle, VehicleType
+from modules.trips.services.seat_service import map_size, to_map
+from modules.vendor.models import Vendor
+
+User = get_user_model()
+
+PASSWORD = "Password1!"
+
+STATES = {
+    "Lagos": 20,
+    "Kano": 10,
+    "Oyo": 8,
+    "Rivers": 8,
+    "FCT": 7,
+    "Kaduna": 6,
+    "Ogun": 6,
+    "Enugu": 5,
+    "Delta": 5,
+    "Anambra": 5,
+    "Edo": 4,
+    "Plateau": 3,
+}
+CAMPS = {
+    "Iyana-Ipaja Camp, Lagos": 18,
+    "Kubwa Camp, FCT": 12,
+    "Iseyin Camp, Oyo": 9,
+    "Sagamu Camp, Ogun": 8,
+    "Kusala Camp, Kano": 7,
+    "Nonwa Camp, Rivers": 6,
+    "Issele-Uku Camp, Delta": 5,
+    "Awgu Camp, Enugu": 5,
+    "Kaduna Camp, Kaduna": 4,
+    "Mbawsi Camp, Abia": 3,
+}
+VEHICLE_TYPES = {
+    # name: (capacity, weight)
+    "Minibus": (14, 5),
+    "Sienna": (7, 2),
+    "Coaster": (30, 2),
+    "Bus": (59, 1),
+}
+SEATS = {1: 80, 2: 12, 3: 5, 4: 3}
+BOOKING_STATUSES = {
+    "confirmed": 55,
+    "pending": 25,
+    "completed": 10,
+    "cancelled": 8,
+    "no_show": 2,
+}
+PAYMENT_METHODS = {"card": 60, "bank_transfer": 30, "wallet": 10}
+# Share of trips leaving in the few days before a camp opens.
+PEAK_SHARE = 0.65
+# A day's departure windows, (first and last departure hour, hours on the
+# road): weight. Each trip arrives before the next window opens; evening
+# trips have no estimated arrival, so they hold the vehicle until midnight.
+SLOTS = {
+    (5, 7, 5): 7,
+    (13, 14, 4): 2,
+    (19, 21, None): 1,
+}
+
+
+def zipf_weights(n: int, exponent: float) -> list:
+    return [1 / (rank**exponent) for rank in range(1, n + 1)]
+
+
+class WeightedChoice:
+    """``random.choices`` with the cumulative weights computed once."""
+
+    def __init__(self, rng, population, weights):
+        self.rng = rng
+        self.population = list(population)
+        self.cum = list(accumulate(weights))
+        self.total = self.cum[-1]
+
+    def __call__(self):
+        index = bisect.bisect(self.cum, self.rng.random() * self.total)
+        return self.population[min(index, len(self.population) - 1)]
+
+
+class LoadGenerator:
+    def __init__(self, stdout, *, seed, batch_size, prefix, start):
+        self.stdout = stdout
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.prefix = prefix
+        self.start = start
+        self.now = timezone.now()
+        self.report = []
+
+    def uuid(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def bulk(self, model, rows) -> int:
+        """Insert ``rows`` (any iterable) in batches; returns the row count."""
+        started = time.perf_counter()
+        total = 0
+        rows = iter(rows)
+        while batch := list(itertools.islice(rows, self.batch_size)):
+            with transaction.atomic():
+                model.objects.bulk_create(batch, batch_size=self.batch_size)
+            total += len(batch)
+        elapsed = time.perf_counter() - started
+        self.report.append((model._meta.db_table, total, elapsed))
+        self.stdout.write(
+            f"{model._meta.db_table:<20}{total:>12,} rows"
+            f"{total / elapsed if elapsed else 0:>14,.0f} rows/s"
+        )
+        return total
+
+    # Users and profiles
+
+    def users(self, role, count, hashed):
+        ids = [self.uuid() for _ in range(count)]
+        self.bulk(
+            User,
+            (
+                User(
+                    id=ids[i],
+                    email=f"{self.prefix}-{role}{i}@load.example.com",
+                    full_name=f"Load {role.title()} {i}",
+                    password=hashed,
+                    role=role,
+                    is_active=True,
+                    email_verified=self.rng.random() < 0.9,
+                )
+                for i in range(count)
+            ),
+        )
+        return ids
+
+    def vendor_profiles(self, vendor_ids):
+        self.bulk(
+            Vendor,
+            (
+                Vendor(
+                    user_id=user_id,
+                    phone=f"080{i:08d}",
+                    business_name=f"{self.prefix.title()} Transit {i}",
+                    business_registration_number=f"{self.prefix}-RC{i:07d}",
+                    years_in_operation=self.rng.randint(1, 25),
+                    verification_status=(
+                        Vendor.VERIFICATION_APPROVED
+                        if self.rng.random() < 0.8
+                        else Vendor.VERIFICATION_UNDER_REVIEW
+                    ),
+                )
+                for i, user_id in enumerate(vendor_ids)
+            ),
+        )
+
+    def corper_profiles(self, corper_ids):
+        state = WeightedChoice(self.rng, STATES, STATES.values())
+        camp = WeightedChoice(self.rng, CAMPS, CAMPS.values())
+        self.bulk(
+            CorperProfile,
+            (
+                CorperProfile(
+                    id=self.uuid(),
+                    user_id=user_id,
+                    phone=f"081{i:08d}",
+                    state_code=f"{state()[:2].upper()}/{self.start:%y}A/{i % 10000:04d}",
+                    call_up_number=f"NYSC/{self.prefix}/{i:08d}",
+                    deployment_state=state(),
+                    camp_location=camp(),
+                    deployment_date=self.start,
+                )
+                for i, user_id in enumerate(corper_ids)
+            ),
+        )
+
+    # Fleet and trips
+
+    def vehicles(self, vendor_ids, count):
+        types = {
+            name: VehicleType.objects.get_or_create(name=name)[0]
+            for name in VEHICLE_TYPES
+        }
+        vehicle_type = WeightedChoice(
+            self.rng, VEHICLE_TYPES, [w for _, w in VEHICLE_TYPES.values()]
+        )
+        vendor = WeightedChoice(
+            self.rng, vendor_ids, zipf_weights(len(vendor_ids), 1.1)
+        )
+        # Every vendor gets at least one vehicle, the rest follow the Zipf skew.
+        owners = vendor_ids[:count] + [vendor() for _ in range(count - len(vendor_ids))]
+        fleet = []
+        for i, owner in enumerate(owners):
+            type_name = vehicle_type()
+            fleet.append(
+                Vehicle(
+                    id=self.uuid(),
+                    vendor_id=owner,
+                    registration_number=f"{self.prefix[:4].upper()}-{i:07d}",
+                    vehicle_type=types[type_name],
+                    make_model=type_name,
+                    capacity=VEHICLE_TYPES[type_name][0],
+                    year_manufactured=self.rng.randint(2008, self.start.year),
+                    is_insured=self.rng.random() < 0.85,
+                    insurance_expiry=self.start
+                    + timedelta(days=self.rng.randint(-60, 365)),
+                )
+            )
+        self.bulk(Vehicle, fleet)
+        return [(v.id, v.vendor_id, v.capacity) for v in fleet]
+
+    def departure_date(self, peaks, horizon):
+        if self.rng.random() < PEAK_SHARE:
+            return self.start + timedelta(
+                days=self.rng.choice(peaks) - self.rng.randint(0, 4)
+            )
+        return self.start + timedelta(days=self.rng.randint(0, horizon))
+
+    def trips(self, fleet, count, peaks, horizon):
+        state = WeightedChoice(self.rng, STATES, STATES.values())
+        camp = WeightedChoice(self.rng, CAMPS, CAMPS.values())
+        peak_dates = {
+            self.start + timedelta(days=peak - back)
+            for peak in peaks
+            for back in range(5)
+        }
+        # Per-trip data the booking generator needs, kept compact.
+        self.trip_ids = []
+        self.trip_price = array("l")
+        self.trip_discount = array("b")
+        self.trip_seats_left = array("h")
+        self.trip_capacity = array("h")
+        # Seats held by active bookings, per trip index.
+        self.trip_taken = {}
+        weights = []
+        slot = WeightedChoice(self.rng, list(SLOTS), SLOTS.values())
+        # (vehicle index, date, slot) already taken by a trip
+        busy = set()
+
+        def schedule(vehicle):
+            while True:
+                departure = self.departure_date(peaks, horizon)
+                preferred = slot()
+                for window in (preferred, *(s for s in SLOTS if s != preferred)):
+                    if (vehicle, departure, window) not in busy:
+                        busy.add((vehicle, departure, window))
+                        return departure, window
+
+        def rows():
+            for i in range(count):
+                vehicle_id, vendor_id, capacity = fleet[i % len(fleet)]
+                departure, (first, last, hours) = schedule(i % len(fleet))
+                price = 500 * self.rng.randint(8, 50)
+                discount = self.rng.choice((5, 10)) if self.rng.random() < 0.3 else 0
+                hour = self.rng.randint(first, last)
+                minute = self.rng.choice((0, 30))
+                trip = Trip(
+                    id=self.uuid(),
+                    vendor_id=vendor_id,
+                    vehicle_id=vehicle_id,
+                    status="scheduled" if departure >= self.start else "completed",
+                    departure_state=state(),
+                    departure_city=f"Park {self.rng.randint(1, 40)}",
+                    destination_camp=camp(),
+                    departure_date=departure,
+                    departure_time=dtime(hour, minute),
+                    estimated_arrival_time=(
+                        dtime(hour + hours, minute) if hours else None
+                    ),
+                    price_per_seat=Decimal(price),
+                    available_seats=capacity,
+                    seat_map=bytes(map_size(capacity)),
+                    group_discount_percentage=discount,
+                )
+                self.trip_ids.append(trip.id)
+                self.trip_price.append(price)
+                self.trip_discount.append(discount)
+                self.trip_seats_left.append(capacity)
+                self.trip_capacity.append(capacity)
+                weights.append(3 if departure in peak_dates else 1)
+                yield trip
+
+        self.bulk(Trip, rows())
+        self.pick_trip = WeightedChoice(self.rng, range(count), weights)
+
+    # Bookings and payments
+
+    def bookings(self, corper_ids, count):
+        seats = WeightedChoice(self.rng, SEATS, SEATS.values())
+        status = WeightedChoice(self.rng, BOOKING_STATUSES, BOOKING_STATUSES.values())
+        method = WeightedChoice(self.rng, PAYMENT_METHODS, PAYMENT_METHODS.values())
+        payments = []
+        skipped = 0
+
+        def rows():
+            nonlocal skipped
+            for _ in range(count):
+                wanted = seats()
+                for _attempt in range(5):
+                    index = self.pick_trip()
+                    if self.trip_seats_left[index] >= wanted:
+                        break
+                else:
+                    skipped += 1
+                    continue
+                capacity = self.trip_capacity[index]
+                held = ((1 << wanted) - 1) << capacity - self.trip_seats_left[index]
+                self.trip_seats_left[index] -= wanted
+
+                full = Decimal(wanted * self.trip_price[index])
+                base = full
+                if wanted > 1 and self.trip_discount[index]:
+                    base -= (full * self.trip_discount[index] / 100).quantize(
+                        Decimal("0.01")
+                    )
+                booking_status = status()
+                paid = Decimal("0.00")
+                payment_status = "pending"
+                if booking_status in ("confirmed", "completed", "no_show"):
+                    paid, payment_status = base, "paid"
+                elif booking_status == "pending" and self.rng.random() < 0.3:
+                    paid = (base / 2).quantize(Decimal("0.01"))
+                elif booking_status == "cancelled" and self.rng.random() < 0.5:
+                    payment_status = "refunded"
+
+                booking = Booking(
+                    id=self.uuid(),
+                    user_id=self.rng.choice(corper_ids),
+                    trip_id=self.trip_ids[index],
+                    selected_seats=wanted,
+                    seat_map=to_map(held, capacity),
+                    booking_status=booking_status,
+                    payment_status=payment_status,
+                    amount_paid=paid,
+                    balance_due=(
+                        Decimal("0.00") if payment_status == "refunded" else base - paid
+                    ),
+                    confirmed_at=self.now if booking_status != "pending" else None,
+                    cancelled_at=self.now if booking_status == "cancelled" else None,
+                    total_price=base,
+                    group_discount=full - base,
+                    quoted_at=self.now,
+                )
+                if booking_status in ("pending", "confirmed"):
+                    self.trip_taken[index] = self.trip_taken.get(index, 0) | held
+                if paid or payment_status == "refunded":
+                    payments.append(
+                        (booking.id, booking.user_id, paid or base, payment_status)
+                    )
+                yield booking
+
+        self.bulk(Booking, rows())
+        if skipped:
+            self.stdout.write(f"  {skipped:,} bookings skipped: trips were full")
+        self.seat_maps()
+        return payments, method
+
+    def seat_maps(self):
+        """Trips are written before their bookings; record the seats held."""
+        rows = (
+            Trip(
+                id=self.trip_ids[index],
+                seat_map=to_map(bits, self.trip_capacity[index]),
+            )
+            for index, bits in self.trip_taken.items()
+        )
+        while batch := list(itertools.islice(rows, self.batch_size)):
+            with transaction.atomic():
+                Trip.objects.bulk_update(batch, ["seat_map"], batch_size=1000)
+
+    def payments(self, payments, method):
+        letters = "ABCDEFGHJKLMNPQRSTUVWXYZ"
+        self.bulk(
+            Payment,
+            (
+                Payment(
+                    user_id=user_id,
+                    booking_id=booking_id,
+                    # Sequential, so unique without a lookup.
+                    payment_reference=f"{letters[i % len(letters)]}-{i:010X}",
+                    amount=amount,
+                    payment_method=method(),
+                    payment_gateway="paystack",
+                    status=status,
+                    paid_at=self.now,
+                )
+                for i, (booking_id, user_id, amount, status) in enumerate(payments)
+            ),
+        )
+
+
+class Command(BaseCommand):
+    help = "Bulk-generate synthetic users, vehicles, trips, bookings and payments."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--vendors", type=int, default=500)
+        parser.add_argument("--vehicles", type=int, default=2_000)
+        parser.add_argument("--corpers", type=int, default=50_000)
+        parser.add_argument("--trips", type=int, default=20_000)
+        parser.add_argument("--bookings", type=int, default=200_000)
+        parser.add_argument(
+            "--scale", type=float, default=1.0, help="multiply every row count"
+        )
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--prefix",
+            default="load",
+            help="prefix for unique fields, change it to seed the same database twice",
+        )
+        parser.add_argument(
+            "--start-date",
+            type=date.fromisoformat,
+            default=None,
+            help="first departure date (default: today)",
+        )
+        parser.add_argument(
+            "--peaks",
+            type=int,
+            nargs="+",
+            default=[14, 42, 70],
+            help="camp openings, in days after the start date",
+        )
+        parser.add_argument(
+            "--horizon", type=int, default=90, help="days of trips to generate"
+        )
+
+    def handle(self, *args, **options):
+        def scaled(name):
+            return max(1, int(options[name] * options["scale"]))
+
+        vendors, vehicles = scaled("vendors"), scaled("vehicles")
+        corpers, trips, bookings = (
+            scaled("corpers"),
+            scaled("trips"),
+            scaled("bookings"),
+        )
+        if vehicles < vendors:
+            raise CommandError("--vehicles must be at least --vendors")
+        if math.ceil(trips / vehicles) > (options["horizon"] + 1) * len(SLOTS):
+            raise CommandError("--trips is more than the vehicles can run in --horizon")
+
+        generator = LoadGenerator(
+            self.stdout,
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            prefix=options["prefix"],
+            start=options["start_date"] or timezone.localdate(),
+        )
+        started = time.perf_counter()
+
+        hashed = make_password(PASSWORD)
+        vendor_ids = generator.users("vendor", vendors, hashed)
+        corper_ids = generator.users("corper", corpers, hashed)
+        generator.vendor_profiles(vendor_ids)
+        generator.corper_profiles(corper_ids)
+        fleet = generator.vehicles(vendor_ids, vehicles)
+        generator.trips(fleet, trips, options["peaks"], options["horizon"])
+        payments, method = generator.bookings(corper_ids, bookings)
+        generator.payments(payments, method)
+
+        elapsed = time.perf_counter() - started
+        total = sum(rows for _, rows, _ in generator.report)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s). "
+                f"Every user's password is {PASSWORD!r}."
+            )
+        )
@@ -0,0 +1,34 @@
+"""
+Send queued notifications.
+
+Expands pending notification jobs (trip cancellations and reschedules) into
+one notification per recipient and channel, then sends pending
+notifications a batch at a time, each channel opened once per batch (one
+SMTP connection for the emails) until none are left. Run it after the jobs
+that queue notifications, or every few minutes. Usage::
+
+    python manage.py send_notifications --batch-size 200
+"""
+
+from django.core.management.base import BaseCommand
+
+from modules.notifications.services import BATCH_SIZE, expand_jobs, send_pending
+
+
+class Command(BaseCommand):
+    help = "Expand notification jobs and send pending notifications."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        while expand_jobs(options["batch_size"])["jobs"] == options["batch_size"]:
+            pass
+        sent = failed = 0
+        while True:
+            result = send_pending(options["batch_size"])
+            sent += result["sent"]
+            failed += result["failed"]
+            if result["sent"] + result["failed"] < options["batch_size"]:
+                break
+        self.stdout.write(f"{sent} sent, {failed} failed")
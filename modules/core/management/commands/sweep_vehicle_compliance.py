@@ -0,0 +1,39 @@
+"""
+Deactivate vehicles whose insurance or roadworthiness has expired.
+
+Run once a day, shortly after midnight, followed by ``send_notifications``
+to email the affected vendors. See
+``modules/trips/services/compliance_service.py``. Usage::
+
+    python manage.py sweep_vehicle_compliance
+    python manage.py sweep_vehicle_compliance --date 2026-01-31
+"""
+
+import logging
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from modules.trips.services.compliance_service import sweep_vehicle_compliance
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Deactivate vehicles with expired documents and hold their trips."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date",
+            type=date.fromisoformat,
+            default=None,
+            help="treat documents expiring before this date as expired (default: today)",
+        )
+
+    def handle(self, *args, **options):
+        result = sweep_vehicle_compliance(today=options["date"])
+        logger.info("Compliance sweep: %s", result, extra=result)
+        self.stdout.write(
+            f"{result['vehicles']} vehicle(s) deactivated, {result['trips']} trip(s) "
+            f"held, {result['notifications']} notification(s) queued"
+        )
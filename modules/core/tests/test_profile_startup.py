@@ -0,0 +1,30 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from modules.core.management.commands.profile_startup import parse_importtime
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     decouple.utils
+import time:      3500 |       3620 |   decouple
+import time:     48300 |      58619 | ninja.main
+"""
+
+
+def test_parse_importtime():
+    assert parse_importtime(IMPORTTIME) == [
+        ("decouple.utils", 120, 120),
+        ("decouple", 3500, 3620),
+        ("ninja.main", 48300, 58619),
+    ]
+
+
+def test_profile_startup_reports_modules_and_packages():
+    out = StringIO()
+    call_command("profile_startup", stage="setup", limit=1000, depth=1, stdout=out)
+    report = out.getvalue()
+    assert report.startswith("stage setup: ")
+    assert "  django\n" in report
+    # django.setup() doesn't import the API views.
+    assert "modules.bookings.views" not in report
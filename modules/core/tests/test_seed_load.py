@@ -0,0 +1,92 @@
+from collections import defaultdict
+from datetime import date, time
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import transaction
+from django.db.models import F, Sum
+
+from modules.bookings.models import Booking
+from modules.payments.models import Payment
+from modules.trips.models import Trip, Vehicle
+from modules.trips.services.seat_service import seat_numbers
+from modules.vendor.models import Vendor
+
+
+def seed(**options):
+    out = StringIO()
+    sizes = dict(vendors=5, vehicles=12, corpers=40, trips=30, bookings=200)
+    call_command("seed_load", batch_size=50, stdout=out, **{**sizes, **options})
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+def test_seed_load_generates_consistent_data(USER):
+    output = seed()
+
+    assert "rows/s" in output
+    assert USER.objects.filter(role="vendor").count() == 5
+    assert Vendor.objects.count() == 5
+    assert Vehicle.objects.count() == 12
+    assert Trip.objects.count() == 30
+    assert 0 < Booking.objects.count() <= 200
+
+    # Trips are never overbooked.
+    overbooked = Trip.objects.annotate(booked=Sum("bookings__selected_seats")).filter(
+        booked__gt=F("vehicle__capacity")
+    )
+    assert not overbooked.exists()
+
+    # Trip seat maps hold exactly the seats of their active bookings.
+    for trip in Trip.objects.prefetch_related("bookings"):
+        held = set()
+        for booking in trip.bookings.all():
+            if booking.booking_status in ("pending", "confirmed"):
+                assert held.isdisjoint(booking.seat_numbers)
+                held.update(booking.seat_numbers)
+        assert seat_numbers(trip.seat_map) == sorted(held)
+
+    # Bookings' paid amounts match their payments.
+    for booking in Booking.objects.filter(payment_status="paid"):
+        paid = Payment.objects.filter(booking=booking).aggregate(s=Sum("amount"))["s"]
+        assert paid == booking.amount_paid
+        assert booking.balance_due == 0
+
+
+@pytest.mark.django_db
+def test_seeded_vehicles_never_run_overlapping_trips():
+    # Three trips per vehicle crowded into two days.
+    seed(horizon=1, peaks=[1])
+
+    schedules = defaultdict(list)
+    for vehicle_id, day, start, end in Trip.objects.values_list(
+        "vehicle_id", "departure_date", "departure_time", "estimated_arrival_time"
+    ):
+        schedules[vehicle_id, day].append((start, end or time.max))
+    for trips in schedules.values():
+        trips.sort()
+        for (_, end), (start, _) in zip(trips, trips[1:]):
+            assert end <= start
+
+    with pytest.raises(CommandError):
+        seed(horizon=1, peaks=[1], trips=100, prefix="full")
+
+
+def trip_rows():
+    return list(
+        Trip.objects.order_by("id").values_list(
+            "id", "departure_date", "price_per_seat"
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_seed_load_is_deterministic():
+    with transaction.atomic():
+        seed(start_date=date(2026, 1, 1))
+        first = trip_rows()
+        transaction.set_rollback(True)
+
+    seed(start_date=date(2026, 1, 1))
+    assert trip_rows() == first
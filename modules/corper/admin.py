@@ -5,14 +5,10 @@ from .models import CorperProfile
 
 @admin.register(CorperProfile)
 class CorperProfileAdmin(admin.ModelAdmin):
-    list_display = [
-        "__str__",
-        "state_code",
-        "call_up_number",
-    ]  # if you have good __str__ on CorperProfile
-
-    # Or directly:
-    list_display = ["get_email", "get_full_name", "state_code"]
+    list_display = ["get_email", "get_full_name", "state_code", "call_up_number"]
+    list_select_related = ["user"]
+    search_fields = ["user__email__startswith", "call_up_number__startswith"]
+    raw_id_fields = ["user"]
 
     def get_email(self, obj):
         return obj.user.email
@@ -2,6 +2,8 @@ from ninja import Router
 from ninja.errors import HttpError
 from ninja_jwt.authentication import JWTAuth
 
+from engine.async_views import async_variant
+from engine.query_budget import query_budget
 from modules.authenticator.permissions import corper_required
 
 from .models import CorperProfile
@@ -10,30 +12,46 @@ from .schemas import CorperProfileIn, CorperProfileOut
 router = Router(tags=["Corper Profile"], auth=JWTAuth())
 
 
+def _profile_data(user, profile) -> dict:
+    return {
+        # User details
+        "email": user.email,
+        "full_name": user.full_name,
+        "role": user.role,
+        "user_phone": user.phone,  # from User model (if exists)
+        # CorperProfile details
+        "corper_phone": profile.phone,
+        "state_code": profile.state_code,
+        "call_up_number": profile.call_up_number,
+        "deployment_state": profile.deployment_state,
+        "camp_location": profile.camp_location,
+        "deployment_date": profile.deployment_date.isoformat(),
+    }
+
+
+@query_budget(2)
+@corper_required
+async def aget_corper_profile(request):
+    try:
+        profile = await CorperProfile.objects.aget(user=request.user)
+    except CorperProfile.DoesNotExist:
+        raise HttpError(404, "Corper profile not found")
+
+    return _profile_data(request.user, profile)
+
+
 @router.get("/profile", response=dict)  # or create a proper combined schema later
+@async_variant(aget_corper_profile)
+@query_budget(2)
 @corper_required
 def get_corper_profile(request):
     try:
         profile = request.user.corper_profile
-
-        return {
-            # User details
-            "email": request.user.email,
-            "full_name": request.user.full_name,
-            "role": request.user.role,
-            "user_phone": request.user.phone,  # from User model (if exists)
-            # CorperProfile details
-            "corper_phone": profile.phone,
-            "state_code": profile.state_code,
-            "call_up_number": profile.call_up_number,
-            "deployment_state": profile.deployment_state,
-            "camp_location": profile.camp_location,
-            "deployment_date": profile.deployment_date.isoformat(),
-        }
-
     except CorperProfile.DoesNotExist:
         raise HttpError(404, "Corper profile not found")
 
+    return _profile_data(request.user, profile)
+
 
 @router.patch("/profile", response=CorperProfileOut)
 @corper_required
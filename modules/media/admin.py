@@ -0,0 +1,18 @@
+from django.contrib import admin
+
+from .models import MediaFile, VehicleImage
+
+
+@admin.register(MediaFile)
+class MediaFileAdmin(admin.ModelAdmin):
+    list_display = ("name", "content_type", "size", "status", "created_at")
+    list_filter = ("status", "content_type")
+    raw_id_fields = ("uploaded_by",)
+    search_fields = ("sha256", "name")
+
+
+@admin.register(VehicleImage)
+class VehicleImageAdmin(admin.ModelAdmin):
+    list_display = ("vehicle", "media", "created_at")
+    list_select_related = ("vehicle__vendor", "media")
+    raw_id_fields = ("vehicle", "media")
@@ -0,0 +1,96 @@
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import models
+
+
+class MediaFile(models.Model):
+    """An uploaded file, stored once under the SHA-256 of its content.
+
+    Images get resized copies (``variants``, size name → storage name) from
+    ``process_media``; documents are ready as soon as they are stored.
+    """
+
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("ready", "Ready"),
+        ("failed", "Failed"),
+    )
+
+    id = models.BigAutoField(primary_key=True, editable=False)
+    sha256 = models.CharField(max_length=64, unique=True)
+    name = models.CharField(max_length=255, help_text="Storage name of the original")
+    content_type = models.CharField(max_length=100)
+    size = models.PositiveBigIntegerField(help_text="Bytes")
+    variants = models.JSONField(default=dict, blank=True)
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    error = models.TextField(blank=True)
+
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="media_files",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "media_files"
+        indexes = [
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.status})"
+
+    @property
+    def is_image(self):
+        return self.content_type.startswith("image/")
+
+    @property
+    def url(self):
+        return default_storage.url(self.name)
+
+    def variant_url(self, size):
+        name = self.variants.get(size)
+        return default_storage.url(name) if name else None
+
+
+class VehicleImage(models.Model):
+    vehicle = models.ForeignKey(
+        "trips.Vehicle", on_delete=models.CASCADE, related_name="images"
+    )
+    media = models.ForeignKey(
+        MediaFile, on_delete=models.PROTECT, related_name="vehicle_images"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "vehicle_images"
+        ordering = ["created_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["vehicle", "media"], name="vehicle_image_once"
+            ),
+        ]
+
+    def __str__(self):
+        return f"Image {self.media_id} of vehicle {self.vehicle_id}"
+
+    # Listings read these with the media row loaded (see prefetch_images).
+    @property
+    def status(self):
+        return self.media.status
+
+    @property
+    def original(self):
+        return self.media.url
+
+    @property
+    def thumbnail(self):
+        return self.media.variant_url("thumbnail")
+
+    @property
+    def medium(self):
+        return self.media.variant_url("medium")
@@ -0,0 +1,83 @@
+"""
+Resized copies of uploaded images, made by the ``process_media`` worker.
+
+Each pending image gets a JPEG per ``SIZES`` entry next to its original,
+``ab/abcd…/thumbnail.jpg`` and so on. Listings serve those; until they exist
+an image is listed without sized URLs rather than with the full-size
+original. A copy that already exists in storage is not made again. Kept
+apart from ``services`` so the web workers never import Pillow.
+"""
+
+import io
+import logging
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models.functions import Now
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from modules.trips.models import Vehicle
+
+from .models import MediaFile
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+
+# Longest edge in pixels of each resized copy; images are never enlarged.
+SIZES = {"thumbnail": 320, "medium": 1280}
+JPEG_QUALITY = 82
+
+
+def variant_name(sha256: str, size: str) -> str:
+    return f"{sha256[:2]}/{sha256}/{size}.jpg"
+
+
+def _resize(image, edge: int) -> bytes:
+    copy = image.copy()
+    copy.thumbnail((edge, edge))
+    buffer = io.BytesIO()
+    copy.save(buffer, "JPEG", quality=JPEG_QUALITY, optimize=True)
+    return buffer.getvalue()
+
+
+def make_variants(media) -> dict:
+    """Write the resized copies of an image; return size name → storage name."""
+    variants = {}
+    with default_storage.open(media.name) as original, Image.open(original) as image:
+        # Lets JPEGs decode at a fraction of their size when that is enough.
+        image.draft("RGB", (max(SIZES.values()),) * 2)
+        image = ImageOps.exif_transpose(image).convert("RGB")
+        for size, edge in SIZES.items():
+            name = variant_name(media.sha256, size)
+            if not default_storage.exists(name):
+                name = default_storage.save(name, ContentFile(_resize(image, edge)))
+            variants[size] = name
+    return variants
+
+
+def process_pending(batch_size: int = BATCH_SIZE) -> dict:
+    """Resize up to ``batch_size`` pending images; return the counts."""
+    pending = list(
+        MediaFile.objects.filter(status="pending").order_by("created_at")[:batch_size]
+    )
+    done, failed = [], []
+    for media in pending:
+        try:
+            media.variants = make_variants(media)
+        except Exception as exc:
+            logger.warning("Could not process media %s: %s", media.pk, exc)
+            media.status, media.error = "failed", str(exc)
+            failed.append(media)
+        else:
+            media.status = "ready"
+            media.processed_at = timezone.now()
+            done.append(media)
+
+    MediaFile.objects.bulk_update(
+        done + failed, ["variants", "status", "error", "processed_at"]
+    )
+    # The vehicles' listings now carry different URLs.
+    Vehicle.objects.filter(images__media__in=done).update(updated_at=Now())
+    return {"ready": len(done), "failed": len(failed)}
@@ -0,0 +1,18 @@
+from typing import Optional
+
+from ninja import Schema
+
+
+class VehicleImageOut(Schema):
+    id: int
+    status: str
+    thumbnail: Optional[str] = None
+    medium: Optional[str] = None
+    original: str
+
+
+class DocumentOut(Schema):
+    id: int
+    url: str
+    content_type: str
+    size: int
@@ -0,0 +1,150 @@
+"""
+Uploaded vehicle images and vendor verification documents.
+
+Uploads are stored through Django's default storage (local disk under
+``MEDIA_ROOT`` unless ``MEDIA_STORAGE_BACKEND`` names another backend) at a
+name made from the SHA-256 of their content, ``ab/abcd…/original.jpg``, so
+the same file uploaded twice, by anyone, is stored and processed once. The
+type is taken from the file's leading bytes, not from what the client sent.
+
+Images are resized by ``processing.process_pending`` in the
+``process_media`` worker, never on the request thread.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch
+from django.db.models.functions import Now
+from django.utils import timezone
+from ninja.errors import HttpError
+
+from modules.trips.crud.vehicle_crud import VehicleCRUD
+from modules.trips.models import Vehicle
+from modules.vendor.models import Vendor
+
+from .models import MediaFile, VehicleImage
+
+MAX_VEHICLE_IMAGES = 10
+
+IMAGE_TYPES = {"image/jpeg", "image/png", "image/webp"}
+DOCUMENT_TYPES = IMAGE_TYPES | {"application/pdf"}
+EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "application/pdf": ".pdf",
+}
+
+_vehicles = VehicleCRUD()
+
+
+def sniff(head: bytes):
+    """The content type of a file starting with ``head``, or None."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head.startswith(b"%PDF-"):
+        return "application/pdf"
+    return None
+
+
+def original_name(sha256: str, content_type: str) -> str:
+    return f"{sha256[:2]}/{sha256}/original{EXTENSIONS[content_type]}"
+
+
+def store_upload(upload, user, allowed, sha256=None) -> MediaFile:
+    """Store ``upload`` unless a file with the same content already is.
+
+    ``sha256`` is the digest computed while the upload streamed in (see
+    ``uploads.HashingUploadHandler``); without it the file is hashed here.
+    Raises 413 for files over ``MEDIA_MAX_UPLOAD_SIZE`` and 415 for types
+    outside ``allowed``.
+    """
+    if upload.size > settings.MEDIA_MAX_UPLOAD_SIZE:
+        raise HttpError(413, "File is too large")
+    upload.seek(0)
+    content_type = sniff(upload.read(16))
+    if content_type not in allowed:
+        raise HttpError(415, "Unsupported file type")
+    if sha256 is None:
+        digest = hashlib.sha256()
+        for chunk in upload.chunks():
+            digest.update(chunk)
+        sha256 = digest.hexdigest()
+
+    existing = MediaFile.objects.filter(sha256=sha256).first()
+    if existing is not None:
+        return existing
+
+    expected = original_name(sha256, content_type)
+    name = expected
+    if not default_storage.exists(name):
+        upload.seek(0)
+        name = default_storage.save(name, upload)
+    is_image = content_type in IMAGE_TYPES
+    try:
+        with transaction.atomic():
+            return MediaFile.objects.create(
+                sha256=sha256,
+                name=name,
+                content_type=content_type,
+                size=upload.size,
+                uploaded_by=user,
+                status="pending" if is_image else "ready",
+                processed_at=None if is_image else timezone.now(),
+            )
+    except IntegrityError:
+        # Someone stored the same content meanwhile; the storage may have
+        # given our copy another name.
+        if name != expected:
+            default_storage.delete(name)
+        return MediaFile.objects.get(sha256=sha256)
+
+
+def prefetch_images() -> Prefetch:
+    """Load vehicles' images with their media in one query."""
+    return Prefetch("images", queryset=VehicleImage.objects.select_related("media"))
+
+
+@transaction.atomic
+def add_vehicle_image(vendor, vehicle_id, upload, sha256=None) -> VehicleImage:
+    vehicle = _vehicles.get_vehicle_by_id(vehicle_id, vendor=vendor)
+    if vehicle.images.count() >= MAX_VEHICLE_IMAGES:
+        raise HttpError(400, f"A vehicle can have at most {MAX_VEHICLE_IMAGES} images")
+    media = store_upload(upload, vendor, IMAGE_TYPES, sha256)
+    image, _created = VehicleImage.objects.get_or_create(vehicle=vehicle, media=media)
+    Vehicle.objects.filter(pk=vehicle.pk).update(updated_at=Now())
+    return image
+
+
+def remove_vehicle_image(vendor, vehicle_id, image_id) -> bool:
+    deleted, _ = VehicleImage.objects.filter(
+        pk=image_id, vehicle_id=vehicle_id, vehicle__vendor=vendor
+    ).delete()
+    if not deleted:
+        raise HttpError(404, "Image does not exist")
+    Vehicle.objects.filter(pk=vehicle_id).update(updated_at=Now())
+    return True
+
+
+def add_verification_document(user, upload, sha256=None) -> MediaFile:
+    """Store a verification document and add its URL to the vendor's
+    ``verification_documents``."""
+    try:
+        profile = user.vendor_profile
+    except Vendor.DoesNotExist:
+        raise HttpError(404, "Vendor profile not found")
+    media = store_upload(upload, user, DOCUMENT_TYPES, sha256)
+    documents = list(profile.verification_documents or [])
+    if media.url not in documents:
+        documents.append(media.url)
+        Vendor.objects.filter(pk=profile.pk).update(
+            verification_documents=documents, updated_at=Now()
+        )
+    return media
@@ -0,0 +1,165 @@
+import hashlib
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import Client
+from ninja.errors import HttpError
+from ninja_jwt.tokens import AccessToken
+from PIL import Image
+
+from modules.media.models import MediaFile, VehicleImage
+from modules.media.processing import process_pending
+from modules.media.services import (
+    IMAGE_TYPES,
+    add_vehicle_image,
+    add_verification_document,
+    store_upload,
+)
+from modules.trips.models import Vehicle, VehicleType
+from modules.vendor.models import Vendor
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def vendor(USER):
+    user = USER.objects.create_user(
+        email="vendor@example.com", password="Password1!", role="vendor"
+    )
+    Vendor.objects.create(
+        user=user,
+        phone="08012345678",
+        business_name="Swift",
+        business_registration_number="RC-1",
+        years_in_operation=3,
+    )
+    return user
+
+
+@pytest.fixture
+def vehicle(vendor):
+    return Vehicle.objects.create(
+        vendor=vendor,
+        registration_number="ABC-123DE",
+        vehicle_type=VehicleType.objects.create(name="Bus"),
+        make_model="Toyota Hiace",
+        capacity=14,
+    )
+
+
+def jpeg(width=2000, height=1000, color="red"):
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), color).save(buffer, "JPEG")
+    return SimpleUploadedFile("photo.jpg", buffer.getvalue(), "image/jpeg")
+
+
+@pytest.mark.django_db
+def test_same_content_is_stored_once(vendor):
+    first = store_upload(jpeg(), vendor, IMAGE_TYPES)
+    second = store_upload(jpeg(), vendor, IMAGE_TYPES)
+
+    assert second.pk == first.pk
+    assert MediaFile.objects.count() == 1
+    assert first.name == f"{first.sha256[:2]}/{first.sha256}/original.jpg"
+    assert default_storage.exists(first.name)
+    assert first.status == "pending"
+
+
+@pytest.mark.django_db
+def test_type_comes_from_the_content(vendor):
+    fake = SimpleUploadedFile("photo.jpg", b"<html></html>", "image/jpeg")
+    with pytest.raises(HttpError) as exc:
+        store_upload(fake, vendor, IMAGE_TYPES)
+    assert exc.value.status_code == 415
+
+
+@pytest.mark.django_db
+def test_too_large_uploads_are_rejected(vendor, settings):
+    settings.MEDIA_MAX_UPLOAD_SIZE = 100
+    with pytest.raises(HttpError) as exc:
+        store_upload(jpeg(), vendor, IMAGE_TYPES)
+    assert exc.value.status_code == 413
+    assert not MediaFile.objects.exists()
+
+
+@pytest.mark.django_db
+def test_processing_makes_sized_copies(vendor, vehicle):
+    image = add_vehicle_image(vendor, vehicle.pk, jpeg())
+    assert image.thumbnail is None
+    Vehicle.objects.filter(pk=vehicle.pk).update(updated_at="2020-01-01T00:00Z")
+
+    assert process_pending() == {"ready": 1, "failed": 0}
+
+    image = VehicleImage.objects.select_related("media").get()
+    assert image.status == "ready"
+    for size, edge in (("thumbnail", 320), ("medium", 1280)):
+        with default_storage.open(image.media.variants[size]) as copy:
+            assert Image.open(copy).size == (edge, edge // 2)
+    assert image.thumbnail.endswith("/thumbnail.jpg")
+    vehicle.refresh_from_db()
+    assert vehicle.updated_at.year > 2020
+
+
+@pytest.mark.django_db
+def test_unreadable_images_fail(vendor):
+    broken = SimpleUploadedFile("photo.jpg", b"\xff\xd8\xff" + b"\0" * 64)
+    media = store_upload(broken, vendor, IMAGE_TYPES)
+
+    assert process_pending() == {"ready": 0, "failed": 1}
+    media.refresh_from_db()
+    assert media.status == "failed" and media.error
+
+
+@pytest.mark.django_db
+def test_documents_are_added_to_the_profile(vendor):
+    pdf = SimpleUploadedFile("cac.pdf", b"%PDF-1.4 certificate", "application/pdf")
+    media = add_verification_document(vendor, pdf)
+
+    assert media.status == "ready"
+    profile = Vendor.objects.get(user=vendor)
+    assert profile.verification_documents == [media.url]
+
+    add_verification_document(vendor, pdf)
+    profile.refresh_from_db()
+    assert profile.verification_documents == [media.url]
+
+
+@pytest.mark.django_db
+def test_upload_then_list_serves_sized_images(vendor, vehicle):
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(vendor)}")
+
+    photo = jpeg()
+    response = client.post(f"/api/vendor/vehicles/{vehicle.pk}/images", {"file": photo})
+    assert response.status_code == 200, response.content
+    assert response.json()["status"] == "pending"
+    assert response.json()["thumbnail"] is None
+    photo.seek(0)
+    assert MediaFile.objects.get().sha256 == hashlib.sha256(photo.read()).hexdigest()
+
+    call_command("process_media", stdout=StringIO())
+
+    listed = client.get("/api/vendor/vehicles/").json()
+    images = listed[0]["images"]
+    assert images[0]["status"] == "ready"
+    assert images[0]["thumbnail"].endswith("/thumbnail.jpg")
+    assert images[0]["medium"].endswith("/medium.jpg")
+
+
+@pytest.mark.django_db
+def test_oversized_uploads_stop_while_streaming(vendor, vehicle, settings):
+    settings.MEDIA_MAX_UPLOAD_SIZE = 1000
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(vendor)}")
+
+    response = client.post(
+        f"/api/vendor/vehicles/{vehicle.pk}/images", {"file": jpeg()}
+    )
+
+    assert response.status_code == 413
+    assert not MediaFile.objects.exists()
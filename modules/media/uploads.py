@@ -0,0 +1,42 @@
+"""
+Upload handler that hashes files while they stream in.
+
+Listed first in ``FILE_UPLOAD_HANDLERS``, it sees every chunk of a multipart
+upload before Django's memory and temporary-file handlers store it. It keeps
+a running SHA-256 of each file, so storing the upload doesn't read it again
+to find its content address, and it answers 413 as soon as a file passes
+``MEDIA_MAX_UPLOAD_SIZE`` instead of spooling the rest of it to disk.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.files.uploadhandler import FileUploadHandler
+from ninja.errors import HttpError
+
+
+class HashingUploadHandler(FileUploadHandler):
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.digest = hashlib.sha256()
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > settings.MEDIA_MAX_UPLOAD_SIZE:
+            raise HttpError(413, "File is too large")
+        self.digest.update(raw_data)
+        return raw_data
+
+    def file_complete(self, file_size):
+        if self.request is not None:
+            if not hasattr(self.request, "upload_digests"):
+                self.request.upload_digests = {}
+            self.request.upload_digests[self.field_name] = self.digest.hexdigest()
+        # The next handler builds the file object.
+        return None
+
+
+def upload_digest(request, field_name):
+    """The SHA-256 of the file uploaded as ``field_name``, if it was hashed."""
+    return getattr(request, "upload_digests", {}).get(field_name)
@@ -0,0 +1,29 @@
+from django.contrib import admin
+
+from engine.admin import LargeTableAdmin
+
+from .models import Notification, NotificationJob
+
+
+@admin.register(NotificationJob)
+class NotificationJobAdmin(admin.ModelAdmin):
+    list_display = ("kind", "trip", "status", "recipients", "created_at")
+    list_filter = ("status", "kind")
+    raw_id_fields = ("trip",)
+
+
+@admin.register(Notification)
+class NotificationAdmin(LargeTableAdmin):
+    list_display = (
+        "kind",
+        "user",
+        "channel",
+        "recipient",
+        "status",
+        "created_at",
+        "sent_at",
+    )
+    list_filter = ("status", "channel", "kind")
+    list_select_related = ("user",)
+    search_fields = ("user__email__startswith", "recipient__startswith")
+    raw_id_fields = ("user", "job")
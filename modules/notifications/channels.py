@@ -0,0 +1,61 @@
+"""
+Delivery channels for queued notifications.
+
+``send_pending`` opens each channel once per batch and sends all of that
+channel's notifications through it, so a batch of emails shares one SMTP
+connection. ``NOTIFICATION_CHANNELS`` maps channel names to the classes
+used; SMS goes to ``LocalSmsChannel`` until a provider's class is named in
+``SMS_CHANNEL``. A channel's ``send`` raises when a message can't be
+delivered, and that notification alone is marked failed.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Messages "sent" by LocalSmsChannel, like django.core.mail.outbox in tests.
+outbox = []
+
+
+def get_channel(name: str):
+    return import_string(settings.NOTIFICATION_CHANNELS[name])()
+
+
+class EmailChannel:
+    def __enter__(self):
+        self.connection = get_connection()
+        self.connection.open()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.connection.close()
+
+    def send(self, notification) -> None:
+        EmailMessage(
+            notification.subject,
+            notification.body,
+            settings.DEFAULT_FROM_EMAIL,
+            [notification.recipient or notification.user.email],
+            connection=self.connection,
+        ).send()
+
+
+class LocalSmsChannel:
+    """Stand-in SMS gateway for development: logs each text and keeps it
+    in ``outbox`` instead of sending it."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def send(self, notification) -> None:
+        if not notification.recipient:
+            raise ValueError("No phone number")
+        logger.info("SMS to %s: %s", notification.recipient, notification.body)
+        outbox.append((notification.recipient, notification.body))
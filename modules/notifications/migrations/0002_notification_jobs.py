@@ -0,0 +1,130 @@
+# Generated by Django 5.2 on 2026-10-19 07:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bookings", "0009_booking_booked_at_index"),
+        ("notifications", "0001_initial"),
+        ("trips", "0004_seat_map"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="channel",
+            field=models.CharField(
+                choices=[("email", "Email"), ("sms", "SMS")],
+                default="email",
+                max_length=10,
+            ),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="claimed_at",
+            field=models.DateTimeField(
+                blank=True, help_text="When a send_notifications run took it", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="recipient",
+            field=models.CharField(
+                blank=True,
+                help_text="Email address or phone number; blank sends to the user's email",
+                max_length=254,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="notification",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("sending", "Sending"),
+                    ("sent", "Sent"),
+                    ("failed", "Failed"),
+                ],
+                default="pending",
+                max_length=20,
+            ),
+        ),
+        migrations.CreateModel(
+            name="NotificationJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("trip_cancelled", "Trip cancelled"),
+                            ("trip_rescheduled", "Trip rescheduled"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                ("subject", models.CharField(max_length=200)),
+                ("body", models.TextField()),
+                (
+                    "occurred_at",
+                    models.DateTimeField(help_text="When the change was made"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("pending", "Pending"), ("expanded", "Expanded")],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("recipients", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("expanded_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "bookings",
+                    models.ManyToManyField(
+                        blank=True,
+                        help_text="The bookings a cancellation cancelled; their holders are told",
+                        related_name="notification_jobs",
+                        to="bookings.booking",
+                    ),
+                ),
+                (
+                    "trip",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="notification_jobs",
+                        to="trips.trip",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "notification_jobs",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="job",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="notifications",
+                to="notifications.notificationjob",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notificationjob",
+            index=models.Index(
+                fields=["status", "created_at"], name="notificatio_status_5b9327_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,109 @@
+from django.conf import settings
+from django.db import models
+
+
+class NotificationJob(models.Model):
+    """A change to tell everyone it affects about.
+
+    Written in the transaction that makes the change; ``send_notifications``
+    later expands it into one ``Notification`` per recipient and channel.
+    """
+
+    KIND_CHOICES = (
+        ("trip_cancelled", "Trip cancelled"),
+        ("trip_rescheduled", "Trip rescheduled"),
+    )
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("expanded", "Expanded"),
+    )
+
+    id = models.BigAutoField(primary_key=True, editable=False)
+    kind = models.CharField(max_length=50, choices=KIND_CHOICES)
+    trip = models.ForeignKey(
+        "trips.Trip", on_delete=models.CASCADE, related_name="notification_jobs"
+    )
+    subject = models.CharField(max_length=200)
+    body = models.TextField()
+    occurred_at = models.DateTimeField(help_text="When the change was made")
+    bookings = models.ManyToManyField(
+        "bookings.Booking",
+        blank=True,
+        related_name="notification_jobs",
+        help_text="The bookings a cancellation cancelled; their holders are told",
+    )
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    recipients = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expanded_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "notification_jobs"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} of trip {self.trip_id} ({self.status})"
+
+
+class Notification(models.Model):
+    """A message queued for a user, sent later by ``send_notifications``."""
+
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("sending", "Sending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    )
+    CHANNEL_CHOICES = (
+        ("email", "Email"),
+        ("sms", "SMS"),
+    )
+
+    id = models.BigAutoField(primary_key=True, editable=False)
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="notifications",
+    )
+
+    job = models.ForeignKey(
+        NotificationJob,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="notifications",
+    )
+    channel = models.CharField(max_length=10, choices=CHANNEL_CHOICES, default="email")
+    recipient = models.CharField(
+        max_length=254,
+        blank=True,
+        help_text="Email address or phone number; blank sends to the user's email",
+    )
+
+    kind = models.CharField(max_length=50, help_text="e.g. vehicle_noncompliant")
+    subject = models.CharField(max_length=200)
+    body = models.TextField()
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    claimed_at = models.DateTimeField(
+        null=True, blank=True, help_text="When a send_notifications run took it"
+    )
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "notifications"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} → user {self.user_id} ({self.status})"
@@ -0,0 +1,215 @@
+"""
+Queued user notifications.
+
+Jobs that notify many users (e.g. the vehicle compliance sweep) insert
+``Notification`` rows in bulk inside their own transaction, so nothing is
+sent for work that rolled back. ``send_pending`` delivers them later, a
+batch at a time, opening each channel (see ``channels.py``) once per batch.
+It first claims the batch (status ``sending``), skipping rows another run
+has locked, so overlapping runs never send the same notification, and it
+records each channel's results before opening the next.
+
+Changes that affect everyone booked on a trip, a cancellation or a new
+departure time, write a single ``NotificationJob`` in the transaction that
+makes them; a cancellation's job is linked to the bookings it cancelled.
+``expand_jobs`` turns each job into one notification per recipient and
+channel: the recipients come from one query over the trip's bookings, and
+the rows are inserted with one ``bulk_create``, however many corpers are
+booked. A job is marked expanded only if it is still pending, so a run that
+loses the race to an overlapping one queues nothing for it.
+``send_notifications`` expands jobs before sending.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Now
+from django.utils import timezone
+
+from modules.bookings.models import Booking
+
+from .channels import get_channel
+from .models import Notification, NotificationJob
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+# Claims older than this were left by a run that died; they are sent again.
+CLAIM_TIMEOUT = timedelta(minutes=15)
+
+
+def queue_notifications(notifications) -> list:
+    return Notification.objects.bulk_create(notifications, batch_size=BATCH_SIZE)
+
+
+def _departure(day, at) -> str:
+    return f"{day:%a %d %b} at {at:%H:%M}"
+
+
+def queue_trip_cancelled(trip, booking_ids, occurred_at) -> NotificationJob:
+    """Tell the holders of ``booking_ids``, the bookings the cancellation
+    cancelled."""
+    when = _departure(trip.departure_date, trip.departure_time)
+    job = NotificationJob.objects.create(
+        kind="trip_cancelled",
+        trip=trip,
+        subject=f"Trip cancelled: {trip.departure_city} → {trip.destination_camp}, {when}",
+        body=(
+            f"Your trip from {trip.departure_city}, {trip.departure_state} to "
+            f"{trip.destination_camp} on {when} has been cancelled by the "
+            "vendor, and your booking on it is cancelled."
+        ),
+        occurred_at=occurred_at,
+    )
+    NotificationJob.bookings.through.objects.bulk_create(
+        [
+            NotificationJob.bookings.through(notificationjob=job, booking_id=pk)
+            for pk in booking_ids
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    return job
+
+
+def queue_trip_rescheduled(trip, previous_date, previous_time, occurred_at):
+    """Tell the holders of the trip's active bookings about its new departure."""
+    before = _departure(previous_date, previous_time)
+    when = _departure(trip.departure_date, trip.departure_time)
+    return NotificationJob.objects.create(
+        kind="trip_rescheduled",
+        trip=trip,
+        subject=f"Trip rescheduled: {trip.departure_city} → {trip.destination_camp}, now {when}",
+        body=(
+            f"Your trip from {trip.departure_city}, {trip.departure_state} to "
+            f"{trip.destination_camp} now departs on {when} instead of {before}. "
+            "Your booking stays valid; cancel it from your bookings if the new "
+            "time doesn't suit you."
+        ),
+        occurred_at=occurred_at,
+    )
+
+
+def _recipients(job) -> list:
+    """``(user_id, email, phone)`` of everyone ``job`` concerns, in one query."""
+    if job.kind == "trip_cancelled":
+        bookings = job.bookings.all()
+    else:
+        bookings = Booking.objects.filter(
+            trip_id=job.trip_id, booking_status__in=("pending", "confirmed")
+        )
+    return list(
+        bookings.order_by()
+        .values_list("user_id", "user__email", "user__phone")
+        .distinct()
+    )
+
+
+def expand_jobs(batch_size: int = BATCH_SIZE) -> dict:
+    """Queue the notifications of up to ``batch_size`` pending jobs: an email
+    to every recipient and a text to those with a phone number."""
+    jobs = list(
+        NotificationJob.objects.filter(status="pending").order_by("created_at")[
+            :batch_size
+        ]
+    )
+    expanded = queued = 0
+    for job in jobs:
+        with transaction.atomic():
+            recipients = _recipients(job)
+            # Blocks while another run expands the job, then finds it done
+            if not NotificationJob.objects.filter(pk=job.pk, status="pending").update(
+                status="expanded", recipients=len(recipients), expanded_at=Now()
+            ):
+                continue
+            notifications = []
+            for user_id, email, phone in recipients:
+                notifications.append(
+                    Notification(
+                        user_id=user_id,
+                        job=job,
+                        channel="email",
+                        recipient=email,
+                        kind=job.kind,
+                        subject=job.subject,
+                        body=job.body,
+                    )
+                )
+                if phone:
+                    notifications.append(
+                        Notification(
+                            user_id=user_id,
+                            job=job,
+                            channel="sms",
+                            recipient=phone,
+                            kind=job.kind,
+                            subject=job.subject,
+                            body=job.subject,
+                        )
+                    )
+            queue_notifications(notifications)
+        expanded += 1
+        queued += len(notifications)
+    return {"jobs": expanded, "notifications": queued}
+
+
+def _claim(batch_size: int) -> list:
+    """Take up to ``batch_size`` pending notifications for this run."""
+    stale = timezone.now() - CLAIM_TIMEOUT
+    with transaction.atomic():
+        claimed = list(
+            Notification.objects.select_for_update(skip_locked=True)
+            .filter(Q(status="pending") | Q(status="sending", claimed_at__lt=stale))
+            .order_by("created_at")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        Notification.objects.filter(pk__in=claimed).update(
+            status="sending", claimed_at=Now()
+        )
+    return list(
+        Notification.objects.filter(pk__in=claimed)
+        .select_related("user")
+        .order_by("created_at")
+    )
+
+
+def _record(notifications, sent, failed) -> None:
+    """Store one channel's results; what it never tried goes back to pending."""
+    Notification.objects.filter(pk__in=sent).update(status="sent", sent_at=Now())
+    Notification.objects.bulk_update(failed, ["status", "error"])
+    tried = set(sent) | {notification.pk for notification in failed}
+    Notification.objects.filter(
+        pk__in=[n.pk for n in notifications if n.pk not in tried]
+    ).update(status="pending", claimed_at=None)
+
+
+def send_pending(batch_size: int = BATCH_SIZE) -> dict:
+    """Send up to ``batch_size`` pending notifications; return the counts."""
+    by_channel = defaultdict(list)
+    for notification in _claim(batch_size):
+        by_channel[notification.channel].append(notification)
+
+    counts = {"sent": 0, "failed": 0}
+    for name, notifications in by_channel.items():
+        sent, failed = [], []
+        try:
+            with get_channel(name) as channel:
+                for notification in notifications:
+                    try:
+                        channel.send(notification)
+                    except Exception as exc:
+                        logger.warning(
+                            "Could not send notification %s: %s", notification.pk, exc
+                        )
+                        notification.status, notification.error = "failed", str(exc)
+                        failed.append(notification)
+                    else:
+                        sent.append(notification.pk)
+        except Exception as exc:
+            logger.warning("Could not use the %s channel: %s", name, exc)
+        _record(notifications, sent, failed)
+        counts["sent"] += len(sent)
+        counts["failed"] += len(failed)
+    return counts
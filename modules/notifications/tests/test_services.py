@@ -0,0 +1,253 @@
+from datetime import date, time, timedelta
+from io import StringIO
+
+import pytest
+from django.core import mail
+from django.core.mail import EmailMessage
+from django.core.management import call_command
+from django.utils import timezone
+from ninja.errors import HttpError
+
+from engine.query_budget import assert_max_queries
+from modules.bookings.models import Booking
+from modules.notifications import channels, services
+from modules.notifications.models import Notification, NotificationJob
+from modules.notifications.services import (
+    CLAIM_TIMEOUT,
+    expand_jobs,
+    queue_notifications,
+    send_pending,
+)
+from modules.trips.models import Trip, Vehicle, VehicleType
+from modules.trips.schemas import TripIn
+from modules.trips.services.trip_services import TripService
+
+
+@pytest.mark.django_db
+def test_pending_notifications_are_emailed_in_batches(USER, monkeypatch):
+    users = [
+        USER.objects.create_user(f"user{i}@example.com", password="pass")
+        for i in range(3)
+    ]
+    queue_notifications(
+        [
+            Notification(user=user, kind="test", subject="Hello", body="Body")
+            for user in users
+        ]
+    )
+
+    send = EmailMessage.send
+
+    def flaky_send(message, *args, **kwargs):
+        if message.to == ["user1@example.com"]:
+            raise OSError("mailbox unavailable")
+        return send(message, *args, **kwargs)
+
+    monkeypatch.setattr(EmailMessage, "send", flaky_send)
+    out = StringIO()
+    call_command("send_notifications", batch_size=2, stdout=out)
+
+    assert out.getvalue().strip() == "2 sent, 1 failed"
+    assert sorted(m.to[0] for m in mail.outbox) == [
+        "user0@example.com",
+        "user2@example.com",
+    ]
+    failed = Notification.objects.get(status="failed")
+    assert failed.user == users[1]
+    assert failed.error == "mailbox unavailable"
+    assert (
+        Notification.objects.filter(status="sent", sent_at__isnull=False).count() == 2
+    )
+
+
+class UnreachableChannel:
+    def __enter__(self):
+        raise OSError("gateway unreachable")
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+@pytest.mark.django_db
+def test_claimed_notifications_are_not_sent_twice(USER):
+    user = USER.objects.create_user("user@example.com", password="pass")
+    now = timezone.now()
+    taken, stale, pending = queue_notifications(
+        [Notification(user=user, kind="test", subject=s, body="Body") for s in "ABC"]
+    )
+    # Another run is sending one; a run that died left the other claimed.
+    Notification.objects.filter(pk=taken.pk).update(status="sending", claimed_at=now)
+    Notification.objects.filter(pk=stale.pk).update(
+        status="sending", claimed_at=now - CLAIM_TIMEOUT - timedelta(minutes=1)
+    )
+
+    assert send_pending() == {"sent": 2, "failed": 0}
+    assert sorted(m.subject for m in mail.outbox) == ["B", "C"]
+    assert Notification.objects.get(pk=taken.pk).status == "sending"
+    assert send_pending() == {"sent": 0, "failed": 0}
+
+
+@pytest.mark.django_db
+def test_a_channel_that_cannot_open_leaves_the_others_recorded(USER, settings):
+    settings.NOTIFICATION_CHANNELS = {
+        **settings.NOTIFICATION_CHANNELS,
+        "sms": f"{__name__}.UnreachableChannel",
+    }
+    user = USER.objects.create_user("user@example.com", password="pass")
+    queue_notifications(
+        [
+            Notification(user=user, channel=channel, kind="test", subject="Hi")
+            for channel in ("email", "sms", "email")
+        ]
+    )
+
+    assert send_pending() == {"sent": 2, "failed": 0}
+    assert len(mail.outbox) == 2
+    statuses = dict(Notification.objects.values_list("channel", "status").distinct())
+    assert statuses == {"email": "sent", "sms": "pending"}
+
+
+@pytest.fixture
+def booked_trip(USER):
+    vendor = USER.objects.create_user("vendor@example.com", role="vendor")
+    vehicle = Vehicle.objects.create(
+        vendor=vendor,
+        registration_number="ABC-123DE",
+        vehicle_type=VehicleType.objects.create(name="Bus"),
+        make_model="Toyota Hiace",
+        capacity=14,
+    )
+    trip = Trip.objects.create(
+        vendor=vendor,
+        vehicle=vehicle,
+        departure_state="Lagos",
+        departure_city="Ikeja",
+        destination_camp="Iyana-Ipaja",
+        departure_date=date.today() + timedelta(days=3),
+        departure_time=time(8),
+        price_per_seat=5000,
+        available_seats=14,
+    )
+    for n, status in enumerate(["pending", "confirmed", "confirmed", "cancelled"]):
+        corper = USER.objects.create_user(
+            f"corper{n}@example.com", role="corper", phone=f"0801000000{n}"
+        )
+        Booking.objects.create(user=corper, trip=trip, booking_status=status)
+    # A second booking by the same corper is one recipient.
+    Booking.objects.create(
+        user=USER.objects.get(email="corper1@example.com"), trip=trip
+    )
+    Booking.objects.filter(user__email="corper2@example.com").update(
+        user=USER.objects.create_user("nophone@example.com", role="corper")
+    )
+    return vendor, trip
+
+
+def trip_in(trip, **changes):
+    fields = {
+        "vehicle_id": trip.vehicle_id,
+        "departure_city": trip.departure_city,
+        "departure_state": trip.departure_state,
+        "destination_camp": trip.destination_camp,
+        "departure_date": trip.departure_date,
+        "departure_time": trip.departure_time,
+        "price_per_seat": trip.price_per_seat,
+        "available_seats": trip.available_seats,
+    }
+    return TripIn(**{**fields, **changes})
+
+
+@pytest.mark.django_db
+def test_cancelling_a_trip_fans_out_through_one_job(booked_trip):
+    vendor, trip = booked_trip
+    channels.outbox.clear()
+
+    # The same queries however many corpers are booked.
+    with assert_max_queries(12):
+        TripService().update_trip(vendor, trip.pk, trip_in(trip, status="cancelled"))
+
+    assert mail.outbox == []
+    assert set(
+        Booking.objects.filter(trip=trip).values_list("booking_status", flat=True)
+    ) == {"cancelled"}
+    job = NotificationJob.objects.get()
+    assert job.kind == "trip_cancelled"
+    assert job.bookings.count() == 4
+
+    with assert_max_queries(4):
+        assert expand_jobs() == {"jobs": 1, "notifications": 5}
+    out = StringIO()
+    call_command("send_notifications", stdout=out)
+
+    assert out.getvalue().strip() == "5 sent, 0 failed"
+    # corper3's booking was cancelled before the trip was, so they aren't told.
+    assert sorted(m.to[0] for m in mail.outbox) == [
+        "corper0@example.com",
+        "corper1@example.com",
+        "nophone@example.com",
+    ]
+    assert sorted(number for number, _ in channels.outbox) == [
+        "08010000000",
+        "08010000001",
+    ]
+    job.refresh_from_db()
+    assert job.status == "expanded" and job.recipients == 3
+    assert not job.notifications.exclude(status="sent").exists()
+
+
+@pytest.mark.django_db
+def test_overlapping_runs_expand_a_job_once(booked_trip, monkeypatch):
+    vendor, trip = booked_trip
+    TripService().update_trip(vendor, trip.pk, trip_in(trip, status="cancelled"))
+    recipients = services._recipients
+
+    # Another run expands the job after this one has read it as pending.
+    def overlapping(job):
+        monkeypatch.setattr(services, "_recipients", recipients)
+        assert expand_jobs() == {"jobs": 1, "notifications": 5}
+        return recipients(job)
+
+    monkeypatch.setattr(services, "_recipients", overlapping)
+    assert expand_jobs() == {"jobs": 0, "notifications": 0}
+    assert Notification.objects.count() == 5
+
+
+@pytest.mark.django_db
+def test_rescheduling_notifies_active_bookings(booked_trip):
+    vendor, trip = booked_trip
+
+    new_date = trip.departure_date + timedelta(days=1)
+    TripService().update_trip(vendor, trip.pk, trip_in(trip, departure_date=new_date))
+    TripService().update_trip(vendor, trip.pk, trip_in(trip, departure_date=new_date))
+
+    job = NotificationJob.objects.get()
+    assert job.kind == "trip_rescheduled"
+    assert "instead of" in job.body
+    expand_jobs()
+    assert sorted(
+        Notification.objects.filter(channel="email").values_list("recipient", flat=True)
+    ) == ["corper0@example.com", "corper1@example.com", "nophone@example.com"]
+
+
+@pytest.mark.django_db
+def test_failed_texts_are_tracked_per_recipient(booked_trip):
+    vendor, trip = booked_trip
+    TripService().update_trip(vendor, trip.pk, trip_in(trip, status="cancelled"))
+    expand_jobs()
+    Notification.objects.filter(recipient="08010000001").update(recipient="")
+
+    assert send_pending() == {"sent": 4, "failed": 1}
+    failed = Notification.objects.get(status="failed")
+    assert failed.channel == "sms" and failed.error == "No phone number"
+
+
+@pytest.mark.django_db
+def test_only_scheduled_trips_can_be_cancelled(booked_trip):
+    vendor, trip = booked_trip
+    Trip.objects.filter(pk=trip.pk).update(status="ongoing")
+
+    with pytest.raises(HttpError) as exc:
+        TripService().update_trip(vendor, trip.pk, trip_in(trip, status="cancelled"))
+
+    assert exc.value.status_code == 400
+    assert not NotificationJob.objects.exists()
@@ -1 +1,23 @@
-# Register your models here.
+from django.contrib import admin
+
+from engine.admin import LargeTableAdmin
+
+from .models import Payment
+
+
+@admin.register(Payment)
+class PaymentAdmin(LargeTableAdmin):
+    list_display = (
+        "payment_reference",
+        "user",
+        "booking",
+        "amount",
+        "status",
+        "payment_method",
+        "created_at",
+    )
+    list_filter = ("status", "payment_method")
+    list_select_related = ("user", "booking__user", "booking__trip")
+    date_hierarchy = "created_at"
+    search_fields = ("payment_reference__startswith", "user__email__startswith")
+    raw_id_fields = ("user", "booking")
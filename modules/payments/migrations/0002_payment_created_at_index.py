@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-19 07:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bookings", "0009_booking_booked_at_index"),
+        ("payments", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(
+                fields=["created_at"], name="payments_created_e3a130_idx"
+            ),
+        ),
+    ]
@@ -57,6 +57,8 @@ class Payment(models.Model):
         indexes = [
             models.Index(fields=["user", "booking"]),
             models.Index(fields=["status"]),
+            # The admin's default ordering and date hierarchy.
+            models.Index(fields=["created_at"]),
         ]
 
     def __str__(self):
@@ -0,0 +1,12 @@
+from django.contrib import admin
+
+from .models import Review
+
+
+@admin.register(Review)
+class ReviewAdmin(admin.ModelAdmin):
+    list_display = ("vendor", "reviewer", "rating", "created_at")
+    list_filter = ("rating",)
+    list_select_related = ("vendor", "reviewer")
+    raw_id_fields = ("booking",)
+    search_fields = ("vendor__email", "reviewer__email")
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models
+
+from modules.bookings.models import Booking
+
+
+class Review(models.Model):
+    """A corper's rating of the vendor of a completed booking.
+
+    ``vendor`` repeats ``booking.trip.vendor`` so ratings can be recomputed
+    per vendor without joining through bookings and trips.
+    """
+
+    id = models.BigAutoField(primary_key=True, editable=False)
+
+    booking = models.OneToOneField(
+        Booking, on_delete=models.CASCADE, related_name="review"
+    )
+    reviewer = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="reviews_written",
+    )
+    vendor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="reviews_received",
+    )
+
+    rating = models.PositiveSmallIntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(5)]
+    )
+    comment = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "reviews"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["vendor", "created_at"]),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(rating__gte=1, rating__lte=5),
+                name="review_rating_1_to_5",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.rating}/5 for vendor {self.vendor_id}"
@@ -0,0 +1,20 @@
+import uuid
+from datetime import datetime
+
+from ninja import Schema
+from pydantic import Field
+
+
+class ReviewIn(Schema):
+    booking_id: uuid.UUID
+    rating: int = Field(ge=1, le=5)
+    comment: str = Field("", max_length=2000)
+
+
+class ReviewOut(Schema):
+    id: int
+    booking_id: uuid.UUID
+    vendor_id: uuid.UUID
+    rating: int
+    comment: str
+    created_at: datetime
@@ -0,0 +1,111 @@
+"""
+Reviews and the vendor rating aggregates.
+
+``Vendor`` keeps ``rating_count``, ``rating_total`` and ``rating_average``.
+``create_review`` inserts a review and moves the three with a single UPDATE
+in the same transaction. The database computes the new values from the
+row's current ones, so concurrent reviews of a vendor queue on its row lock
+instead of overwriting each other, and the cost doesn't depend on how many
+reviews the vendor has. Search sorts and filters on the stored average.
+
+``recompute_vendor_ratings`` (``manage.py recompute_vendor_ratings``, run
+nightly) rebuilds the aggregates from the reviews table and writes only the
+vendors that drifted, e.g. after reviews were deleted in the admin.
+
+Both write through queryset updates, which send no ``post_save``, so they
+drop the vendors' cached ``/auth/user/me`` snapshots themselves once the
+change commits.
+"""
+
+import math
+from functools import partial
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, FloatField, OuterRef, Subquery, Sum
+from django.db.models.functions import Cast, Coalesce, Now
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from ninja.errors import HttpError
+
+from modules.authenticator.utils.snapshot import invalidate_user_snapshot
+from modules.bookings.models import Booking
+from modules.vendor.models import Vendor
+
+from .models import Review
+
+BATCH_SIZE = 500
+
+
+@transaction.atomic
+def create_review(user, payload) -> Review:
+    booking = get_object_or_404(
+        Booking.objects.select_related("trip"), pk=payload.booking_id, user=user
+    )
+    if booking.booking_status != "completed":
+        raise HttpError(400, "Only completed bookings can be reviewed")
+
+    vendor_id = booking.trip.vendor_id
+    try:
+        with transaction.atomic():
+            review = Review.objects.create(
+                booking=booking,
+                reviewer=user,
+                vendor_id=vendor_id,
+                rating=payload.rating,
+                comment=payload.comment,
+            )
+    except IntegrityError:
+        raise HttpError(409, "This booking has already been reviewed")
+
+    Vendor.objects.filter(user_id=vendor_id).update(
+        rating_count=F("rating_count") + 1,
+        rating_total=F("rating_total") + payload.rating,
+        rating_average=Cast(F("rating_total") + payload.rating, FloatField())
+        / (F("rating_count") + 1),
+        updated_at=Now(),
+    )
+    transaction.on_commit(partial(invalidate_user_snapshot, vendor_id))
+    return review
+
+
+def vendor_reviews(vendor_id, limit: int = 50):
+    return Review.objects.filter(vendor_id=vendor_id)[:limit]
+
+
+def recompute_vendor_ratings() -> int:
+    """Rebuild every vendor's aggregates from its reviews; return the number
+    of vendors that had drifted and were corrected."""
+    reviews = Review.objects.filter(vendor_id=OuterRef("user_id")).order_by()
+    per_vendor = reviews.values("vendor_id")
+    actual = Vendor.objects.annotate(
+        actual_count=Coalesce(
+            Subquery(per_vendor.annotate(n=Count("pk")).values("n")), 0
+        ),
+        actual_total=Coalesce(
+            Subquery(per_vendor.annotate(s=Sum("rating")).values("s")), 0
+        ),
+    ).only("user_id", "rating_count", "rating_total", "rating_average")
+
+    drifted = []
+    for vendor in actual.iterator(chunk_size=BATCH_SIZE):
+        count, total = vendor.actual_count, vendor.actual_total
+        average = total / count if count else 0.0
+        if (
+            vendor.rating_count != count
+            or vendor.rating_total != total
+            or not math.isclose(vendor.rating_average, average)
+        ):
+            vendor.rating_count = count
+            vendor.rating_total = total
+            vendor.rating_average = average
+            vendor.updated_at = timezone.now()
+            drifted.append(vendor)
+
+    Vendor.objects.bulk_update(
+        drifted,
+        ["rating_count", "rating_total", "rating_average", "updated_at"],
+        batch_size=BATCH_SIZE,
+    )
+    for vendor in drifted:
+        transaction.on_commit(partial(invalidate_user_snapshot, vendor.user_id))
+    return len(drifted)
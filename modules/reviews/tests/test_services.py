@@ -0,0 +1,204 @@
+import datetime
+import json
+from io import StringIO
+from types import SimpleNamespace
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+from ninja.errors import HttpError
+from ninja_jwt.tokens import AccessToken
+
+from modules.authenticator.services.user_service import get_current_user_service
+from modules.bookings.models import Booking
+from modules.reviews.models import Review
+from modules.reviews.services import create_review
+from modules.trips.models import Trip, Vehicle, VehicleType
+from modules.vendor.models import Vendor
+
+
+@pytest.fixture
+def corper(USER):
+    return USER.objects.create_user(
+        email="corper@example.com", password="Password1!", role="corper"
+    )
+
+
+@pytest.fixture
+def make_vendor(USER):
+    bus = VehicleType.objects.create(name="Bus")
+
+    def make(name):
+        user = USER.objects.create_user(
+            email=f"{name}@example.com", password="Password1!", role="vendor"
+        )
+        Vendor.objects.create(
+            user=user,
+            phone="08012345678",
+            business_name=name,
+            business_registration_number=f"RC-{name}",
+            years_in_operation=3,
+        )
+        vehicle = Vehicle.objects.create(
+            vendor=user,
+            registration_number=f"{name[:6].upper()}-1",
+            vehicle_type=bus,
+            make_model="Toyota Hiace 2020",
+            capacity=14,
+        )
+        return user, vehicle
+
+    return make
+
+
+def make_trip(vendor, vehicle, days=3):
+    return Trip.objects.create(
+        vendor=vendor,
+        vehicle=vehicle,
+        departure_state="Lagos",
+        departure_city="Ikeja",
+        destination_camp="NYSC Camp Iseyin",
+        departure_date=datetime.date.today() + datetime.timedelta(days=days),
+        departure_time=datetime.time(8, 0),
+        price_per_seat=5000,
+        available_seats=14,
+        status="scheduled" if days > 0 else "completed",
+    )
+
+
+def completed_booking(user, trip):
+    return Booking.objects.create(user=user, trip=trip, booking_status="completed")
+
+
+def review(user, booking, rating):
+    return create_review(
+        user, SimpleNamespace(booking_id=booking.id, rating=rating, comment="")
+    )
+
+
+@pytest.mark.django_db
+def test_reviews_update_the_vendor_rating(corper, make_vendor):
+    vendor, vehicle = make_vendor("swift")
+    trip = make_trip(vendor, vehicle, days=-3)
+
+    review(corper, completed_booking(corper, trip), 5)
+    review(corper, completed_booking(corper, trip), 2)
+
+    profile = Vendor.objects.get(user=vendor)
+    assert (profile.rating_count, profile.rating_total) == (2, 7)
+    assert profile.rating_average == 3.5
+
+    booking = completed_booking(corper, trip)
+    review(corper, booking, 4)
+    with pytest.raises(HttpError) as exc_info:
+        review(corper, booking, 1)
+    assert exc_info.value.status_code == 409
+    assert Vendor.objects.get(user=vendor).rating_count == 3
+
+    pending = Booking.objects.create(user=corper, trip=trip)
+    with pytest.raises(HttpError) as exc_info:
+        review(corper, pending, 5)
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.django_db
+def test_recompute_fixes_drifted_vendors(corper, make_vendor):
+    vendor, vehicle = make_vendor("swift")
+    other, _ = make_vendor("steady")
+    trip = make_trip(vendor, vehicle, days=-3)
+    review(corper, completed_booking(corper, trip), 5)
+    review(corper, completed_booking(corper, trip), 1)
+
+    Review.objects.filter(rating=1).delete()
+    Vendor.objects.filter(user=other).update(rating_count=4, rating_average=4.5)
+
+    out = StringIO()
+    call_command("recompute_vendor_ratings", stdout=out)
+    assert out.getvalue().strip() == "2 vendor rating(s) corrected"
+
+    fixed = Vendor.objects.get(user=vendor)
+    assert (fixed.rating_count, fixed.rating_total, fixed.rating_average) == (1, 5, 5)
+    reset = Vendor.objects.get(user=other)
+    assert (reset.rating_count, reset.rating_average) == (0, 0)
+
+    call_command("recompute_vendor_ratings", stdout=out)
+    assert out.getvalue().strip().endswith("0 vendor rating(s) corrected")
+
+
+@pytest.mark.django_db
+def test_rating_changes_refresh_the_vendor_snapshot(
+    corper, make_vendor, django_capture_on_commit_callbacks
+):
+    vendor, vehicle = make_vendor("swift")
+    trip = make_trip(vendor, vehicle, days=-3)
+
+    def me():
+        return json.loads(get_current_user_service(vendor))["vendor_profile"]
+
+    assert (me()["rating_count"], me()["rating_average"]) == (0, 0)
+    with django_capture_on_commit_callbacks(execute=True):
+        review(corper, completed_booking(corper, trip), 4)
+    assert (me()["rating_count"], me()["rating_average"]) == (1, 4)
+
+    Review.objects.all().delete()
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("recompute_vendor_ratings", stdout=StringIO())
+    assert (me()["rating_count"], me()["rating_average"]) == (0, 0)
+
+
+@pytest.mark.django_db
+def test_review_endpoints(corper, make_vendor):
+    vendor, vehicle = make_vendor("swift")
+    booking = completed_booking(corper, make_trip(vendor, vehicle, days=-3))
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(corper)}")
+
+    resp = client.post(
+        "/api/reviews/",
+        {"booking_id": str(booking.id), "rating": 4, "comment": "On time"},
+        content_type="application/json",
+    )
+    assert resp.status_code == 200
+    assert resp.json()["vendor_id"] == str(vendor.id)
+
+    resp = Client().get(f"/api/reviews/vendors/{vendor.id}")
+    assert [r["comment"] for r in resp.json()] == ["On time"]
+
+    resp = client.post(
+        "/api/reviews/",
+        {"booking_id": str(booking.id), "rating": 6},
+        content_type="application/json",
+    )
+    assert resp.status_code == 422
+
+
+@pytest.mark.django_db
+def test_search_filters_and_sorts_by_vendor_rating(corper, make_vendor):
+    good, good_bus = make_vendor("good")
+    fair, fair_bus = make_vendor("fair")
+    unrated, unrated_bus = make_vendor("unrated")
+    trips = {
+        "good": make_trip(good, good_bus, days=5),
+        "fair": make_trip(fair, fair_bus, days=4),
+        "unrated": make_trip(unrated, unrated_bus, days=3),
+    }
+    review(corper, completed_booking(corper, make_trip(good, good_bus, -2)), 5)
+    review(corper, completed_booking(corper, make_trip(fair, fair_bus, -2)), 3)
+
+    def search(**params):
+        resp = Client().get("/api/vendor/trips/search", params)
+        assert resp.status_code == 200
+        return resp, [t["id"] for t in resp.json()]
+
+    _, ids = search(sort="rating")
+    assert ids == [str(trips[name].id) for name in ("good", "fair", "unrated")]
+    resp, ids = search(min_rating=4)
+    assert ids == [str(trips["good"].id)]
+
+    # A review changes the ETag even though no trip changed.
+    etag = resp.headers["ETag"]
+    review(corper, completed_booking(corper, make_trip(good, good_bus, -1)), 4)
+    resp = Client().get(
+        "/api/vendor/trips/search", {"min_rating": 4}, HTTP_IF_NONE_MATCH=etag
+    )
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
@@ -0,0 +1,30 @@
+import uuid
+from typing import List
+
+from ninja import Router
+from ninja_jwt.authentication import JWTAuth
+
+from engine.db_router import replica_reads
+from engine.query_budget import query_budget
+from modules.authenticator.permissions import corper_required
+
+from .schemas import ReviewIn, ReviewOut
+from .services import create_review, vendor_reviews
+
+router = Router(tags=["Reviews"], auth=JWTAuth())
+
+
+@router.post("/", response=ReviewOut)
+@query_budget(4)
+@corper_required
+def review_booking(request, payload: ReviewIn):
+    """Rate the vendor of one of your completed bookings."""
+    return create_review(request.user, payload)
+
+
+@router.get("/vendors/{vendor_id}", response=List[ReviewOut], auth=None)
+@query_budget(1)
+@replica_reads
+def list_vendor_reviews(request, vendor_id: uuid.UUID):
+    """The latest reviews of a vendor."""
+    return vendor_reviews(vendor_id)
@@ -1,5 +1,7 @@
 from django.contrib import admin
 
+from engine.admin import LargeTableAdmin
+
 from .models import Trip, Vehicle, VehicleType
 
 
@@ -10,5 +12,38 @@ class VehicleTypeAdmin(admin.ModelAdmin):
     search_fields = ("name",)
 
 
-admin.site.register(Trip)
-admin.site.register(Vehicle)
+@admin.register(Vehicle)
+class VehicleAdmin(LargeTableAdmin):
+    list_display = (
+        "registration_number",
+        "make_model",
+        "vendor",
+        "capacity",
+        "status",
+        "is_compliant",
+        "created_at",
+    )
+    list_filter = ("status", "is_compliant")
+    list_select_related = ("vendor",)
+    search_fields = ("registration_number__startswith", "vendor__email__startswith")
+    raw_id_fields = ("vendor",)
+
+
+@admin.register(Trip)
+class TripAdmin(LargeTableAdmin):
+    list_display = (
+        "__str__",
+        "vendor",
+        "status",
+        "compliance_hold",
+        "price_per_seat",
+        "available_seats",
+    )
+    list_filter = ("status", "compliance_hold")
+    list_select_related = ("vendor",)
+    date_hierarchy = "departure_date"
+    search_fields = (
+        "vehicle__registration_number__startswith",
+        "vendor__email__startswith",
+    )
+    raw_id_fields = ("vendor", "vehicle")
@@ -1,33 +1,92 @@
 import logging
+from datetime import time
 
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
+from django.db.models import TimeField, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from ninja.errors import HttpError
 
-from modules.trips.models import Trip
+from engine.pubsub import publish
+from modules.bookings.models import Booking
+from modules.notifications.services import (
+    queue_trip_cancelled,
+    queue_trip_rescheduled,
+)
+from modules.trips.models import Trip, Vehicle
 from modules.trips.schemas import TripIn
+from modules.trips.services.seat_service import fit_seat_maps, map_size, seat_topic
 
 from .vehicle_crud import VehicleCRUD
 
 logger = logging.getLogger(__name__)
 
+# Trips in these states hold their vehicle.
+ACTIVE_TRIP_STATUSES = ("scheduled", "ongoing")
+
+
+def overlapping_trips(departure_date, start, end=None):
+    """Active trips on ``departure_date`` overlapping ``[start, end)``.
+
+    A trip holds its vehicle from ``departure_time`` to
+    ``estimated_arrival_time``, or to the end of the day without one.
+    Filtered by vehicle this is a range scan of the (vehicle,
+    departure_date, departure_time) index, however many trips the fleet has.
+    """
+    return Trip.objects.annotate(
+        occupied_until=Coalesce(
+            "estimated_arrival_time", Value(time.max), output_field=TimeField()
+        )
+    ).filter(
+        departure_date=departure_date,
+        status__in=ACTIVE_TRIP_STATUSES,
+        departure_time__lt=end or time.max,
+        occupied_until__gt=start,
+    )
+
 
 class TripCRUD:
     def __init__(self, queryset=None):
         self.model = Trip
-        self.queryset = queryset or self.model.objects.all()
+        self.queryset = queryset if queryset is not None else self.model.objects.all()
 
     def get_trip_by_id(self, trip_id):
         """Find trip by id"""
         try:
             return self.queryset.get(id=trip_id)
-        except Trip.DoesNotExist as exc:
-            logger.exception(f"Trip does not exist: {exc}")
+        except Trip.DoesNotExist:
+            logger.info("Trip %s does not exist", trip_id)
             raise HttpError(404, "Trip does not exist")
 
+    def ensure_vehicle_free(self, vehicle_id, departure_date, start, end, trip=None):
+        """Reject a schedule that overlaps another active trip of the vehicle"""
+        conflicts = overlapping_trips(departure_date, start, end).filter(
+            vehicle_id=vehicle_id
+        )
+        if trip is not None:
+            conflicts = conflicts.exclude(pk=trip.pk)
+        if conflicts.exists():
+            raise HttpError(409, "Vehicle already has a trip at that time")
+
+    def ensure_vehicle_compliant(self, vehicle, departure_date):
+        """Reject a vehicle the sweep has deactivated or whose documents
+        expire before ``departure_date``"""
+        if not vehicle.is_compliant or vehicle.documents_expired_on(departure_date):
+            raise HttpError(
+                400, "Vehicle insurance or roadworthiness has expired by departure"
+            )
+
+    @transaction.atomic
     def create_trip(self, vendor, data: TripIn):
         """Create a trip for a specific vendor"""
 
-        vehicle = VehicleCRUD().get_vehicle_by_id(data.vehicle_id, vendor=vendor)
+        # Locking the vehicle serializes concurrent trip creation for it, so
+        # two requests can't both pass the overlap check.
+        vehicle = VehicleCRUD(
+            queryset=Vehicle.objects.select_for_update()
+        ).get_vehicle_by_id(data.vehicle_id, vendor=vendor)
+
+        self.ensure_vehicle_compliant(vehicle, data.departure_date)
 
         if data.available_seats <= 0:
             raise HttpError(400, "Available seats must be greater than zero")
@@ -38,6 +97,13 @@ class TripCRUD:
         ):
             raise HttpError(400, "Estimated arrival time must be after departure time")
 
+        self.ensure_vehicle_free(
+            vehicle.pk,
+            data.departure_date,
+            data.departure_time,
+            data.estimated_arrival_time,
+        )
+
         try:
             trip_data = self.model.objects.create(
                 vendor=vendor,
@@ -50,6 +116,7 @@ class TripCRUD:
                 estimated_arrival_time=data.estimated_arrival_time,
                 price_per_seat=data.price_per_seat,
                 available_seats=data.available_seats,
+                seat_map=bytes(map_size(vehicle.capacity)),
                 description=data.description,
             )
             return trip_data
@@ -61,14 +128,74 @@ class TripCRUD:
         """Get trip by status"""
         return self.queryset.filter(status=status)
 
+    def announce_change(self, trip, status, departure_date, departure_time):
+        """Queue the notifications for a trip that was just cancelled or moved.
+
+        Cancelling also cancels the trip's active bookings and closes its
+        seat streams. Either way the request writes one job, whatever the
+        number of bookings; see ``modules/notifications/services.py``.
+        """
+        now = timezone.now()
+        if trip.status == "cancelled" and status != "cancelled":
+            cancelled = list(
+                Booking.objects.select_for_update()
+                .filter(trip=trip, booking_status__in=("pending", "confirmed"))
+                .values_list("pk", flat=True)
+            )
+            Booking.objects.filter(pk__in=cancelled).update(
+                booking_status="cancelled", cancelled_at=now
+            )
+            queue_trip_cancelled(trip, cancelled, now)
+            publish(seat_topic(trip.pk), {"status": "cancelled"})
+        elif trip.status == "scheduled" and (
+            trip.departure_date != departure_date
+            or trip.departure_time != departure_time
+        ):
+            queue_trip_rescheduled(trip, departure_date, departure_time, now)
+
+    @transaction.atomic
     def update_trip(self, data: TripIn, trip_id):
         """Update Trip"""
         try:
             trip = self.get_trip_by_id(trip_id=trip_id)
+            before = (trip.status, trip.departure_date, trip.departure_time)
             for field, value in data.dict(exclude_unset=True).items():
                 setattr(trip, field, value)
+            if trip.status == "cancelled" and before[0] not in (
+                "scheduled",
+                "cancelled",
+            ):
+                raise HttpError(400, "Only scheduled trips can be cancelled")
+            # Also rejects moving the trip to another vendor's vehicle.
+            vehicle = VehicleCRUD(
+                queryset=Vehicle.objects.select_for_update()
+            ).get_vehicle_by_id(trip.vehicle_id, vendor=trip.vendor_id)
+            # Lock the seat map (after the vehicle, as vehicle updates do) so
+            # the save below neither loses a concurrent claim nor keeps seats
+            # a smaller vehicle doesn't have.
+            trip.seat_map = (
+                Trip.objects.select_for_update()
+                .values_list("seat_map", flat=True)
+                .get(pk=trip.pk)
+            )
+            fit_seat_maps([trip], vehicle.capacity)
+            if trip.status == "scheduled":
+                self.ensure_vehicle_compliant(vehicle, trip.departure_date)
+                # Held for its previous vehicle's documents, if any.
+                trip.compliance_hold = False
+            if trip.status in ACTIVE_TRIP_STATUSES:
+                self.ensure_vehicle_free(
+                    trip.vehicle_id,
+                    trip.departure_date,
+                    trip.departure_time,
+                    trip.estimated_arrival_time,
+                    trip=trip,
+                )
             trip.save()
+            self.announce_change(trip, *before)
             return trip
+        except HttpError:
+            raise
         except IntegrityError as exc:
             logger.exception(f"Could not update trip: {exc}")
             raise HttpError(400, "Could not update trip")
@@ -82,9 +209,8 @@ class TripCRUD:
             trip = self.get_trip_by_id(trip_id=trip_id)
             trip.delete()
             return True
-        except Trip.DoesNotExist as exc:
-            logger.exception(f"Trip does not exist: {exc}")
-            raise HttpError(404, "Trip does not exist")
+        except HttpError:
+            raise
         except Exception as exc:
             logger.exception(f"Could not delete trip: {exc}")
             raise HttpError(400, "Could not delete trip")
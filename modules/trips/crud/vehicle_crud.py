@@ -1,10 +1,12 @@
 import logging
 
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from ninja.errors import HttpError
 
-from modules.trips.models import Vehicle
+from modules.trips.models import Trip, Vehicle
 from modules.trips.schemas import VehicleIn
+from modules.trips.services.compliance_service import restore_if_compliant
+from modules.trips.services.seat_service import fit_seat_maps
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +14,7 @@ logger = logging.getLogger(__name__)
 class VehicleCRUD:
     def __init__(self, queryset=None):
         self.model = Vehicle
-        self.queryset = queryset or self.model.objects.all()
+        self.queryset = queryset if queryset is not None else self.model.objects.all()
 
     def get_vehicle_by_id(self, vehicle_id, vendor=None):
         """Find Vehicle by id; optionally restrict by vendor"""
@@ -21,8 +23,8 @@ class VehicleCRUD:
             qs = qs.filter(vendor=vendor)
         try:
             return qs.get(id=vehicle_id)
-        except Vehicle.DoesNotExist as exc:
-            logger.exception(f"Vehicle does not exist: {exc}")
+        except Vehicle.DoesNotExist:
+            logger.info("Vehicle %s does not exist", vehicle_id)
             raise HttpError(404, "Vehicle does not exist")
 
     def create_vehicle(self, vendor, data: VehicleIn):
@@ -51,16 +53,21 @@ class VehicleCRUD:
                 year_manufactured=data.year_manufactured,
                 is_insured=data.is_insured or False,
                 insurance_expiry=data.insurance_expiry,
+                roadworthiness_expiry_date=data.roadworthiness_expiry_date,
             )
             return vehicle
         except IntegrityError as exc:
             logger.exception(f"Could not create vehicle: {exc}")
             raise HttpError(400, "Could not create vehicle")
 
+    @transaction.atomic
     def update_vehicle(self, vendor, vehicle_id, data: VehicleIn):
         """Update Vehicle for a given vendor"""
         try:
-            vehicle = self.get_vehicle_by_id(vehicle_id=vehicle_id, vendor=vendor)
+            # Locked before its trips, as trip updates lock it before theirs.
+            vehicle = VehicleCRUD(
+                queryset=self.queryset.select_for_update()
+            ).get_vehicle_by_id(vehicle_id=vehicle_id, vendor=vendor)
             update_data = data.dict(exclude_unset=True)
 
             vt = update_data.pop("vehicle_type", None)
@@ -78,10 +85,16 @@ class VehicleCRUD:
                     )
                     setattr(vehicle, "vehicle_type", vehicle_type_obj)
 
+            capacity = vehicle.capacity
             for field, value in update_data.items():
                 setattr(vehicle, field, value)
+            if vehicle.capacity != capacity:
+                self.fit_trips(vehicle)
+            restore_if_compliant(vehicle)
             vehicle.save()
             return vehicle
+        except HttpError:
+            raise
         except IntegrityError as exc:
             logger.exception(f"Could not update vehicle: {exc}")
             raise HttpError(400, "Could not update vehicle")
@@ -89,15 +102,23 @@ class VehicleCRUD:
             logger.exception(f"Unexpected error while updating vehicle: {exc}")
             raise HttpError(400, "Could not update vehicle")
 
+    def fit_trips(self, vehicle):
+        """Resize the seat maps of the vehicle's upcoming trips to its new
+        capacity; 409 if one has a booked seat beyond it."""
+        trips = Trip.objects.select_for_update().filter(
+            vehicle=vehicle, status__in=("scheduled", "ongoing")
+        )
+        changed = fit_seat_maps(trips.only("id", "seat_map"), vehicle.capacity)
+        Trip.objects.bulk_update(changed, ["seat_map"], batch_size=500)
+
     def delete_vehicle(self, vendor, vehicle_id):
         """Delete a vehicle belonging to a vendor"""
         try:
             vehicle = self.get_vehicle_by_id(vehicle_id=vehicle_id, vendor=vendor)
             vehicle.delete()
             return True
-        except Vehicle.DoesNotExist as exc:
-            logger.exception(f"Vehicle does not exist: {exc}")
-            raise HttpError(404, "Vehicle does not exist")
+        except HttpError:
+            raise
         except Exception as exc:
             logger.exception(f"Could not delete vehicle: {exc}")
             raise HttpError(400, "Could not delete vehicle")
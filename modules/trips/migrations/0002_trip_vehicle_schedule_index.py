@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-19 06:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("trips", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="trip",
+            index=models.Index(
+                fields=["vehicle", "departure_date", "departure_time"],
+                name="trip_vehicle_56116d_idx",
+            ),
+        ),
+    ]
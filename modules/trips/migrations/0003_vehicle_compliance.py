@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-19 07:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("trips", "0002_trip_vehicle_schedule_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="trip",
+            name="compliance_hold",
+            field=models.BooleanField(
+                default=False,
+                help_text="Vehicle insurance or roadworthiness expired; hidden from search",
+            ),
+        ),
+        migrations.AddField(
+            model_name="vehicle",
+            name="is_compliant",
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddIndex(
+            model_name="vehicle",
+            index=models.Index(
+                condition=models.Q(("is_compliant", True)),
+                fields=["insurance_expiry"],
+                name="vehicle_insurance_due_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vehicle",
+            index=models.Index(
+                condition=models.Q(("is_compliant", True)),
+                fields=["roadworthiness_expiry_date"],
+                name="vehicle_roadworthy_due_idx",
+            ),
+        ),
+    ]
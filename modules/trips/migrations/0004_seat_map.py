@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-19 07:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("trips", "0003_vehicle_compliance"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="trip",
+            name="seat_map",
+            field=models.BinaryField(
+                blank=True,
+                default=bytes,
+                help_text="One bit per vehicle seat, set when taken; see seat_service.py",
+            ),
+        ),
+    ]
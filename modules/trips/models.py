@@ -59,6 +59,9 @@ class Vehicle(models.Model):
     insurance_expiry = models.DateField(null=True, blank=True)
 
     roadworthiness_expiry_date = models.DateField(null=True, blank=True)
+    # Cleared by the daily compliance sweep when insurance or roadworthiness
+    # has expired, and set again once the vendor renews them.
+    is_compliant = models.BooleanField(default=True)
     vehicle_images = models.JSONField(blank=True, null=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
@@ -67,6 +70,20 @@ class Vehicle(models.Model):
     class Meta:
         db_table = "vehicle"
         ordering = ["-created_at"]
+        # Only compliant vehicles are indexed, so the daily sweep reads the
+        # newly expired ones rather than every vehicle that ever expired.
+        indexes = [
+            models.Index(
+                fields=["insurance_expiry"],
+                condition=models.Q(is_compliant=True),
+                name="vehicle_insurance_due_idx",
+            ),
+            models.Index(
+                fields=["roadworthiness_expiry_date"],
+                condition=models.Q(is_compliant=True),
+                name="vehicle_roadworthy_due_idx",
+            ),
+        ]
 
     def __str__(self):
         vendor_name = getattr(self.vendor, "full_name", str(self.vendor))
@@ -96,6 +113,16 @@ class Vehicle(models.Model):
             return False
         return self.roadworthiness_expiry_date >= timezone.now().date()
 
+    def documents_expired_on(self, day) -> bool:
+        """Whether a recorded insurance or roadworthiness expiry is before ``day``.
+
+        Missing dates are not treated as expired.
+        """
+        return any(
+            expiry is not None and expiry < day
+            for expiry in (self.insurance_expiry, self.roadworthiness_expiry_date)
+        )
+
     def save(self, *args, **kwargs):
         self.full_clean()
         super().save(*args, **kwargs)
@@ -132,6 +159,10 @@ class Trip(models.Model):
     status = models.CharField(
         max_length=20, choices=STATUS_CHOICES, default="scheduled"
     )
+    compliance_hold = models.BooleanField(
+        default=False,
+        help_text="Vehicle insurance or roadworthiness expired; hidden from search",
+    )
     description = models.TextField(blank=True)
 
     departure_state = models.CharField(max_length=150)
@@ -147,6 +178,11 @@ class Trip(models.Model):
 
     price_per_seat = models.DecimalField(max_digits=10, decimal_places=2)
     available_seats = models.PositiveSmallIntegerField(default=0)
+    seat_map = models.BinaryField(
+        default=bytes,
+        blank=True,
+        help_text="One bit per vehicle seat, set when taken; see seat_service.py",
+    )
 
     early_bird_discount_percentage = models.PositiveSmallIntegerField(default=0)
     early_bird_deadline = models.DateField(null=True, blank=True)
@@ -165,6 +201,9 @@ class Trip(models.Model):
         indexes = [
             models.Index(fields=["departure_date", "status"]),
             models.Index(fields=["vendor", "status"]),
+            # Schedule conflicts and vehicle availability, see
+            # modules/trips/crud/trips_crud.py
+            models.Index(fields=["vehicle", "departure_date", "departure_time"]),
         ]
 
     def __str__(self):
@@ -1,9 +1,12 @@
 from datetime import date, datetime, time
 from decimal import Decimal
-from typing import Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
 from ninja import Schema
+from pydantic import AliasChoices, Field
+
+from modules.media.schemas import VehicleImageOut
 
 
 class VehicleTypeSchema(Schema):
@@ -20,6 +23,7 @@ class VehicleIn(Schema):
     year_manufactured: Optional[int] = None
     is_insured: Optional[bool] = False
     insurance_expiry: Optional[date] = None
+    roadworthiness_expiry_date: Optional[date] = None
 
 
 class VehicleOut(Schema):
@@ -33,6 +37,8 @@ class VehicleOut(Schema):
     status: str
     is_insured: bool
     insurance_expiry: Optional[date]
+    roadworthiness_expiry_date: Optional[date] = None
+    images: List[VehicleImageOut] = []
 
 
 class TripIn(Schema):
@@ -46,11 +52,13 @@ class TripIn(Schema):
     price_per_seat: Decimal
     available_seats: int
     description: Optional[str] = None
+    # Updates only: cancels the trip and the bookings on it.
+    status: Optional[Literal["cancelled"]] = None
 
 
 class TripOut(Schema):
-    id: int
-    trip_id: UUID
+    id: UUID
+    trip_id: UUID = Field(validation_alias=AliasChoices("trip_id", "id"))
     vehicle_id: UUID
     departure_city: str
     departure_state: str
@@ -64,3 +72,10 @@ class TripOut(Schema):
     description: Optional[str] = None
     created_at: datetime
     updated_at: datetime
+
+
+class SeatMapOut(Schema):
+    trip_id: UUID
+    capacity: int
+    available: int
+    taken: list[int]
@@ -0,0 +1,101 @@
+"""
+Vehicle compliance: insurance and roadworthiness expiry.
+
+``sweep_vehicle_compliance`` runs daily (``manage.py sweep_vehicle_compliance``).
+In one transaction it finds the compliant vehicles whose insurance or
+roadworthiness expired before today, through the partial indexes on the
+two expiry dates, and:
+
+- marks them ``inactive`` and not compliant;
+- puts their upcoming scheduled trips on ``compliance_hold``, which hides
+  them from search and booking;
+- queues one notification per vendor listing the vehicles.
+
+Trip creation and search read the stored flags instead of checking dates
+per row. ``restore_if_compliant`` reverses the sweep once a vendor records
+renewed dates.
+"""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import Now
+from django.utils import timezone
+
+from modules.notifications.models import Notification
+from modules.notifications.services import queue_notifications
+from modules.trips.models import Trip, Vehicle
+
+
+def _expired_before(day):
+    return Q(insurance_expiry__lt=day) | Q(roadworthiness_expiry_date__lt=day)
+
+
+def _vendor_notification(vendor_id, vehicles, held) -> Notification:
+    plates = ", ".join(sorted(v["registration_number"] for v in vehicles))
+    return Notification(
+        user_id=vendor_id,
+        kind="vehicle_noncompliant",
+        subject="Vehicle documents expired",
+        body=(
+            f"Insurance or roadworthiness has expired for: {plates}. These "
+            f"vehicles are now inactive and {held} upcoming trip(s) are on hold "
+            "until the renewed dates are recorded."
+        ),
+    )
+
+
+@transaction.atomic
+def sweep_vehicle_compliance(today=None) -> dict:
+    """Deactivate vehicles with expired documents; return what was changed."""
+    today = today or timezone.localdate()
+    expired = list(
+        Vehicle.objects.filter(_expired_before(today), is_compliant=True).values(
+            "id", "vendor_id", "registration_number"
+        )
+    )
+    if not expired:
+        return {"vehicles": 0, "trips": 0, "notifications": 0}
+
+    ids = [v["id"] for v in expired]
+    Vehicle.objects.filter(pk__in=ids).update(
+        is_compliant=False, status="inactive", updated_at=Now()
+    )
+    upcoming = Trip.objects.filter(
+        vehicle_id__in=ids, status="scheduled", departure_date__gte=today
+    )
+    held_per_vendor = dict(
+        upcoming.order_by()
+        .values("vendor_id")
+        .annotate(n=Count("pk"))
+        .values_list("vendor_id", "n")
+    )
+    held = upcoming.update(compliance_hold=True, updated_at=Now())
+
+    by_vendor = defaultdict(list)
+    for vehicle in expired:
+        by_vendor[vehicle["vendor_id"]].append(vehicle)
+    notifications = queue_notifications(
+        [
+            _vendor_notification(vendor_id, vehicles, held_per_vendor.get(vendor_id, 0))
+            for vendor_id, vehicles in by_vendor.items()
+        ]
+    )
+    return {"vehicles": len(ids), "trips": held, "notifications": len(notifications)}
+
+
+def restore_if_compliant(vehicle, today=None) -> bool:
+    """Reactivate a swept vehicle whose dates are valid again.
+
+    Call before saving the vehicle; its held trips are released right away.
+    """
+    today = today or timezone.localdate()
+    if vehicle.is_compliant or vehicle.documents_expired_on(today):
+        return False
+    vehicle.is_compliant = True
+    vehicle.status = "active"
+    Trip.objects.filter(vehicle=vehicle, compliance_hold=True).update(
+        compliance_hold=False, updated_at=Now()
+    )
+    return True
@@ -0,0 +1,76 @@
+"""
+Time-driven trip and booking status transitions.
+
+Run periodically by ``manage.py advance_trips``:
+
+- scheduled or ongoing trips whose arrival has passed become ``completed``
+  (a trip without ``estimated_arrival_time`` completes at the end of its
+  departure day, the same span it holds its vehicle for);
+- scheduled trips that have departed become ``ongoing``;
+- on completed trips, confirmed bookings become ``completed`` and bookings
+  still pending become ``no_show``.
+
+Each transition is a set-based UPDATE over at most ``batch_size`` rows at a
+time, selected through the ``(departure_date, status)`` index, so a backlog
+never holds locks on a large range. The UPDATE repeats the selection's
+conditions, so a row a vendor changed in the meantime is left alone.
+``QuerySet.update`` skips ``auto_now``, so trips get ``updated_at`` set
+explicitly (the HTTP validators in engine/http_cache.py depend on it).
+"""
+
+from django.db.models import Q
+from django.db.models.functions import Now
+from django.utils import timezone
+from prometheus_client import Counter
+
+from modules.bookings.models import Booking
+from modules.trips.models import Trip
+
+TRANSITIONS = Counter(
+    "lifecycle_transitions",
+    "Rows moved to a new status by the lifecycle job",
+    ["model", "from_status", "to_status"],
+)
+
+BATCH_SIZE = 1000
+
+
+def batched_update(qs, batch_size: int, **values) -> int:
+    """UPDATE the rows of ``qs`` in batches of ``batch_size``; return the count."""
+    total = 0
+    while True:
+        ids = list(qs.order_by().values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            return total
+        total += qs.filter(pk__in=ids).update(**values)
+
+
+def advance_trips(now=None, batch_size: int = BATCH_SIZE) -> dict:
+    """Apply every due transition; return ``{(model, from, to): rows}``."""
+    now = timezone.localtime(now)
+    today, time_now = now.date(), now.time()
+    departed = Q(departure_date__lt=today) | Q(
+        departure_date=today, departure_time__lte=time_now
+    )
+    arrived = Q(departure_date__lt=today) | Q(
+        departure_date=today, estimated_arrival_time__lte=time_now
+    )
+
+    # Completing first takes trips that are entirely in the past straight
+    # from scheduled to completed.
+    steps = [
+        (Trip, "scheduled", "completed", arrived, {"updated_at": Now()}),
+        (Trip, "ongoing", "completed", arrived, {"updated_at": Now()}),
+        (Trip, "scheduled", "ongoing", departed, {"updated_at": Now()}),
+        (Booking, "confirmed", "completed", Q(trip__status="completed"), {}),
+        (Booking, "pending", "no_show", Q(trip__status="completed"), {}),
+    ]
+    counts = {}
+    for model, source, target, due, extra in steps:
+        status_field = "status" if model is Trip else "booking_status"
+        qs = model.objects.filter(due, **{status_field: source})
+        rows = batched_update(qs, batch_size, **{status_field: target}, **extra)
+        label = model._meta.model_name
+        TRANSITIONS.labels(label, source, target).inc(rows)
+        counts[(label, source, target)] = rows
+    return counts
@@ -0,0 +1,162 @@
+"""
+Seat-level inventory of a trip, kept as a bitmap.
+
+``Trip.seat_map`` holds one bit per seat of the vehicle, ``ceil(capacity / 8)``
+bytes in all: seat ``n`` is bit ``(n - 1) % 8`` of byte ``(n - 1) // 8`` and
+is set once a booking holds it. ``Booking.seat_map`` uses the same layout for
+the seats of that booking, so releasing them is a mask.
+
+Claims and releases never lock the trip row. The new map is computed from the
+one just read and written with ``UPDATE ... WHERE seat_map = <what was read>``;
+when another booking got there first no row matches, and the change is
+retried on the fresh map.
+
+Every change that goes through publishes the trip's new map on
+``seat_topic`` once its transaction commits, for the seat streams served by
+``engine/seat_events.py``.
+"""
+
+from django.db.models.functions import Now
+from ninja.errors import HttpError
+
+from engine.pubsub import publish
+from modules.trips.models import Trip
+
+MAX_ATTEMPTS = 5
+
+
+def map_size(capacity: int) -> int:
+    return (capacity + 7) // 8
+
+
+def to_bits(seat_map) -> int:
+    return int.from_bytes(seat_map or b"", "little")
+
+
+def to_map(bits: int, capacity: int) -> bytes:
+    return bits.to_bytes(map_size(capacity), "little")
+
+
+def seat_bits(seats) -> int:
+    bits = 0
+    for seat in seats:
+        bits |= 1 << (seat - 1)
+    return bits
+
+
+def seat_numbers(seat_map) -> list:
+    """The seats set in ``seat_map``, in ascending order."""
+    bits = to_bits(seat_map)
+    return [n + 1 for n in range(bits.bit_length()) if bits >> n & 1]
+
+
+def first_free(bits: int, capacity: int, count: int) -> list:
+    seats = [n + 1 for n in range(capacity) if not bits >> n & 1][:count]
+    if len(seats) < count:
+        raise HttpError(400, f"Only {len(seats)} seats left")
+    return seats
+
+
+def seat_topic(trip_id) -> str:
+    return f"trip-seats:{trip_id}"
+
+
+def publish_seats(trip_id, seat_map) -> None:
+    publish(seat_topic(trip_id), {"taken": seat_numbers(seat_map)})
+
+
+def availability(trip_id, capacity: int, taken) -> dict:
+    """A trip's seat map payload; ``taken`` as from ``seat_numbers``."""
+    taken = [seat for seat in taken if seat <= capacity]
+    return {
+        "trip_id": trip_id,
+        "capacity": capacity,
+        "available": capacity - len(taken),
+        "taken": taken,
+    }
+
+
+def _swap(trip_id, current: bytes, new: bytes) -> bool:
+    return bool(
+        Trip.objects.filter(pk=trip_id, seat_map=current).update(
+            seat_map=new, updated_at=Now()
+        )
+    )
+
+
+def _read(trip_id) -> bytes:
+    return bytes(Trip.objects.values_list("seat_map", flat=True).get(pk=trip_id))
+
+
+def claim_seats(trip, seats=None, count=1) -> bytes:
+    """Take ``seats`` on ``trip``, or the ``count`` lowest free ones.
+
+    ``trip`` must have its vehicle loaded. Returns the booking's seat map;
+    raises 400 for seats the vehicle doesn't have and 409 for taken ones.
+    """
+    capacity = trip.vehicle.capacity
+    if seats is not None:
+        invalid = sorted(s for s in seats if not 1 <= s <= capacity)
+        if invalid:
+            raise HttpError(400, f"Vehicle has no seat {invalid[0]}")
+    current = bytes(trip.seat_map or b"")
+    for _attempt in range(MAX_ATTEMPTS):
+        bits = to_bits(current)
+        wanted = seat_bits(seats or first_free(bits, capacity, count))
+        taken = bits & wanted
+        if taken:
+            numbers = ", ".join(map(str, seat_numbers(to_map(taken, capacity))))
+            raise HttpError(409, f"Seats already taken: {numbers}")
+        if _swap(trip.pk, current, to_map(bits | wanted, capacity)):
+            trip.seat_map = to_map(bits | wanted, capacity)
+            publish_seats(trip.pk, trip.seat_map)
+            return to_map(wanted, capacity)
+        current = _read(trip.pk)
+    raise HttpError(409, "Seats are being booked, try again")
+
+
+def release_seats(trip_id, booking_map) -> None:
+    """Free the seats of a booking's ``booking_map`` on the trip."""
+    released = to_bits(booking_map)
+    if not released:
+        return
+    for _attempt in range(MAX_ATTEMPTS):
+        current = _read(trip_id)
+        new = (to_bits(current) & ~released).to_bytes(len(current), "little")
+        if _swap(trip_id, current, new):
+            publish_seats(trip_id, new)
+            return
+    raise HttpError(409, "Seats are being booked, try again")
+
+
+def fit_seat_maps(trips, capacity: int) -> list:
+    """Resize the seat maps of ``trips`` for a vehicle of ``capacity`` seats.
+
+    The trips' rows must be locked, so no claim lands in between. Raises 409
+    when a trip has a seat booked that the vehicle wouldn't have; returns
+    the trips whose map changed, for the caller to save.
+    """
+    changed = []
+    for trip in trips:
+        current = bytes(trip.seat_map or b"")
+        taken = seat_numbers(current)
+        if taken and taken[-1] > capacity:
+            raise HttpError(
+                409, f"Seat {taken[-1]} is booked on a trip; the vehicle has {capacity}"
+            )
+        fitted = to_map(to_bits(current), capacity)
+        if fitted != current:
+            trip.seat_map = fitted
+            changed.append(trip)
+    return changed
+
+
+def seat_availability(trip_id) -> dict:
+    """The seat map endpoint's payload, read from the trip's map column."""
+    try:
+        seat_map, capacity = Trip.objects.values_list(
+            "seat_map", "vehicle__capacity"
+        ).get(pk=trip_id)
+    except Trip.DoesNotExist:
+        raise HttpError(404, "Trip does not exist")
+    return availability(trip_id, capacity, seat_numbers(bytes(seat_map)))
@@ -1,3 +1,5 @@
+from django.db.models import F
+
 from modules.trips.crud.trips_crud import TripCRUD
 from modules.trips.models import Trip
 from modules.trips.schemas import TripIn
@@ -28,6 +30,9 @@ class TripService:
     def list_my_trips(self, vendor):
         return self.ordered(self.vendor_qs(vendor))
 
+    async def alist_my_trips(self, vendor):
+        return [trip async for trip in self.list_my_trips(vendor)]
+
     def get_trip(self, vendor, trip_id):
         return self.vendor_crud(vendor).get_trip_by_id(trip_id)
 
@@ -44,8 +49,10 @@ class TripService:
         departure_state=None,
         destination_camp=None,
         dt=None,
+        min_rating=None,
+        sort="departure",
     ):
-        qs = Trip.objects.filter(status="scheduled")
+        qs = Trip.objects.filter(status="scheduled", compliance_hold=False)
 
         if departure_state:
             qs = qs.filter(departure_state__icontains=departure_state)
@@ -55,9 +62,37 @@ class TripService:
             qs = qs.filter(destination_camp__icontains=destination_camp)
         if dt:
             qs = qs.filter(departure_date=dt)
+        # The stored rating average (modules/reviews/services.py), joined
+        # only when asked for.
+        if min_rating:
+            qs = qs.filter(vendor__vendor_profile__rating_average__gte=min_rating)
+        if sort == "rating":
+            return qs.order_by(
+                F("vendor__vendor_profile__rating_average").desc(nulls_last=True),
+                *self.ORDERING,
+            )
 
         return self.ordered(qs)
 
+    async def asearch_trips(
+        self,
+        departure_city=None,
+        departure_state=None,
+        destination_camp=None,
+        dt=None,
+        min_rating=None,
+        sort="departure",
+    ):
+        qs = self.search_trips(
+            departure_city=departure_city,
+            departure_state=departure_state,
+            destination_camp=destination_camp,
+            dt=dt,
+            min_rating=min_rating,
+            sort=sort,
+        )
+        return [trip async for trip in qs]
+
     def filter_trips_by_status(self, vendor, status="scheduled"):
         qs = self.vendor_qs(vendor)
         qs = self.apply_status_filter(qs, status)
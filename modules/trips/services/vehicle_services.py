@@ -1,6 +1,10 @@
 from typing import List
 from uuid import UUID
 
+from django.db.models import Exists, OuterRef, prefetch_related_objects
+
+from modules.media.services import prefetch_images
+from modules.trips.crud.trips_crud import overlapping_trips
 from modules.trips.crud.vehicle_crud import VehicleCRUD
 from modules.trips.models import Vehicle
 from modules.trips.schemas import VehicleIn
@@ -12,11 +16,31 @@ class VehicleService:
     def create_vehicle(self, vendor, data: VehicleIn):
         return self.crud.create_vehicle(vendor, data)
 
+    def vendor_qs(self, vendor):
+        return Vehicle.objects.filter(vendor=vendor)
+
     def list_my_vehicles(self, vendor) -> List[Vehicle]:
-        return list(Vehicle.objects.filter(vendor=vendor))
+        return list(
+            self.vendor_qs(vendor)
+            .select_related("vehicle_type")
+            .prefetch_related(prefetch_images())
+        )
+
+    def available_vehicles(self, vendor, day, start, end=None) -> List[Vehicle]:
+        """Active vehicles without an active trip overlapping the window"""
+        busy = overlapping_trips(day, start, end).filter(vehicle=OuterRef("pk"))
+        return list(
+            self.vendor_qs(vendor)
+            .filter(status="active")
+            .exclude(Exists(busy))
+            .select_related("vehicle_type")
+            .prefetch_related(prefetch_images())
+        )
 
     def update_vehicle(self, vendor, vehicle_id: UUID, data: VehicleIn):
-        return self.crud.update_vehicle(vendor, vehicle_id, data)
+        vehicle = self.crud.update_vehicle(vendor, vehicle_id, data)
+        prefetch_related_objects([vehicle], prefetch_images())
+        return vehicle
 
     def delete_vehicle(self, vendor, vehicle_id: UUID):
         return self.crud.delete_vehicle(vendor, vehicle_id)
@@ -0,0 +1,213 @@
+from datetime import date, time, timedelta
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+from ninja.errors import HttpError
+from ninja_jwt.tokens import AccessToken
+
+from modules.notifications.models import Notification
+from modules.trips.models import Trip, Vehicle, VehicleType
+from modules.trips.schemas import TripIn, VehicleIn
+from modules.trips.services.trip_services import TripService
+from modules.trips.services.vehicle_services import VehicleService
+
+TODAY = date(2026, 3, 10)
+
+
+@pytest.fixture
+def vendor(USER):
+    return USER.objects.create_user(
+        "vendor-compliance@example.com", password="pass", role="vendor"
+    )
+
+
+@pytest.fixture
+def make_vehicle(vendor):
+    vt = VehicleType.objects.create(name="Bus")
+
+    def make(plate, insurance=None, roadworthiness=None):
+        return Vehicle.objects.create(
+            vendor=vendor,
+            registration_number=plate,
+            vehicle_type=vt,
+            make_model="Toyota Coaster",
+            capacity=30,
+            is_insured=insurance is not None,
+            insurance_expiry=insurance,
+            roadworthiness_expiry_date=roadworthiness,
+        )
+
+    return make
+
+
+def make_trip(vehicle, day):
+    return Trip.objects.create(
+        vendor=vehicle.vendor,
+        vehicle=vehicle,
+        departure_city="Ajah",
+        departure_state="Lagos",
+        destination_camp="Abuja",
+        departure_date=day,
+        departure_time=time(8, 0),
+        price_per_seat=5000,
+        available_seats=10,
+    )
+
+
+@pytest.mark.django_db
+def test_sweep_deactivates_expired_vehicles_and_holds_their_trips(make_vehicle):
+    uninsured = make_vehicle("EXP-INS", insurance=TODAY - timedelta(days=1))
+    unroadworthy = make_vehicle("EXP-RW", roadworthiness=TODAY - timedelta(days=30))
+    fine = make_vehicle("OK-001", insurance=TODAY, roadworthiness=TODAY)
+    undated = make_vehicle("NO-DATES")
+    upcoming = make_trip(uninsured, TODAY + timedelta(days=2))
+    past = make_trip(uninsured, TODAY - timedelta(days=2))
+    unaffected = make_trip(fine, TODAY + timedelta(days=2))
+
+    out = StringIO()
+    call_command("sweep_vehicle_compliance", date=TODAY, stdout=out)
+    assert "2 vehicle(s) deactivated, 1 trip(s) held, 1 notification(s)" in (
+        out.getvalue()
+    )
+
+    for vehicle, compliant in [
+        (uninsured, False),
+        (unroadworthy, False),
+        (fine, True),
+        (undated, True),
+    ]:
+        vehicle.refresh_from_db()
+        assert vehicle.is_compliant is compliant
+        assert vehicle.status == ("active" if compliant else "inactive")
+    for trip, held in [(upcoming, True), (past, False), (unaffected, False)]:
+        trip.refresh_from_db()
+        assert trip.compliance_hold is held
+
+    (notification,) = Notification.objects.all()
+    assert notification.user == uninsured.vendor
+    assert "EXP-INS, EXP-RW" in notification.body
+
+    search = TripService().search_trips()
+    assert upcoming not in search
+    assert unaffected in search
+
+    # Already swept vehicles are not picked up again.
+    call_command("sweep_vehicle_compliance", date=TODAY, stdout=StringIO())
+    assert Notification.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_trip_creation_checks_compliance(vendor, make_vehicle):
+    departure = date.today() + timedelta(days=10)
+    expiring = make_vehicle("EXP-SOON", insurance=departure - timedelta(days=1))
+    data = TripIn(
+        vehicle_id=expiring.id,
+        departure_city="Ajah",
+        departure_state="Lagos",
+        destination_camp="Abuja",
+        departure_date=departure,
+        departure_time=time(8, 0),
+        price_per_seat=Decimal("5000"),
+        available_seats=10,
+        description="",
+    )
+    with pytest.raises(HttpError) as exc_info:
+        TripService().create_trip(vendor, data)
+    assert exc_info.value.status_code == 400
+
+    data.departure_date = departure - timedelta(days=1)
+    assert TripService().create_trip(vendor, data).vehicle == expiring
+
+
+@pytest.mark.django_db
+def test_trip_updates_check_compliance(vendor, make_vehicle):
+    departure = date.today() + timedelta(days=10)
+    swept = make_vehicle("EXP-PAST", insurance=date.today() - timedelta(days=1))
+    expiring = make_vehicle("EXP-SOON", insurance=departure + timedelta(days=5))
+    fine = make_vehicle("OK-002")
+    trip = make_trip(swept, departure)
+    call_command("sweep_vehicle_compliance", stdout=StringIO())
+
+    def move(vehicle, day):
+        data = TripIn(
+            vehicle_id=vehicle.id,
+            departure_city=trip.departure_city,
+            departure_state=trip.departure_state,
+            destination_camp=trip.destination_camp,
+            departure_date=day,
+            departure_time=trip.departure_time,
+            price_per_seat=trip.price_per_seat,
+            available_seats=trip.available_seats,
+        )
+        return TripService().update_trip(vendor, trip.id, data)
+
+    for vehicle, day in [
+        (swept, departure),
+        (expiring, departure + timedelta(days=6)),
+    ]:
+        with pytest.raises(HttpError) as exc_info:
+            move(vehicle, day)
+        assert exc_info.value.status_code == 400
+
+    # Moved off the swept vehicle, the trip is no longer held.
+    move(expiring, departure + timedelta(days=5))
+    trip.refresh_from_db()
+    assert trip.vehicle == expiring and not trip.compliance_hold
+    move(fine, departure)
+
+
+@pytest.mark.django_db
+def test_renewed_documents_restore_the_vehicle(vendor, make_vehicle):
+    vehicle = make_vehicle("RENEW-1", insurance=date.today() - timedelta(days=1))
+    trip = make_trip(vehicle, date.today() + timedelta(days=3))
+    call_command("sweep_vehicle_compliance", stdout=StringIO())
+
+    VehicleService().update_vehicle(
+        vendor,
+        vehicle.id,
+        VehicleIn(
+            registration_number="RENEW-1",
+            vehicle_type={"name": "Bus"},
+            make_model="Toyota Coaster",
+            capacity=30,
+            is_insured=True,
+            insurance_expiry=date.today() + timedelta(days=365),
+        ),
+    )
+
+    vehicle.refresh_from_db()
+    trip.refresh_from_db()
+    assert vehicle.is_compliant and vehicle.status == "active"
+    assert not trip.compliance_hold
+
+
+@pytest.mark.django_db
+def test_vendors_renew_roadworthiness_through_the_api(vendor, make_vehicle):
+    vehicle = make_vehicle("RENEW-2", roadworthiness=date.today() - timedelta(days=1))
+    trip = make_trip(vehicle, date.today() + timedelta(days=3))
+    call_command("sweep_vehicle_compliance", stdout=StringIO())
+    renewed = date.today() + timedelta(days=365)
+
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(vendor)}")
+    response = client.patch(
+        f"/api/vendor/vehicles/{vehicle.id}",
+        {
+            "registration_number": "RENEW-2",
+            "vehicle_type": {"name": "Bus"},
+            "make_model": "Toyota Coaster",
+            "capacity": 30,
+            "roadworthiness_expiry_date": renewed.isoformat(),
+        },
+        content_type="application/json",
+    )
+
+    assert response.status_code == 200, response.content
+    assert response.json()["roadworthiness_expiry_date"] == renewed.isoformat()
+    vehicle.refresh_from_db()
+    trip.refresh_from_db()
+    assert vehicle.roadworthiness_expiry_date == renewed
+    assert vehicle.is_compliant and vehicle.status == "active"
+    assert not trip.compliance_hold
@@ -0,0 +1,116 @@
+from datetime import date, datetime, time, timedelta, timezone
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from modules.bookings.models import Booking
+from modules.trips.models import Trip, Vehicle, VehicleType
+from modules.trips.services.lifecycle_service import advance_trips
+
+NOW = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+TODAY = NOW.date()
+
+
+@pytest.fixture
+def make_trip(USER):
+    vendor = USER.objects.create_user(
+        "vendor-lifecycle@example.com", password="pass", role="vendor"
+    )
+    vt = VehicleType.objects.create(name="Bus")
+
+    def make(day: date, start: time, end=None, status="scheduled"):
+        vehicle = Vehicle.objects.create(
+            vendor=vendor,
+            registration_number=f"LC-{Vehicle.objects.count()}",
+            vehicle_type=vt,
+            make_model="Toyota Coaster",
+            capacity=30,
+        )
+        return Trip.objects.create(
+            vendor=vendor,
+            vehicle=vehicle,
+            departure_city="Ajah",
+            departure_state="Lagos",
+            destination_camp="Abuja",
+            departure_date=day,
+            departure_time=start,
+            estimated_arrival_time=end,
+            price_per_seat=5000,
+            available_seats=10,
+            status=status,
+        )
+
+    return make
+
+
+def status_of(trip):
+    trip.refresh_from_db()
+    return trip.status
+
+
+@pytest.mark.django_db
+def test_trips_move_by_departure_and_arrival(make_trip):
+    yesterday = TODAY - timedelta(days=1)
+    past = make_trip(yesterday, time(8, 0))
+    arrived = make_trip(TODAY, time(6, 0), time(11, 0))
+    on_the_road = make_trip(TODAY, time(9, 0), time(15, 0))
+    open_ended = make_trip(TODAY, time(10, 0))
+    was_ongoing = make_trip(TODAY, time(7, 0), time(11, 30), status="ongoing")
+    later = make_trip(TODAY, time(18, 0))
+    cancelled = make_trip(yesterday, time(8, 0), status="cancelled")
+    stamp = past.updated_at
+
+    counts = advance_trips(now=NOW, batch_size=2)
+
+    assert status_of(past) == "completed"
+    assert status_of(arrived) == "completed"
+    assert status_of(on_the_road) == "ongoing"
+    assert status_of(open_ended) == "ongoing"
+    assert status_of(was_ongoing) == "completed"
+    assert status_of(later) == "scheduled"
+    assert status_of(cancelled) == "cancelled"
+    assert past.updated_at > stamp
+    assert counts[("trip", "scheduled", "completed")] == 2
+    assert counts[("trip", "ongoing", "completed")] == 1
+    assert counts[("trip", "scheduled", "ongoing")] == 2
+
+    assert set(advance_trips(now=NOW).values()) == {0}
+
+
+@pytest.mark.django_db
+def test_bookings_settle_when_their_trip_completes(make_trip, USER):
+    corper = USER.objects.create_user(
+        "corper-lifecycle@example.com", password="pass", role="corper"
+    )
+    done = make_trip(TODAY - timedelta(days=1), time(8, 0))
+    upcoming = make_trip(TODAY + timedelta(days=1), time(8, 0))
+    bookings = {
+        (trip.pk, status): Booking.objects.create(
+            user=corper, trip=trip, booking_status=status
+        )
+        for trip in (done, upcoming)
+        for status in ("confirmed", "pending", "cancelled")
+    }
+
+    advance_trips(now=NOW)
+
+    def booking_status(trip, status):
+        booking = bookings[(trip.pk, status)]
+        booking.refresh_from_db()
+        return booking.booking_status
+
+    assert booking_status(done, "confirmed") == "completed"
+    assert booking_status(done, "pending") == "no_show"
+    assert booking_status(done, "cancelled") == "cancelled"
+    for status in ("confirmed", "pending", "cancelled"):
+        assert booking_status(upcoming, status) == status
+
+
+@pytest.mark.django_db
+def test_advance_trips_command_reports_transitions(make_trip):
+    make_trip(date.today() - timedelta(days=1), time(8, 0))
+    out = StringIO()
+    call_command("advance_trips", stdout=out)
+    assert "trip:scheduled->completed" in out.getvalue()
+    assert Trip.objects.get().status == "completed"
@@ -0,0 +1,234 @@
+import datetime
+from importlib import import_module
+
+import pytest
+from django.apps import apps
+from django.test import Client
+from ninja.errors import HttpError
+from ninja_jwt.tokens import AccessToken
+from pydantic import ValidationError
+
+from modules.bookings.models import Booking
+from modules.bookings.schemas import BookingIn
+from modules.bookings.services.booking_service import (
+    cancel_booking_service,
+    create_booking_service,
+)
+from modules.trips.models import Trip, Vehicle, VehicleType
+from modules.trips.schemas import TripIn, VehicleIn
+from modules.trips.services.seat_service import (
+    claim_seats,
+    seat_bits,
+    seat_numbers,
+    to_map,
+)
+from modules.trips.services.trip_services import TripService
+from modules.trips.services.vehicle_services import VehicleService
+
+
+@pytest.fixture
+def vendor(USER):
+    return USER.objects.create_user(
+        email="vendor@example.com", password="Password1!", role="vendor"
+    )
+
+
+@pytest.fixture
+def corper(USER):
+    return USER.objects.create_user(
+        email="corper@example.com", password="Password1!", role="corper"
+    )
+
+
+@pytest.fixture
+def trip(vendor):
+    vehicle = Vehicle.objects.create(
+        vendor=vendor,
+        registration_number="SEAT-001",
+        vehicle_type=VehicleType.objects.create(name="Bus"),
+        make_model="Toyota Hiace 2020",
+        capacity=14,
+    )
+    return Trip.objects.create(
+        vendor=vendor,
+        vehicle=vehicle,
+        departure_state="Lagos",
+        departure_city="Ikeja",
+        destination_camp="NYSC Camp Iseyin",
+        departure_date=datetime.date.today() + datetime.timedelta(days=3),
+        departure_time=datetime.time(8, 0),
+        price_per_seat=5000,
+        available_seats=14,
+    )
+
+
+def book(user, trip, **seats):
+    return create_booking_service(user, BookingIn(trip_id=trip.id, **seats))
+
+
+def test_bitmap_layout():
+    seat_map = to_map(seat_bits([1, 9, 14]), 14)
+    assert seat_map == bytes([0b00000001, 0b00100001])
+    assert seat_numbers(seat_map) == [1, 9, 14]
+    assert seat_numbers(b"") == []
+
+
+def test_booking_in_derives_selected_seats_from_seat_numbers():
+    trip_id = Trip().id
+    assert BookingIn(trip_id=trip_id, seat_numbers=[3, 4]).selected_seats == 2
+    with pytest.raises(ValidationError):
+        BookingIn(trip_id=trip_id, selected_seats=1, seat_numbers=[3, 4])
+    with pytest.raises(ValidationError):
+        BookingIn(trip_id=trip_id, seat_numbers=[3, 3])
+
+
+@pytest.mark.django_db
+def test_bookings_claim_and_release_seats(corper, trip):
+    chosen = book(corper, trip, seat_numbers=[2, 3])
+    assigned = book(corper, trip, selected_seats=2)
+
+    assert chosen.seat_numbers == [2, 3]
+    assert assigned.seat_numbers == [1, 4]
+    trip.refresh_from_db()
+    assert seat_numbers(trip.seat_map) == [1, 2, 3, 4]
+    assert len(trip.seat_map) == 2
+
+    with pytest.raises(HttpError) as exc_info:
+        book(corper, trip, seat_numbers=[4, 5])
+    assert exc_info.value.status_code == 409
+    assert "Seats already taken: 4" in str(exc_info.value)
+
+    with pytest.raises(HttpError) as exc_info:
+        book(corper, trip, seat_numbers=[15])
+    assert exc_info.value.status_code == 400
+
+    cancel_booking_service(corper, chosen.id)
+    trip.refresh_from_db()
+    assert seat_numbers(trip.seat_map) == [1, 4]
+    assert book(corper, trip, selected_seats=3).seat_numbers == [2, 3, 5]
+
+
+@pytest.mark.django_db
+def test_claim_retries_on_a_map_changed_since_it_was_read(corper, trip):
+    stale = Trip.objects.select_related("vehicle").get(pk=trip.pk)
+    book(corper, trip, seat_numbers=[1])
+
+    assert seat_numbers(claim_seats(stale, count=2)) == [2, 3]
+    with pytest.raises(HttpError) as exc_info:
+        claim_seats(stale, seats=[3])
+    assert exc_info.value.status_code == 409
+    trip.refresh_from_db()
+    assert seat_numbers(trip.seat_map) == [1, 2, 3]
+
+
+def move_trip(vendor, trip, vehicle):
+    data = TripIn(
+        vehicle_id=vehicle.id,
+        departure_city=trip.departure_city,
+        departure_state=trip.departure_state,
+        destination_camp=trip.destination_camp,
+        departure_date=trip.departure_date,
+        departure_time=trip.departure_time,
+        price_per_seat=trip.price_per_seat,
+        available_seats=trip.available_seats,
+    )
+    return TripService().update_trip(vendor, trip.id, data)
+
+
+def resize(vendor, vehicle, capacity):
+    data = VehicleIn(
+        registration_number=vehicle.registration_number,
+        vehicle_type={"name": "Bus"},
+        make_model=vehicle.make_model,
+        capacity=capacity,
+    )
+    return VehicleService().update_vehicle(vendor, vehicle.id, data)
+
+
+@pytest.mark.django_db
+def test_seat_maps_follow_the_vehicle_capacity(vendor, corper, trip):
+    small = Vehicle.objects.create(
+        vendor=vendor,
+        registration_number="SEAT-002",
+        vehicle_type=trip.vehicle.vehicle_type,
+        make_model="Toyota Sienna",
+        capacity=7,
+    )
+    booking = book(corper, trip, seat_numbers=[3, 12])
+
+    # Seat 12 is booked, so the trip can't shrink below it either way.
+    for change in (
+        lambda: move_trip(vendor, trip, small),
+        lambda: resize(vendor, trip.vehicle, 10),
+    ):
+        with pytest.raises(HttpError) as exc_info:
+            change()
+        assert exc_info.value.status_code == 409
+    trip.refresh_from_db()
+    assert trip.vehicle_id != small.id and len(trip.seat_map) == 2
+
+    cancel_booking_service(corper, booking.id)
+    book(corper, trip, seat_numbers=[3])
+    move_trip(vendor, trip, small)
+    trip.refresh_from_db()
+    assert seat_numbers(trip.seat_map) == [3] and len(trip.seat_map) == 1
+    assert book(corper, trip, selected_seats=4).seat_numbers == [1, 2, 4, 5]
+
+    resize(vendor, small, 20)
+    trip.refresh_from_db()
+    assert seat_numbers(trip.seat_map) == [1, 2, 3, 4, 5]
+    assert len(trip.seat_map) == 3
+    assert book(corper, trip, seat_numbers=[20]).seat_numbers == [20]
+
+
+@pytest.mark.django_db
+def test_seat_map_endpoint_reads_one_column(corper, trip):
+    book(corper, trip, seat_numbers=[5, 6])
+
+    resp = Client().get(f"/api/vendor/trips/{trip.id}/seats")
+
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "trip_id": str(trip.id),
+        "capacity": 14,
+        "available": 12,
+        "taken": [5, 6],
+    }
+
+
+@pytest.mark.django_db
+def test_booking_endpoints_stay_within_budget(corper, trip):
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(corper)}")
+
+    resp = client.post(
+        "/api/bookings/",
+        {"trip_id": str(trip.id), "seat_numbers": [7, 8]},
+        content_type="application/json",
+    )
+    assert resp.status_code == 200
+    assert resp.json()["seat_numbers"] == [7, 8]
+
+    resp = client.patch(f"/api/bookings/{resp.json()['id']}/cancel")
+    assert resp.status_code == 200
+    assert Client().get(f"/api/vendor/trips/{trip.id}/seats").json()["taken"] == []
+
+
+@pytest.mark.django_db
+def test_backfill_assigns_seats_to_active_bookings(corper, trip):
+    backfill = import_module(
+        "modules.bookings.migrations.0007_backfill_seat_maps"
+    ).backfill_seat_maps
+    first = Booking.objects.create(user=corper, trip=trip, selected_seats=2)
+    Booking.objects.create(
+        user=corper, trip=trip, selected_seats=5, booking_status="cancelled"
+    )
+    second = Booking.objects.create(user=corper, trip=trip, selected_seats=13)
+
+    backfill(apps, None)
+
+    first.refresh_from_db()
+    second.refresh_from_db()
+    trip.refresh_from_db()
+    assert first.seat_numbers == [1, 2]
+    assert second.seat_numbers == list(range(3, 15))
+    assert seat_numbers(trip.seat_map) == list(range(1, 15))
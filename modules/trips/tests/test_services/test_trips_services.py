@@ -1,7 +1,11 @@
-from datetime import date, time
+import logging
+import uuid
+from datetime import date, time, timedelta
 from decimal import Decimal
 
 import pytest
+from asgiref.sync import async_to_sync
+from ninja.errors import HttpError
 
 from modules.trips.models import Trip, Vehicle, VehicleType
 from modules.trips.schemas import TripIn
@@ -52,6 +56,23 @@ def test_create_get_delete_trip(USER):
         Trip.objects.get(id=trip.id)
 
 
+@pytest.mark.django_db
+def test_missing_trip_is_404_without_traceback(USER, caplog):
+    vendor = USER.objects.create_user(
+        "vendor404@example.com", password="pass", role="vendor"
+    )
+    svc = TripService()
+
+    with caplog.at_level(logging.INFO, logger="modules.trips.crud.trips_crud"):
+        for call in (svc.get_trip, svc.delete_trip):
+            with pytest.raises(HttpError) as exc_info:
+                call(vendor, uuid.uuid4())
+            assert exc_info.value.status_code == 404
+
+    assert caplog.records
+    assert all(r.levelno == logging.INFO and not r.exc_info for r in caplog.records)
+
+
 @pytest.mark.django_db
 def test_update_trip_signature_issue_exposed(USER):
     """The service currently passes args in the wrong order to CRUD.update_trip; expect a failure."""
@@ -101,6 +122,94 @@ def test_update_trip_signature_issue_exposed(USER):
     assert updated.departure_city == "NewOrigin"
 
 
+def trip_in(vehicle, start, end=None, **fields):
+    return TripIn(
+        vehicle_id=vehicle.id,
+        departure_city="Iyana-Ipaja",
+        departure_state="Lagos",
+        destination_camp="NYSC Camp",
+        departure_date=fields.pop("departure_date", date.today()),
+        departure_time=start,
+        estimated_arrival_time=end,
+        price_per_seat=Decimal("1500.00"),
+        available_seats=10,
+        description="Test trip",
+        **fields,
+    )
+
+
+@pytest.mark.django_db
+def test_overlapping_trips_for_a_vehicle_are_rejected(USER):
+    vendor = USER.objects.create_user(
+        "vendor-overlap@example.com", password="pass", role="vendor"
+    )
+    vehicle = Vehicle.objects.create(
+        vendor=vendor,
+        registration_number="OVR-001",
+        vehicle_type=VehicleType.objects.create(name="Bus"),
+        make_model="Toyota Coaster",
+        capacity=30,
+    )
+    svc = TripService()
+    morning = svc.create_trip(vendor, trip_in(vehicle, time(8, 0), time(12, 0)))
+
+    for start, end in [(time(11, 0), time(14, 0)), (time(6, 0), None)]:
+        with pytest.raises(HttpError) as exc_info:
+            svc.create_trip(vendor, trip_in(vehicle, start, end))
+        assert exc_info.value.status_code == 409
+
+    # Back-to-back trips and other days are fine.
+    svc.create_trip(vendor, trip_in(vehicle, time(12, 0), time(15, 0)))
+    svc.create_trip(
+        vendor,
+        trip_in(
+            vehicle,
+            time(9, 0),
+            departure_date=date.today() + timedelta(days=1),
+        ),
+    )
+    # A trip with no arrival time holds the vehicle for the rest of the day.
+    svc.create_trip(vendor, trip_in(vehicle, time(16, 0)))
+    with pytest.raises(HttpError):
+        svc.create_trip(vendor, trip_in(vehicle, time(22, 0), time(23, 0)))
+
+    # Moving a trip onto another one is rejected; cancelled trips don't count.
+    with pytest.raises(HttpError) as exc_info:
+        svc.update_trip(vendor, morning.id, trip_in(vehicle, time(13, 0)))
+    assert exc_info.value.status_code == 409
+    Trip.objects.filter(departure_time=time(12, 0)).update(status="cancelled")
+    assert svc.update_trip(
+        vendor, morning.id, trip_in(vehicle, time(9, 0), time(13, 0))
+    ).estimated_arrival_time == time(13, 0)
+
+
+@pytest.mark.django_db
+def test_trip_cannot_move_to_another_vendors_vehicle(USER):
+    vendor = USER.objects.create_user(
+        "vendor-own@example.com", password="pass", role="vendor"
+    )
+    other = USER.objects.create_user(
+        "vendor-other@example.com", password="pass", role="vendor"
+    )
+    vt = VehicleType.objects.create(name="Bus")
+    vehicle, foreign = [
+        Vehicle.objects.create(
+            vendor=owner,
+            registration_number=plate,
+            vehicle_type=vt,
+            make_model="Toyota Coaster",
+            capacity=30,
+        )
+        for owner, plate in [(vendor, "OWN-001"), (other, "OTH-001")]
+    ]
+    svc = TripService()
+    trip = svc.create_trip(vendor, trip_in(vehicle, time(8, 0), time(12, 0)))
+
+    with pytest.raises(HttpError) as exc_info:
+        svc.update_trip(vendor, trip.id, trip_in(foreign, time(8, 0), time(12, 0)))
+    assert exc_info.value.status_code == 404
+
+
 @pytest.mark.django_db
 def test_vendor_qs_ordering_and_filters(USER):
     vendor1 = USER.objects.create_user("v1@example.com", password="pass", role="vendor")
@@ -190,3 +299,36 @@ def test_vendor_qs_ordering_and_filters(USER):
     # filter_trips_by_status default 'scheduled' for vendor1 -> only t1
     f = svc.filter_trips_by_status(vendor1)
     assert list(f) == [t1]
+
+
+@pytest.mark.django_db
+def test_async_search_and_list_match_sync(USER):
+    vendor = USER.objects.create_user("v3@example.com", password="pass", role="vendor")
+    vehicle = Vehicle.objects.create(
+        vendor=vendor,
+        registration_number="CC-333",
+        vehicle_type=VehicleType.objects.create(name="Bus"),
+        make_model="M3",
+        capacity=10,
+    )
+    for hour, city in ((9, "Ikeja"), (7, "Ikeja"), (8, "Yaba")):
+        Trip.objects.create(
+            vendor=vendor,
+            vehicle=vehicle,
+            departure_city=city,
+            departure_state="Lagos",
+            destination_camp="Camp",
+            departure_date=date.today(),
+            departure_time=time(hour, 0),
+            price_per_seat=Decimal("1000.00"),
+            available_seats=5,
+        )
+
+    svc = TripService()
+
+    searched = async_to_sync(svc.asearch_trips)(departure_city="Ikeja")
+    assert searched == list(svc.search_trips(departure_city="Ikeja"))
+    assert [t.departure_time for t in searched] == [time(7, 0), time(9, 0)]
+
+    mine = async_to_sync(svc.alist_my_trips)(vendor)
+    assert mine == list(svc.list_my_trips(vendor))
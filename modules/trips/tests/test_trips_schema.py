@@ -116,7 +116,7 @@ def test_trip_out_valid():
     now = datetime.now()
 
     data = TripOut(
-        id=1,
+        id=trip_id,
         trip_id=trip_id,
         vehicle_id=vehicle_id,
         departure_city="Ajah",
@@ -1,9 +1,10 @@
-from datetime import date, timedelta
+from datetime import date, time, timedelta
 
 import pytest
-from django.test import override_settings
+from django.test import Client, override_settings
+from ninja_jwt.tokens import AccessToken
 
-from modules.trips.models import Vehicle, VehicleType
+from modules.trips.models import Trip, Vehicle, VehicleType
 from modules.trips.schemas import VehicleIn
 from modules.trips.views.vehicles_views import (
     create_vehicle,
@@ -140,3 +141,76 @@ def test_update_and_delete_vehicle_view(USER):
 
     with pytest.raises(V.DoesNotExist):
         V.objects.get(id=created.id)
+
+
+@pytest.mark.django_db
+def test_available_vehicles_excludes_vehicles_on_overlapping_trips(USER):
+    vendor = USER.objects.create_user(
+        email="vendor@example.com",
+        password="Password1!",
+        is_active=True,
+        role="vendor",
+        full_name="Test Vendor",
+    )
+    vt = VehicleType.objects.create(name="bus")
+    vehicles = {
+        plate: Vehicle.objects.create(
+            vendor=vendor,
+            registration_number=plate,
+            vehicle_type=vt,
+            make_model="Toyota Hiace",
+            capacity=14,
+            status=status,
+        )
+        for plate, status in [
+            ("BUSY01", "active"),
+            ("FREE01", "active"),
+            ("FREE02", "active"),
+            ("REPAIR1", "maintenance"),
+        ]
+    }
+    day = date.today() + timedelta(days=3)
+    for plate, start, end, status in [
+        ("BUSY01", time(8, 0), time(12, 0), "scheduled"),
+        ("FREE01", time(12, 0), time(14, 0), "scheduled"),
+        ("FREE02", time(9, 0), time(11, 0), "cancelled"),
+    ]:
+        Trip.objects.create(
+            vendor=vendor,
+            vehicle=vehicles[plate],
+            departure_city="Ajah",
+            departure_state="Lagos",
+            destination_camp="Abuja",
+            departure_date=day,
+            departure_time=start,
+            estimated_arrival_time=end,
+            price_per_seat=5000,
+            available_seats=10,
+            status=status,
+        )
+
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(vendor)}")
+    resp = client.get(
+        "/api/vendor/vehicles/available",
+        {"date": day.isoformat(), "start": "10:00", "end": "12:00"},
+    )
+    assert resp.status_code == 200
+    assert sorted(v["registration_number"] for v in resp.json()) == [
+        "FREE01",
+        "FREE02",
+    ]
+
+    resp = client.get(
+        "/api/vendor/vehicles/available",
+        {"date": day.isoformat(), "start": "13:00"},
+    )
+    assert sorted(v["registration_number"] for v in resp.json()) == [
+        "BUSY01",
+        "FREE02",
+    ]
+
+    resp = client.get(
+        "/api/vendor/vehicles/available",
+        {"date": day.isoformat(), "start": "12:00", "end": "10:00"},
+    )
+    assert resp.status_code == 400
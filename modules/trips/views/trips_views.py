@@ -1,11 +1,23 @@
 from datetime import date
-from typing import Optional
+from typing import Annotated, Literal, Optional
 from uuid import UUID
 
+from django.conf import settings
 from ninja import Router
 from ninja_jwt.authentication import JWTAuth
-
-from ..schemas import TripIn, TripOut
+from pydantic import Field
+
+from engine.async_views import async_variant
+from engine.db_router import replica_reads
+from engine.http_cache import (
+    conditional_get,
+    private_revalidate,
+    queryset_validators,
+)
+from engine.query_budget import query_budget
+
+from ..schemas import SeatMapOut, TripIn, TripOut
+from ..services.seat_service import seat_availability
 from ..services.trip_services import TripService
 
 trip_service = TripService()
@@ -13,6 +25,45 @@ trip_service = TripService()
 router = Router(tags=["Trips"], auth=JWTAuth())
 
 
+def trip_validators(request, trip_id):
+    qs = trip_service.vendor_qs(request.user).filter(pk=trip_id)
+    return queryset_validators(qs, single=True)
+
+
+def search_validators(
+    request,
+    departure_city=None,
+    departure_state=None,
+    destination_camp=None,
+    date=None,
+    min_rating=None,
+    sort="departure",
+):
+    latest = ("updated_at",)
+    if min_rating or sort == "rating":
+        # A new review moves the vendor's rating and its updated_at.
+        latest += ("vendor__vendor_profile__updated_at",)
+    return queryset_validators(
+        trip_service.search_trips(
+            departure_city=departure_city,
+            departure_state=departure_state,
+            destination_camp=destination_camp,
+            dt=date,
+            min_rating=min_rating,
+            sort=sort,
+        ),
+        latest=latest,
+    )
+
+
+def search_cache_control():
+    return {
+        "public": True,
+        "max_age": settings.SEARCH_CACHE_MAX_AGE,
+        "s_maxage": settings.SEARCH_CACHE_S_MAXAGE,
+    }
+
+
 @router.post("/", response=TripOut)
 def create_trip(request, payload: TripIn):
     """
@@ -21,7 +72,16 @@ def create_trip(request, payload: TripIn):
     return trip_service.create_trip(request.user, payload)
 
 
+@query_budget(2)
+@replica_reads
+async def alist_my_trips(request):
+    return await trip_service.alist_my_trips(request.user)
+
+
 @router.get("/", response=list[TripOut])
+@async_variant(alist_my_trips)
+@query_budget(2)
+@replica_reads
 def list_my_trips(request):
     """
     List all trips created by the authenticated vendor
@@ -29,15 +89,29 @@ def list_my_trips(request):
     return trip_service.list_my_trips(request.user)
 
 
-@router.get("/{trip_id}", response=TripOut)
+@router.get("/{uuid:trip_id}", response=TripOut)
+@query_budget(3)
+@conditional_get(trip_validators, private_revalidate)
 def get_trip(request, trip_id: UUID):
     return trip_service.get_trip(request.user, trip_id)
 
 
-@router.patch("/{trip_id}", response=TripOut)
+@router.get("/{uuid:trip_id}/seats", response=SeatMapOut, auth=None)
+@query_budget(1)
+@replica_reads
+def get_seat_map(request, trip_id: UUID):
+    """Taken and free seats of a trip, read from its seat bitmap"""
+    return seat_availability(trip_id)
+
+
+@router.patch("/{uuid:trip_id}", response=TripOut)
 def update_trip(request, trip_id: UUID, payload: TripIn):
     """Update an existing trip for the authenticated vendor.
 
+    Setting ``status`` to ``"cancelled"`` cancels a scheduled trip and its
+    bookings. Booked corpers are notified of a cancellation or a new
+    departure date or time by ``manage.py send_notifications``.
+
     Args:
         request: The HTTP request (contains the authenticated user as request.user).
         trip_id (UUID): ID of the trip to update.
@@ -49,7 +123,7 @@ def update_trip(request, trip_id: UUID, payload: TripIn):
     return trip_service.update_trip(vendor=request.user, trip_id=trip_id, data=payload)
 
 
-@router.delete("/{trip_id}")
+@router.delete("/{uuid:trip_id}")
 def delete_trip(request, trip_id: UUID):
     """Delete a trip belonging to the authenticated vendor.
 
@@ -67,14 +141,42 @@ def delete_trip(request, trip_id: UUID):
     return trip_service.delete_trip(vendor=request.user, trip_id=trip_id)
 
 
+@query_budget(2)
+@replica_reads
+@conditional_get(search_validators, search_cache_control)
+async def asearch_trips(
+    request,
+    departure_city: Optional[str] = None,
+    departure_state: Optional[str] = None,
+    destination_camp: Optional[str] = None,
+    date: Optional[date] = None,
+    min_rating: Annotated[Optional[float], Field(ge=0, le=5)] = None,
+    sort: Literal["departure", "rating"] = "departure",
+):
+    return await trip_service.asearch_trips(
+        departure_city=departure_city,
+        departure_state=departure_state,
+        destination_camp=destination_camp,
+        dt=date,
+        min_rating=min_rating,
+        sort=sort,
+    )
+
+
 # Optional: Public search (no authentication)
 @router.get("/search", response=list[TripOut], auth=None)
+@async_variant(asearch_trips)
+@query_budget(2)
+@replica_reads
+@conditional_get(search_validators, search_cache_control)
 def search_trips(
     request,
     departure_city: Optional[str] = None,
     departure_state: Optional[str] = None,
     destination_camp: Optional[str] = None,
     date: Optional[date] = None,
+    min_rating: Annotated[Optional[float], Field(ge=0, le=5)] = None,
+    sort: Literal["departure", "rating"] = "departure",
 ):
     """Public trip search"""
     return trip_service.search_trips(
@@ -82,10 +184,14 @@ def search_trips(
         departure_state=departure_state,
         destination_camp=destination_camp,
         dt=date,
+        min_rating=min_rating,
+        sort=sort,
     )
 
 
 @router.get("/status", response=list[TripOut])
+@query_budget(2)
+@replica_reads
 def search_trips_by_status(request, status: str):
     """
     Filter trips by status for the authenticated vendor
@@ -1,9 +1,24 @@
-from typing import List
+from datetime import date, time
+from typing import List, Optional
 from uuid import UUID
 
-from ninja import Router
+from ninja import File, Router
+from ninja.errors import HttpError
+from ninja.files import UploadedFile
 from ninja_jwt.authentication import JWTAuth
 
+from engine.db_router import replica_reads
+from engine.http_cache import (
+    conditional_get,
+    private_revalidate,
+    queryset_validators,
+)
+from engine.query_budget import query_budget
+from modules.authenticator.permissions import vendor_required
+from modules.media.schemas import VehicleImageOut
+from modules.media.services import add_vehicle_image, remove_vehicle_image
+from modules.media.uploads import upload_digest
+
 from ..schemas import VehicleIn, VehicleOut
 from ..services.vehicle_services import VehicleService
 
@@ -12,16 +27,34 @@ router = Router(tags=["Vehicles"], auth=JWTAuth())
 vehicle_service = VehicleService()
 
 
+def vehicles_validators(request):
+    return queryset_validators(vehicle_service.vendor_qs(request.user))
+
+
 @router.post("/", response=VehicleOut)
 def create_vehicle(request, payload: VehicleIn):
     return vehicle_service.create_vehicle(request.user, payload)
 
 
 @router.get("/", response=List[VehicleOut])
+@query_budget(4)
+@replica_reads
+@conditional_get(vehicles_validators, private_revalidate)
 def list_my_vehicles(request):
     return vehicle_service.list_my_vehicles(request.user)
 
 
+# Declared before the /{vehicle_id} routes, which would otherwise match it.
+@router.get("/available", response=List[VehicleOut])
+@query_budget(3)
+def available_vehicles(request, date: date, start: time, end: Optional[time] = None):
+    """Active vehicles with no scheduled or ongoing trip overlapping the
+    window on ``date``; ``end`` defaults to the end of the day."""
+    if end is not None and end <= start:
+        raise HttpError(400, "end must be after start")
+    return vehicle_service.available_vehicles(request.user, date, start, end)
+
+
 @router.patch("/{vehicle_id}", response=VehicleOut)
 def update_vehicle(request, vehicle_id: UUID, payload: VehicleIn):
     return vehicle_service.update_vehicle(request.user, vehicle_id, payload)
@@ -30,3 +63,20 @@ def update_vehicle(request, vehicle_id: UUID, payload: VehicleIn):
 @router.delete("/{vehicle_id}")
 def delete_vehicle(request, vehicle_id: UUID):
     return vehicle_service.delete_vehicle(request.user, vehicle_id)
+
+
+@router.post("/{vehicle_id}/images", response=VehicleImageOut)
+@query_budget(8)
+@vendor_required
+def upload_vehicle_image(request, vehicle_id: UUID, file: UploadedFile = File(...)):
+    """Add a JPEG, PNG or WebP photo of the vehicle. Listings show its
+    thumbnail and medium sizes once the media worker has made them."""
+    return add_vehicle_image(
+        request.user, vehicle_id, file, upload_digest(request, "file")
+    )
+
+
+@router.delete("/{vehicle_id}/images/{image_id}")
+@vendor_required
+def delete_vehicle_image(request, vehicle_id: UUID, image_id: int):
+    return remove_vehicle_image(request.user, vehicle_id, image_id)